@@ -0,0 +1,6 @@
+"""Application benchmarks.
+
+Run all benchmarks from the project root::
+
+    make bench
+"""
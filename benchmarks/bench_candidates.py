@@ -0,0 +1,147 @@
+"""Selection time of the exercise candidates among 100k items.
+
+Compares the pass over the entries (before) with the intersection of
+the bitsets of :class:`~wse.contrib.candidates.CandidateIndex` (after)
+for the filter combinations of the exercise params form. Run from the
+project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_candidates
+"""
+
+import datetime
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from wse.contrib.candidates import (
+    PERIOD_DAYS,
+    PROGRESS_ASSESSMENTS,
+    CandidateIndex,
+)
+
+ITEMS = 100_000
+"""Count of the dictionary items (`int`).
+"""
+RUNS = 20
+"""Number of the selections to measure (`int`).
+"""
+TODAY = datetime.date(2024, 6, 1)
+
+COMBINATIONS = {
+    'no filter': {},
+    'period': {'period_start_date': 'M3', 'period_end_date': 'W1'},
+    'category': {'category': 3},
+    'progress': {'progress': 'R'},
+    'period, category, progress': {
+        'period_start_date': 'M6',
+        'period_end_date': 'DT',
+        'category': 3,
+        'progress': 'S',
+    },
+    'all, first 50': {
+        'period_start_date': 'M6',
+        'category': 3,
+        'progress': 'S',
+        'count_first': 50,
+    },
+    'all, last 50': {
+        'period_start_date': 'M6',
+        'category': 3,
+        'progress': 'S',
+        'count_last': 50,
+    },
+}
+
+
+def make_entries() -> list[dict]:
+    """Make the dictionary items."""
+    rng = random.Random(1)
+    return [
+        {
+            'id': i,
+            'category': rng.randint(1, 20),
+            'assessment': rng.randint(-3, 12),
+            'created_at': (
+                TODAY - datetime.timedelta(days=rng.randint(0, 1000))
+            ).isoformat(),
+        }
+        for i in range(1, ITEMS + 1)
+    ]
+
+
+def linear_lookup(entries: list[dict], params: dict) -> list[dict]:
+    """Filter the entries with a pass over them (before)."""
+    start = PERIOD_DAYS.get(params.get('period_start_date'))
+    end = PERIOD_DAYS.get(params.get('period_end_date'))
+    start = start is not None and TODAY - datetime.timedelta(days=start)
+    end = end is not None and TODAY - datetime.timedelta(days=end)
+    category = params.get('category')
+    stage = PROGRESS_ASSESSMENTS.get(params.get('progress'))
+
+    found = []
+    for entry in entries:
+        date = datetime.date.fromisoformat(entry['created_at'][:10])
+        if start and date < start or end and date > end:
+            continue
+        if category is not None and entry['category'] != category:
+            continue
+        if stage and not stage[0] <= entry['assessment'] <= stage[1]:
+            continue
+        found.append(entry)
+
+    count_first = params.get('count_first') or 0
+    count_last = params.get('count_last') or 0
+    if count_first or count_last:
+        found.sort(key=lambda e: (e['created_at'], e['id']))
+        found = found[:count_first] if count_first else found[-count_last:]
+    return found
+
+
+def bench(select: Callable[[], object], runs: int = RUNS) -> list[float]:
+    """Measure the selection."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        select()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(title: str, times: list[float]) -> None:
+    """Print the selection statistics."""
+    print(
+        f'{title:<36}'
+        f'median {statistics.median(times) * 1e6:11.1f} us  '
+        f'min {min(times) * 1e6:11.1f} us'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    entries = make_entries()
+    start = time.perf_counter()
+    index = CandidateIndex(entries)
+    build = time.perf_counter() - start
+    print(f'{ITEMS} items, index built in {build * 1000:.1f} ms')
+
+    for title, params in COMBINATIONS.items():
+        found = index.select(params, TODAY)
+        assert found.bit_count() == len(linear_lookup(entries, params))
+        print(f'{title} ({found.bit_count()} found)')
+        report(
+            '  pass over entries',
+            bench(lambda p=params: linear_lookup(entries, p), runs=3),
+        )
+        report(
+            '  index select()',
+            bench(lambda p=params: index.select(p, TODAY)),
+        )
+        report(
+            '  index select() and pick()',
+            bench(lambda p=params: index.pick(index.select(p, TODAY), 0)),
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Per-request latency of a fresh http client versus the pooled client.
+
+Run from the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_http_client
+"""
+
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from benchmarks.stub_server import StubServer
+from wse.contrib.http_requests import (
+    ClientPool,
+    client_pool,
+    request_get,
+    request_get_async,
+)
+
+REQUESTS = 300
+"""Number of requests to measure (`int`).
+"""
+
+
+def report(title: str, latencies: list[float]) -> None:
+    """Print the latency statistics, in milliseconds."""
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f'{title:<28}'
+        f'mean {statistics.mean(latencies) * 1000:7.3f} ms  '
+        f'median {statistics.median(latencies) * 1000:7.3f} ms  '
+        f'p95 {p95 * 1000:7.3f} ms'
+    )
+
+
+def bench_fresh_client(url: str) -> list[float]:
+    """Measure the request with a new client per request (before)."""
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        with httpx.Client() as client:
+            client.get(url)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def bench_pooled_client(url: str) -> list[float]:
+    """Measure the request with the pooled client (after)."""
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        request_get(url)
+        latencies.append(time.perf_counter() - start)
+    client_pool.close()
+    return latencies
+
+
+async def bench_fresh_async_client(url: str) -> list[float]:
+    """Measure the request with a new async client per request."""
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            await client.get(url)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def bench_pooled_async_client(url: str) -> list[float]:
+    """Measure the request with the pooled async client."""
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        await request_get_async(url)
+        latencies.append(time.perf_counter() - start)
+    await client_pool.aclose()
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(payload={'results': []}) as server:
+        print(f'{REQUESTS} GET requests to {server.url}')
+        print(f'HTTP/2 enabled: {ClientPool().http2}')
+        report('sync, client per request', bench_fresh_client(server.url))
+        report('sync, pooled client', bench_pooled_client(server.url))
+        report(
+            'async, client per request',
+            asyncio.run(bench_fresh_async_client(server.url)),
+        )
+        report(
+            'async, pooled client',
+            asyncio.run(bench_pooled_async_client(server.url)),
+        )
+
+
+if __name__ == '__main__':
+    main()
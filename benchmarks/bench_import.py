@@ -0,0 +1,90 @@
+"""Import time of the app package, fails if the budget is exceeded.
+
+Measures the import of ``wse.app`` with ``python -X importtime`` in a
+fresh interpreter, after ``toga`` is imported, so only the import
+time of the app modules is counted. Checks that the modules not
+needed by the main page are not imported until the main window is
+shown.
+
+Run from the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_import
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+"""Number of the interpreter runs (`int`).
+"""
+IMPORT_BUDGET_MS = 50.0
+"""Maximum median import time of the app modules, in ms (`float`).
+"""
+DEFERRED_MODULES = (
+    'httpx',
+    'wse.contrib.http_requests',
+    'wse.page.foreign',
+    'wse.page.glossary',
+)
+"""Modules that are not imported to show the main window (`tuple`).
+"""
+
+IMPORT_CODE = 'import toga; import wse.app'
+"""The code to measure the import time of app modules (`str`).
+"""
+STARTUP_CODE = """
+import sys
+import wse.app
+app = wse.app.WSE(formal_name='Bench App', app_id='org.wse.bench')
+print(' '.join(sys.modules))
+"""
+"""The code to create the app and print the imported modules (`str`).
+"""
+
+
+def run(*args: str) -> subprocess.CompletedProcess:
+    """Run the code by fresh interpreter with dummy toga backend."""
+    env = {**os.environ, 'TOGA_BACKEND': 'toga_dummy'}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def measure_import() -> float:
+    """Measure the cumulative import time of ``wse.app``, in ms."""
+    stderr = run('-X', 'importtime', '-c', IMPORT_CODE).stderr
+    match = re.search(r'\|\s*(\d+)\s*\|\s*wse\.app$', stderr, re.MULTILINE)
+    return int(match.group(1)) / 1000
+
+
+def main() -> None:
+    """Run the benchmark, exit with error if the budget is exceeded."""
+    times = [measure_import() for _ in range(RUNS)]
+    median = statistics.median(times)
+    print(
+        f'import wse.app: median {median:6.2f} ms  '
+        f'min {min(times):6.2f} ms  budget {IMPORT_BUDGET_MS:.0f} ms'
+    )
+
+    modules = set(run('-c', STARTUP_CODE).stdout.split())
+    imported = [name for name in DEFERRED_MODULES if name in modules]
+    print(f'modules imported to show the main window: {len(modules)}')
+
+    errors = []
+    if median > IMPORT_BUDGET_MS:
+        errors.append(f'import time {median:.2f} ms exceeds the budget')
+    if imported:
+        errors.append(f'deferred modules are imported: {imported}')
+    if errors:
+        sys.exit('\n'.join(errors))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""Event loop stall on page navigation with the slow server.
+
+The server responses are delayed, the page navigation must not wait
+the response on the event loop, so the stall must be much less than
+the response delay. Uses the toga dummy backend. Run from the project
+root::
+
+    PYTHONPATH=src python -m benchmarks.bench_navigation
+"""
+
+import asyncio
+import gc
+import os
+import tempfile
+
+os.environ.setdefault('TOGA_BACKEND', 'toga_dummy')
+
+import httpx  # noqa: E402
+import toga  # noqa: E402
+
+from wse.app import WSE  # noqa: E402
+from wse.constants import (  # noqa: E402
+    FOREIGN_CREATE_BOX,
+    FOREIGN_LIST_BOX,
+    FOREIGN_MAIN_BOX,
+    FOREIGN_PARAMS_BOX,
+    GLOSSARY_CREATE_BOX,
+    GLOSSARY_LIST_BOX,
+    GLOSSARY_MAIN_BOX,
+    GLOSSARY_PARAMS_BOX,
+    LOGIN_BOX,
+    MAIN_BOX,
+)
+from wse.contrib.mirror import dictionary_mirror  # noqa: E402
+
+BOX_NAMES = (
+    MAIN_BOX,
+    LOGIN_BOX,
+    FOREIGN_MAIN_BOX,
+    FOREIGN_PARAMS_BOX,
+    FOREIGN_LIST_BOX,
+    FOREIGN_CREATE_BOX,
+    GLOSSARY_MAIN_BOX,
+    GLOSSARY_PARAMS_BOX,
+    GLOSSARY_LIST_BOX,
+    GLOSSARY_CREATE_BOX,
+)
+"""Names of the page boxes to navigate to (`tuple[str, ...]`).
+"""
+RESPONSE_DELAY = 0.2
+"""Delay of the server response, in seconds (`float`).
+"""
+
+
+class StallMeter:
+    """Meter of the event loop stall.
+
+    Schedules the heartbeat callback by interval, the stall is the
+    delay of callback call over the expected time.
+
+    Usage::
+
+        async with StallMeter() as meter:
+            ...
+        print(meter.max_stall)
+
+    :param float interval: The heartbeat interval, in seconds.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Construct the meter."""
+        self.interval = interval
+        self.max_stall = 0.0
+        self.beat_count = 0
+        self._loop = None
+        self._handle = None
+        self._expected = None
+
+    async def __aenter__(self) -> 'StallMeter':
+        """Start the heartbeat."""
+        self._loop = asyncio.get_running_loop()
+        self._schedule()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Stop the heartbeat, count the current stall."""
+        self._beat(reschedule=False)
+        self._handle.cancel()
+
+    def _schedule(self) -> None:
+        self._expected = self._loop.time() + self.interval
+        self._handle = self._loop.call_at(self._expected, self._beat)
+
+    def _beat(self, reschedule: bool = True) -> None:
+        stall = self._loop.time() - self._expected
+        self.max_stall = max(self.max_stall, stall)
+        self.beat_count += 1
+        if reschedule:
+            self._schedule()
+
+
+async def send_async(
+    self: httpx.AsyncClient,
+    request: httpx.Request,
+    **_: object,
+) -> httpx.Response:
+    """Reply the delayed response without content."""
+    await asyncio.sleep(RESPONSE_DELAY)
+    return httpx.Response(204, request=request)
+
+
+def create_app() -> WSE:
+    """Create the app, drop the cached app icon."""
+    try:
+        del toga.Icon.__APP_ICON
+    except AttributeError:
+        pass
+    return WSE(formal_name='Bench App', app_id='org.wse.bench')
+
+
+async def navigate(app: WSE, box_name: str) -> float:
+    """Go to the page box, wait its opening.
+
+    :return: The maximum event loop stall, in seconds.
+    """
+    source = app.box_login if box_name == MAIN_BOX else app.box_main
+    app.main_window.content = source
+    async with StallMeter() as meter:
+        await asyncio.sleep(meter.interval)
+        opening = source.goto_box_handler(source, box_name)
+        if opening is not None:
+            await opening
+    return meter.max_stall
+
+
+def main() -> None:
+    """Run the benchmark."""
+    httpx.AsyncClient.send = send_async
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    with tempfile.TemporaryDirectory() as path:
+        dictionary_mirror.path = os.path.join(path, 'mirror.db')
+        app = create_app()
+        print(f'response delay {RESPONSE_DELAY * 1000:.0f} ms')
+        for box_name in BOX_NAMES:
+            gc.collect()
+            stall = loop.run_until_complete(navigate(app, box_name))
+            print(f'{box_name:<26}max stall {stall * 1000:7.2f} ms')
+        dictionary_mirror.close()
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Decode time of the large pagination pages into the table source.
+
+Compares the page decoding of the table before the change, the text
+decoded by ``response.json()`` twice and the rows built from
+``to_entries()`` tuples, with the single decode of the response body
+and the rows built from the items by ``load_items()``, with the
+standard ``json`` and with ``orjson`` if installed. Run from the
+project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_page_decode
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Callable
+
+import httpx
+
+from wse.contrib import payload
+from wse.contrib.utils import to_entries
+from wse.source.foreign import WordSource
+
+ROWS = (1_000, 10_000)
+"""Counts of the entries per page (`tuple[int, ...]`).
+"""
+RUNS = 10
+"""Number of the page decodes to measure (`int`).
+"""
+
+
+def make_response(rows: int) -> httpx.Response:
+    """Make the response of the page of words."""
+    page = {
+        'count': rows * 3,
+        'next': 'http://127.0.0.1/api/v1/foreign/?offset=2',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'foreign_word': f'word {i}',
+                'native_word': f'слово {i}',
+            }
+            for i in range(rows)
+        ],
+    }
+    return httpx.Response(200, content=json.dumps(page).encode())
+
+
+def decode_twice(response: httpx.Response, source: WordSource) -> None:
+    """Decode the text twice, build the rows from tuples (before)."""
+    source.load(to_entries(response.json()['results']))
+    response.json()['next']
+
+
+def decode_once(response: httpx.Response, source: WordSource) -> None:
+    """Decode the body once, build the rows from items (after)."""
+    page = payload.decode(response)
+    source.load_items(page['results'])
+    page['next']
+
+
+def bench(
+    decode: Callable[[httpx.Response, WordSource], None], rows: int
+) -> list[float]:
+    """Measure the page decode."""
+    source = WordSource()
+    times = []
+    for _ in range(RUNS):
+        # The response caches the decoded text.
+        response = make_response(rows)
+        start = time.perf_counter()
+        decode(response, source)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(title: str, times: list[float]) -> None:
+    """Print the decode statistics."""
+    print(
+        f'{title:<36}'
+        f'median {statistics.median(times) * 1000:9.2f} ms  '
+        f'min {min(times) * 1000:9.2f} ms'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    orjson = payload.orjson
+    for rows in ROWS:
+        print(f'{RUNS} decodes of the page of {rows} entries')
+        report('  json(), twice, to_entries()', bench(decode_twice, rows))
+        payload.orjson = None
+        report('  decode() json, load_items()', bench(decode_once, rows))
+        payload.orjson = orjson
+        if orjson is not None:
+            report('  decode() orjson, load_items()', bench(decode_once, rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Scheduling throughput of the exercise items.
+
+Compares the pick of the first due item with a pass over the items
+(before) and with the heap of ``RepetitionScheduler`` (after), each
+pick is followed by the answer record. The heap session includes the
+schedule of new items. Run from the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_scheduler
+"""
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from wse.contrib.scheduler import RepetitionScheduler
+
+SIZES = (1_000, 10_000, 100_000)
+"""Counts of the scheduled items (`tuple[int, ...]`).
+"""
+TASKS = 2_000
+"""Count of the shown tasks per run (`int`).
+"""
+RUNS = 3
+"""Number of the runs to measure (`int`).
+"""
+
+
+def linear_session(size: int) -> Callable[[], None]:
+    """Get the session that finds the first due item by a pass."""
+
+    def session() -> None:
+        rng = random.Random(1)
+        due = {i: i for i in range(size)}
+        assessments = dict.fromkeys(due, 0)
+        for step in range(TASKS):
+            item_id = min(due, key=due.__getitem__)
+            assessments[item_id] += rng.choice((1, -1))
+            interval = RepetitionScheduler.interval(assessments[item_id])
+            due[item_id] = max(step, due[item_id]) + interval
+
+    return session
+
+
+def heap_session(size: int) -> Callable[[], None]:
+    """Get the session of the scheduler heap."""
+
+    def session() -> None:
+        rng = random.Random(1)
+        scheduler = RepetitionScheduler(random.Random(1))
+        scheduler.extend((i, 0) for i in range(size))
+        assessments = dict.fromkeys(map(str, range(size)), 0)
+        for _ in range(TASKS):
+            item_id = scheduler.next()
+            assessments[item_id] += rng.choice((1, -1))
+            scheduler.record(item_id, assessments[item_id])
+
+    return session
+
+
+def bench(session: Callable[[], None]) -> list[float]:
+    """Measure the session."""
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        session()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(title: str, times: list[float]) -> None:
+    """Print the throughput statistics."""
+    median = statistics.median(times)
+    print(
+        f'{title:<32}'
+        f'median {median * 1000:9.2f} ms  '
+        f'{TASKS / median:12.0f} tasks/s'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f'{RUNS} sessions of {TASKS} tasks')
+    for size in SIZES:
+        print(f'{size} items')
+        report('  pass over items', bench(linear_session(size)))
+        report('  scheduler heap', bench(heap_session(size)))
+
+
+if __name__ == '__main__':
+    main()
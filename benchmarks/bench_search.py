@@ -0,0 +1,108 @@
+"""Build and query time of the search index of 50k entries.
+
+The index is built by pages of entries, as the pages are received,
+the queries are compared with the scan of the entry texts. Run from
+the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_search
+"""
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from wse.contrib.search import SearchIndex, normalize
+
+ENTRIES = 50_000
+"""Count of the dictionary entries (`int`).
+"""
+PAGE_SIZE = 100
+"""Count of the entries per received page (`int`).
+"""
+RUNS = 50
+"""Number of the queries to measure (`int`).
+"""
+QUERIES = ('k', 'ко', 'ion', 'stone', 'ation ень', 'zzzz')
+
+LATIN = 'abcdefghijklmnopqrstuvwxyz'
+CYRILLIC = 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'
+
+
+def make_entries() -> list[dict]:
+    """Make the entries of random words."""
+    rng = random.Random(1)
+    syllables = [
+        rng.choice(LATIN) + rng.choice('aeiou') for _ in range(200)
+    ] + ['ation', 'stone', 'ion']
+    russian = [
+        rng.choice(CYRILLIC) + rng.choice('аеиоу') for _ in range(200)
+    ] + ['ень', 'ко']
+
+    def word(parts: list[str]) -> str:
+        return ''.join(rng.choices(parts, k=rng.randint(2, 4)))
+
+    return [
+        {
+            'id': i,
+            'foreign_word': word(syllables),
+            'native_word': word(russian),
+        }
+        for i in range(ENTRIES)
+    ]
+
+
+def bench(run: Callable[[], object], runs: int = RUNS) -> list[float]:
+    """Measure the run."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(title: str, times: list[float]) -> None:
+    """Print the time statistics."""
+    print(
+        f'{title:<34}'
+        f'median {statistics.median(times) * 1e6:11.1f} us  '
+        f'min {min(times) * 1e6:11.1f} us'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    entries = make_entries()
+    index = SearchIndex(['foreign_word', 'native_word'])
+    page_times = []
+    for start in range(0, ENTRIES, PAGE_SIZE):
+        page = entries[start : start + PAGE_SIZE]
+        page_times.extend(bench(lambda p=page: index.extend(p), runs=1))
+    print(
+        f'{ENTRIES} entries, index built by pages of {PAGE_SIZE} in '
+        f'{sum(page_times) * 1000:.0f} ms'
+    )
+    report('  page added', page_times)
+
+    texts = [
+        normalize(f'{e["foreign_word"]} {e["native_word"]}') for e in entries
+    ]
+    for query in QUERIES:
+        words = normalize(query).split()
+        found = len(index.search(query))
+        print(f'query {query!r} ({found} found)')
+        report(
+            '  scan of texts',
+            bench(
+                lambda w=words: [
+                    t for t in texts if all(word in t for word in w)
+                ][:100],
+                runs=5,
+            ),
+        )
+        report('  index search()', bench(lambda q=query: index.search(q)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Startup time and object counts of the app with lazy page boxes.
+
+Uses the toga dummy backend. Run from the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_startup
+"""
+
+import gc
+import os
+import statistics
+import time
+
+os.environ.setdefault('TOGA_BACKEND', 'toga_dummy')
+
+import toga  # noqa: E402
+
+from wse.app import WSE  # noqa: E402
+
+RUNS = 20
+"""Number of the app startups to measure (`int`).
+"""
+
+
+class TimedWSE(WSE):
+    """The app that measures the ``startup()`` wall time."""
+
+    startup_time = 0.0
+
+    def startup(self) -> None:
+        """Measure the app startup."""
+        start = time.perf_counter()
+        super().startup()
+        self.startup_time = time.perf_counter() - start
+
+
+def count_widgets() -> int:
+    """Count the alive toga widgets."""
+    return sum(isinstance(obj, toga.Widget) for obj in gc.get_objects())
+
+
+def create_app() -> TimedWSE:
+    """Create the app, drop the cached app icon."""
+    try:
+        del toga.Icon.__APP_ICON
+    except AttributeError:
+        pass
+    return TimedWSE(formal_name='Bench App', app_id='org.wse.bench')
+
+
+def bench(eager: bool) -> tuple[list[float], int, int]:
+    """Measure the startup, create all page boxes if eager (before).
+
+    :return: The startup times, the count of new objects and widgets.
+    """
+    times = []
+    objects = widgets = 0
+    for _ in range(RUNS):
+        gc.collect()
+        objects_before = len(gc.get_objects())
+        widgets_before = count_widgets()
+
+        app = create_app()
+        startup_time = app.startup_time
+        if eager:
+            start = time.perf_counter()
+            for name in WSE.page_names():
+                getattr(app, name)
+            startup_time += time.perf_counter() - start
+        times.append(startup_time)
+
+        gc.collect()
+        objects = len(gc.get_objects()) - objects_before
+        widgets = count_widgets() - widgets_before
+        del app
+    return times, objects, widgets
+
+
+def report(title: str, result: tuple[list[float], int, int]) -> None:
+    """Print the startup statistics."""
+    times, objects, widgets = result
+    print(
+        f'{title:<26}'
+        f'median {statistics.median(times) * 1000:7.2f} ms  '
+        f'min {min(times) * 1000:7.2f} ms  '
+        f'objects {objects:7d}  widgets {widgets:5d}'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f'{RUNS} app startups, {len(WSE.page_names())} page boxes')
+    report('eager, all page boxes', bench(eager=True))
+    report('lazy, main page box', bench(eager=False))
+
+
+if __name__ == '__main__':
+    main()
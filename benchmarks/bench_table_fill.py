@@ -0,0 +1,85 @@
+"""Fill time of the entries table with 10k rows.
+
+Compares the per row ``add_entry()`` with the index lookup (before)
+and the bulk ``load()`` (after). Uses the toga dummy backend. Run from
+the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_table_fill
+"""
+
+import os
+import statistics
+import time
+from collections.abc import Callable
+
+os.environ.setdefault('TOGA_BACKEND', 'toga_dummy')
+
+from wse.general.table import BaseTable  # noqa: E402
+from wse.source.foreign import Word, WordSource  # noqa: E402
+
+ROWS = 10_000
+"""Count of the table rows (`int`).
+"""
+RUNS = 5
+"""Number of the table fills to measure (`int`).
+"""
+
+ENTRIES = [(str(i), f'word {i}', f'слово {i}') for i in range(ROWS)]
+
+
+def add_entries_indexed(source: WordSource) -> None:
+    """Fill the source per row, look up the row index (before)."""
+    source.clear()
+    for entry in ENTRIES:
+        word = Word(*entry)
+        source._words.append(word)
+        source.notify('insert', index=source._words.index(word), item=word)
+
+
+def add_entries(source: WordSource) -> None:
+    """Fill the source per row with direct row index."""
+    source.clear()
+    for entry in ENTRIES:
+        source.add_entry(entry)
+
+
+def load_entries(source: WordSource) -> None:
+    """Fill the source with bulk load (after)."""
+    source.load(ENTRIES)
+
+
+def bench(fill: Callable[[WordSource], None]) -> list[float]:
+    """Measure the fill of the table source."""
+    source = WordSource()
+    BaseTable(
+        headings=['foreign', 'native'],
+        data=source,
+        accessors=source.accessors,
+    )
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fill(source)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(title: str, times: list[float]) -> None:
+    """Print the fill statistics."""
+    print(
+        f'{title:<30}'
+        f'median {statistics.median(times) * 1000:9.2f} ms  '
+        f'min {min(times) * 1000:9.2f} ms'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f'{RUNS} fills of {ROWS} table rows')
+    report('add_entry(), index lookup', bench(add_entries_indexed))
+    report('add_entry(), direct index', bench(add_entries))
+    report('load()', bench(load_entries))
+
+
+if __name__ == '__main__':
+    main()
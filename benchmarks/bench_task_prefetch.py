@@ -0,0 +1,90 @@
+"""Time to next exercise question with and without task prefetch.
+
+The local server answers with an artificial delay, the user reads
+each question for a fixed time before requesting the next one.
+
+Run from the project root::
+
+    PYTHONPATH=src python -m benchmarks.bench_task_prefetch
+"""
+
+import asyncio
+import bisect
+import time
+
+from benchmarks.stub_server import StubServer
+from wse.contrib.http_requests import client_pool, request_post_async
+from wse.contrib.prefetch import TaskPrefetcher
+
+QUESTIONS = 25
+"""Number of questions in the session (`int`).
+"""
+SERVER_DELAY = 0.15
+"""The server response delay, in seconds (`float`).
+"""
+READING_TIME = 0.2
+"""Time to read a question, in seconds (`float`).
+"""
+BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.2, float('inf'))
+"""The histogram bucket upper bounds, in seconds (`tuple`).
+"""
+TASK = {'id': 1, 'question_text': 'question', 'answer_text': 'answer'}
+PARAMS = {'category': None, 'progress': 'S'}
+
+
+def histogram(title: str, latencies: list[float]) -> None:
+    """Print the latency histogram."""
+    counts = [0] * len(BUCKETS)
+    for latency in latencies:
+        counts[bisect.bisect_left(BUCKETS, latency)] += 1
+
+    print(title)
+    lower = 0.0
+    for upper, count in zip(BUCKETS, counts, strict=True):
+        label = f'{lower * 1000:>5.0f} - {upper * 1000:>5.0f} ms'
+        print(f'  {label:<18}{count:>4}  {"#" * count}')
+        lower = upper
+
+
+async def bench_direct(url: str) -> list[float]:
+    """Request each task when the question is needed (before)."""
+    latencies = []
+    for _ in range(QUESTIONS):
+        start = time.perf_counter()
+        await request_post_async(url, PARAMS)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(READING_TIME)
+    return latencies
+
+
+async def bench_prefetch(url: str) -> list[float]:
+    """Get each task from the prefetched tasks (after)."""
+
+    async def fetch(params: dict) -> object:
+        return await request_post_async(url, params)
+
+    prefetcher = TaskPrefetcher(fetch)
+    latencies = []
+    for _ in range(QUESTIONS):
+        start = time.perf_counter()
+        await prefetcher.get(PARAMS)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(READING_TIME)
+    prefetcher.invalidate()
+    await client_pool.aclose()
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with StubServer(payload=TASK, delay=SERVER_DELAY) as server:
+        print(
+            f'{QUESTIONS} questions, server delay {SERVER_DELAY * 1000:.0f} '
+            f'ms, reading time {READING_TIME * 1000:.0f} ms'
+        )
+        histogram('Without prefetch:', asyncio.run(bench_direct(server.url)))
+        histogram('With prefetch:', asyncio.run(bench_prefetch(server.url)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Local stub http server for benchmarks."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from typing_extensions import Self
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Reply to any request with the server JSON payload."""
+
+    protocol_version = 'HTTP/1.1'
+    """Keep-alive connections are supported (`str`).
+    """
+    disable_nagle_algorithm = True
+    """Send the reply headers and body without delay (`bool`).
+    """
+
+    def _reply(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        body = json.dumps(self.server.payload).encode()
+        self.send_response(self.server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply  # noqa: N815
+
+    def log_message(self, *args: object) -> None:
+        """Do not log the requests."""
+        pass
+
+
+class StubServer:
+    """Local http server running in the background thread.
+
+    :param payload: The JSON data to reply.
+    :param float delay: The artificial response delay, in seconds.
+    :param int status: The response status code.
+    """
+
+    def __init__(
+        self,
+        payload: object = None,
+        delay: float = 0,
+        status: int = 200,
+    ) -> None:
+        """Construct the server."""
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.payload = payload if payload is not None else {}
+        self.httpd.delay = delay
+        self.httpd.status = status
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+
+    @property
+    def url(self) -> str:
+        """The server url (`str`, reade-only)."""
+        host, port = self.httpd.server_address
+        return f'http://{host}:{port}/'
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the server."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
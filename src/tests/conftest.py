@@ -6,6 +6,10 @@ import toga
 
 from tests.utils import FixtureReader
 from wse.app import WSE
+from wse.contrib.assessment import assessment_queue
+from wse.contrib.latency import answer_latency
+from wse.contrib.mirror import dictionary_mirror
+from wse.contrib.page_cache import page_cache
 
 FIXTURE = 'params_glossary.json'
 PARAMS = FixtureReader(FIXTURE).json()
@@ -19,14 +23,34 @@ def event_loop(request):
 
 
 @pytest.fixture
-def wse(event_loop):
+def wse(event_loop, tmp_path, monkeypatch):
+    # The dictionary mirror is written to test temp dir.
+    monkeypatch.setattr(
+        dictionary_mirror, 'path', str(tmp_path / 'mirror.db')
+    )
+    # The answer times are written to test temp dir.
+    monkeypatch.setattr(answer_latency, 'path', str(tmp_path / 'latency.db'))
+    monkeypatch.setattr(answer_latency, '_samples', None)
+    # The unsent assessments are journaled to test temp dir.
+    monkeypatch.setattr(
+        assessment_queue.journal, 'path', str(tmp_path / 'progress.db')
+    )
+
     # The app icon is cached; purge the app icon cache if it exists
     try:
         del toga.Icon.__APP_ICON
     except AttributeError:
         pass
 
-    return WSE(formal_name="Test App", app_id="org.beeware.toga.test-app")
+    yield WSE(formal_name="Test App", app_id="org.beeware.toga.test-app")
+
+    # Cancel the handlers and page openings left by the test.
+    for task in asyncio.all_tasks(event_loop):
+        task.cancel()
+    page_cache.clear()
+    dictionary_mirror.close()
+    answer_latency.close()
+    assessment_queue.journal.close()
 
 
 @pytest.fixture(scope='function')
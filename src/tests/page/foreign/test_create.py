@@ -69,11 +69,9 @@ def test_btn_goto_foreign(wse: WSE) -> None:
     assert wse.main_window.content == wse.box_foreign_main
 
 
-def request_entries(obj: object, url: str) -> list[tuple[str, ...]]:
-    """Return entries to insert at table."""
-    return [
-        ('id', 'foreign', 'native'),
-    ]
+async def request_page(obj: object, url: str) -> None:
+    """Return no pagination page instead of http request."""
+    return None
 
 
 def test_btn_goto_foreign_list(
@@ -84,7 +82,7 @@ def test_btn_goto_foreign_list(
     btn = wse.box_foreign_create.btn_goto_foreign_list
     assert btn.text == 'Словарь иностранных слов'
 
-    monkeypatch.setattr(TableApp, 'request_entries', request_entries)
+    monkeypatch.setattr(TableApp, 'request_page', request_page)
 
     btn._impl.simulate_press()
     assert wse.main_window.content == wse.box_foreign_list
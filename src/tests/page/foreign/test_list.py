@@ -7,9 +7,13 @@ Testing:
  * The order of widget and widget containers at page.
 """
 
+import asyncio
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
-from httpx import Client
+from httpx import AsyncClient, Response
 
 from tests.utils import FixtureReader
 from wse.app import WSE
@@ -30,17 +34,21 @@ def goto_foreign_list_page(wse: WSE) -> None:
     wse.main_window.content = wse.box_foreign_list
 
 
-def mock_list_json(*args: object, **kwargs: object) -> FixtureReader:
+async def mock_list_json(*args: object, **kwargs: object) -> FixtureReader:
     """Mock a json http response with a list of terms."""
     return FixtureReader(FIXTURE_FOREIGN_LIST)
 
 
 @pytest.fixture(autouse=True)
-def populate_table(wse: WSE, monkeypatch: MonkeyPatch) -> None:
+def populate_table(
+    wse: WSE,
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Populate foreign word list table."""
     # Mock http request word list, populate table.
-    monkeypatch.setattr(Client, 'get', mock_list_json)
-    wse.box_foreign_list.populate_table()
+    monkeypatch.setattr(AsyncClient, 'get', mock_list_json)
+    event_loop.run_until_complete(wse.box_foreign_list.populate_table())
 
 
 def mock_pagination_first(*args: object, **kwargs: object) -> FixtureReader:
@@ -61,6 +69,7 @@ def test_widget_order(wse: WSE) -> None:
         box.label_title,
         box.btn_goto_foreign_main,
         box.btns_manage,
+        box.input_search,
         box.table,
         box.btns_paginate,
     ]
@@ -74,6 +83,7 @@ def test_widget_order(wse: WSE) -> None:
     assert box.btns_paginate.children == [
         box._btn_previous,
         box._btn_table_reload,
+        box._btn_scroll_all,
         box._btn_next,
     ]
 
@@ -134,16 +144,61 @@ def test_btn_goto_foreign_update(wse: WSE, monkeypatch: MonkeyPatch) -> None:
     assert wse.main_window.content == wse.box_foreign_update
 
 
-def test_btn_foreign_delete(wse: WSE, monkeypatch: MonkeyPatch) -> None:
+def test_btn_foreign_delete(
+    wse: WSE,
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test the button of delete foreign word."""
     btn = wse.box_foreign_list._btn_delete
     assert btn.text == 'Удалить'
 
+    # The table is not populated again after delete.
+    get = AsyncMock()
+    monkeypatch.setattr(AsyncClient, 'get', get)
+    monkeypatch.setattr(
+        AsyncClient,
+        'delete',
+        AsyncMock(return_value=Response(HTTPStatus.NO_CONTENT)),
+    )
+
     # No window switching.
     # Select table entry to delete.
     entry_index = 1
     table = wse.box_foreign_list.table
     table._impl.simulate_selection(entry_index)
     # Press button.
-    btn._impl.simulate_press()
+    event_loop.run_until_complete(btn.on_press())
+    assert wse.main_window.content == wse.box_foreign_list
+
+    assert [row.foreign_word for row in table.data] == ['hello', 'pen']
+    get.assert_not_called()
+
+
+def test_update_foreign_in_place(
+    wse: WSE,
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the updated word is changed in table in place."""
+
+    async def wait_response(*args: object, **kwargs: object) -> None:
+        await asyncio.sleep(1)
+
+    # The table is changed without waiting for the page request.
+    monkeypatch.setattr(AsyncClient, 'get', wait_response)
+    monkeypatch.setattr(
+        AsyncClient, 'put', AsyncMock(return_value=Response(HTTPStatus.OK))
+    )
+    table = wse.box_foreign_list.table
+    table._impl.simulate_selection(1)
+    wse.box_foreign_list._btn_update._impl.simulate_press()
+
+    box = wse.box_foreign_update
+    box.input_foreign.value = 'pear'
+    box.input_native.value = 'груша'
+    event_loop.run_until_complete(box.btn_submit.on_press())
+
+    assert table.data[1].foreign_word == 'pear'
+    assert table.data[1].native_word == 'груша'
     assert wse.main_window.content == wse.box_foreign_list
@@ -6,11 +6,12 @@ Testing:
  * Button handlers.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
-from httpx import Client
+from httpx import AsyncClient
 
 from tests.utils import FixtureReader
 from wse.app import WSE
@@ -27,21 +28,31 @@ def goto_foreign_list_page(wse: WSE) -> None:
     wse.main_window.content = wse.box_foreign_list
 
 
-def mock_pagination_first(*args: object, **kwargs: object) -> FixtureReader:
+async def mock_pagination_first(
+    *args: object,
+    **kwargs: object,
+) -> FixtureReader:
     """Mock a json http response to test the first pagination page."""
     return FixtureReader(FIXTURE_PAGINATION_FIRST)
 
 
-def mock_pagination_last(*args: object, **kwargs: object) -> FixtureReader:
+async def mock_pagination_last(
+    *args: object,
+    **kwargs: object,
+) -> FixtureReader:
     """Mock a json http response to test the last pagination page."""
     return FixtureReader(FIXTURE_PAGINATION_LAST)
 
 
-def test_pagination_first_page(wse: WSE, monkeypatch: MonkeyPatch) -> None:
+def test_pagination_first_page(
+    wse: WSE,
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test pagination buttons at first page."""
     # Mock http request word list, populate table.
-    monkeypatch.setattr(Client, 'get', mock_pagination_first)
-    wse.box_foreign_list.populate_table()
+    monkeypatch.setattr(AsyncClient, 'get', mock_pagination_first)
+    event_loop.run_until_complete(wse.box_foreign_list.populate_table())
 
     # Previous button.
     btn_previous = wse.box_foreign_list._btn_previous
@@ -52,11 +63,15 @@ def test_pagination_first_page(wse: WSE, monkeypatch: MonkeyPatch) -> None:
     assert btn_next.enabled is True
 
 
-def test_pagination_last_page(wse: WSE, monkeypatch: MonkeyPatch) -> None:
+def test_pagination_last_page(
+    wse: WSE,
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test pagination buttons at last page."""
     # Mock http request word list, populate table.
-    monkeypatch.setattr(Client, 'get', mock_pagination_last)
-    wse.box_foreign_list.populate_table()
+    monkeypatch.setattr(AsyncClient, 'get', mock_pagination_last)
+    event_loop.run_until_complete(wse.box_foreign_list.populate_table())
 
     # Previous button.
     btn_previous = wse.box_foreign_list._btn_previous
@@ -67,34 +82,46 @@ def test_pagination_last_page(wse: WSE, monkeypatch: MonkeyPatch) -> None:
     assert btn_next.enabled is False
 
 
-@patch('httpx.Client')
-def test_btn_next_handler(client: Mock, wse: WSE) -> None:
+@patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+def test_btn_next_handler(
+    get: AsyncMock,
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test the handler of button pagination next."""
     btn = wse.box_foreign_list._btn_next
     assert btn.text == '>'
 
     btn.enabled = True
-    btn._impl.simulate_press()
-    assert client.called
+    event_loop.run_until_complete(btn.on_press())
+    assert get.called
 
 
-@patch('httpx.Client')
-def test_btn_previous_handler(client: Mock, wse: WSE) -> None:
+@patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+def test_btn_previous_handler(
+    get: AsyncMock,
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test the handler of button pagination previous."""
     btn = wse.box_foreign_list._btn_previous
     assert btn.text == '<'
 
     btn.enabled = True
-    btn._impl.simulate_press()
-    assert client.called
+    event_loop.run_until_complete(btn.on_press())
+    assert get.called
 
 
-@patch('httpx.Client')
-def test_btn_table_reload_handler(client: Mock, wse: WSE) -> None:
+@patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+def test_btn_table_reload_handler(
+    get: AsyncMock,
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test the handler of button pagination previous."""
     btn = wse.box_foreign_list._btn_table_reload
     assert btn.text == 'Обновить'
 
     btn.enabled = True
-    btn._impl.simulate_press()
-    assert client.called
+    event_loop.run_until_complete(btn.on_press())
+    assert get.called
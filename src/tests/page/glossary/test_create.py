@@ -65,11 +65,9 @@ def test_btn_submit(wse: WSE) -> None:
     assert wse.main_window.content == wse.box_glossary_create
 
 
-def request_entries(obj: object, url: str) -> list[tuple[str, str]]:
-    """Return entries to insert at table."""
-    return [
-        ('term', 'definition'),
-    ]
+async def request_page(obj: object, url: str) -> None:
+    """Return no pagination page instead of http request."""
+    return None
 
 
 def test_btn_goto_glossary_list(
@@ -80,7 +78,7 @@ def test_btn_goto_glossary_list(
     btn = wse.box_glossary_create.btn_goto_glossary_list
     assert btn.text == 'Словарь терминов'
 
-    monkeypatch.setattr(TableApp, 'request_entries', request_entries)
+    monkeypatch.setattr(TableApp, 'request_page', request_page)
 
     btn._impl.simulate_press()
     assert wse.main_window.content == wse.box_glossary_list
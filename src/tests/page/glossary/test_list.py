@@ -26,6 +26,7 @@ def test_widget_order(wse: WSE) -> None:
         box.label_title,
         box.btn_goto_glossary_main,
         box.btns_manage,
+        box.input_search,
         box.table,
         box.btns_paginate,
     ]
@@ -39,6 +40,7 @@ def test_widget_order(wse: WSE) -> None:
     assert box.btns_paginate.children == [
         box._btn_previous,
         box._btn_table_reload,
+        box._btn_scroll_all,
         box._btn_next,
     ]
 
@@ -66,11 +66,9 @@ def test_btn_goto_glossary_params_page(wse: WSE) -> None:
     assert wse.main_window.content == wse.box_glossary_params
 
 
-def request_entries(obj: object, url: str) -> list[tuple[str, str]]:
-    """Return entries to insert at table."""
-    return [
-        ('term', 'definition'),
-    ]
+async def request_page(obj: object, url: str) -> None:
+    """Return no pagination page instead of http request."""
+    return None
 
 
 def test_btn_goto_list(
@@ -81,7 +79,7 @@ def test_btn_goto_list(
     btn = wse.box_glossary_main.btn_goto_list
     assert btn.text == 'Словарь терминов'
 
-    monkeypatch.setattr(TableApp, 'request_entries', request_entries)
+    monkeypatch.setattr(TableApp, 'request_page', request_page)
 
     # No window switching.
     btn._impl.simulate_press()
@@ -6,7 +6,8 @@ Testing:
  * Request handler of save params.
 """
 
-from unittest.mock import Mock, PropertyMock, call, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, PropertyMock, call, patch
 from urllib.parse import urljoin
 
 from toga.sources import ListSource
@@ -33,9 +34,15 @@ def get_assertion(items: list, expected: ListSource) -> None:
     new_callable=PropertyMock,
 )
 @patch(
-    target='httpx.Client.get',
+    target='httpx.AsyncClient.get',
+    new_callable=AsyncMock,
 )
-def test_on_open(get: Mock, lookup_conditions: Mock, wse: WSE) -> None:
+def test_on_open(
+    get: AsyncMock,
+    lookup_conditions: Mock,
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """Test the calls of on_open method glossary params box."""
     # Opening page requests the user exercise params from server.
     get.return_value = Mock(
@@ -43,10 +50,10 @@ def test_on_open(get: Mock, lookup_conditions: Mock, wse: WSE) -> None:
         status_code=200,
         json=Mock(return_value=PARAMS),
     )
-    wse.box_glossary_params.on_open()
+    event_loop.run_until_complete(wse.box_glossary_params.on_open())
 
     # Exercise params request url.
-    url = call(url=urljoin(HOST_API, GLOSSARY_PARAMS_PATH))
+    url = call(urljoin(HOST_API, GLOSSARY_PARAMS_PATH))
     assert get.call_args == url
 
     # Call lookup_condition property setter.
@@ -130,15 +137,17 @@ def test_input_count_last(wse: WSE, selection_params: object) -> None:
     assert wse.box_glossary_params.count_first_switch.value is False
 
 
-@patch('httpx.Client.post')
+@patch('httpx.AsyncClient.post', new_callable=AsyncMock)
 def test_save_params_handler(
-    post: Mock,
+    post: AsyncMock,
     selection_params: object,
     wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
 ) -> None:
     """Test save exercise parameters handler."""
     # Click button.
-    wse.box_glossary_params.btn_save_params._impl.simulate_press()
+    btn = wse.box_glossary_params.btn_save_params
+    event_loop.run_until_complete(btn.on_press())
 
     # Request to save params by url.
     expected_url = urljoin(HOST_API, REQEUST_PARAMS_URL)
@@ -150,7 +159,7 @@ def test_save_params_handler(
         'count_first': 0,
         'count_last': 0,
     }
-    post.assert_called_with(url=expected_url, json=expected_json)
+    post.assert_called_with(expected_url, json=expected_json)
 
 
 def test_count_switch(wse: WSE) -> None:
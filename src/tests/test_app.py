@@ -0,0 +1,39 @@
+"""Test the lazy creation of app page boxes."""
+
+import asyncio
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.app import WSE
+from wse.constants import FOREIGN_LIST_BOX
+from wse.general.box_page import LazyBox
+
+
+def created_pages(app: WSE) -> list[str]:
+    """Get the names of created page boxes."""
+    return [name for name in WSE.page_names() if LazyBox.is_created(app, name)]
+
+
+def test_startup_creates_main_page(wse: WSE) -> None:
+    """Test that only the main page box is created on startup."""
+    assert created_pages(wse) == ['box_main']
+    assert wse.main_window.content is wse.box_main
+
+
+def test_get_box_creates_page(wse: WSE) -> None:
+    """Test that the page box is created once on first access."""
+    box = wse.box_main.get_box(wse.box_main, FOREIGN_LIST_BOX)
+    assert LazyBox.is_created(wse, FOREIGN_LIST_BOX)
+    assert wse.box_foreign_list is box
+
+
+def test_prewarm_pages(
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the page boxes are created at idle time."""
+    monkeypatch.setattr('wse.app.PAGE_PREWARM_DELAY', 0)
+    event_loop.run_until_complete(wse.prewarm_pages())
+    assert created_pages(wse) == WSE.page_names()
+    assert len(WSE.page_names()) == 14
@@ -0,0 +1,105 @@
+"""Test the write-behind queue of assessments."""
+
+import asyncio
+
+from wse.constants import ACTION, KNOW, NOT_KNOW
+from wse.constants.literal import ITEM_ID
+from wse.contrib.assessment import AssessmentQueue
+from wse.contrib.journal import JournalEntry
+
+URL = 'http://127.0.0.1/api/v1/progress/'
+
+
+class FakeServer:
+    """Store the sent assessments, fail the sending on demand."""
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.received = []
+        self.fail_after = None
+
+    async def send(self, entries: list[JournalEntry]) -> int:
+        """Receive the assessments."""
+        await asyncio.sleep(0)
+        if self.fail_after is not None:
+            entries = entries[: self.fail_after]
+        self.received.extend(entry.payload for entry in entries)
+        return len(entries)
+
+
+def test_record(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the assessment is recorded without sending."""
+    server = FakeServer()
+
+    async def record() -> AssessmentQueue:
+        queue = AssessmentQueue(server.send, flush_size=3)
+        queue.record(URL, KNOW, 1)
+        queue.record(URL, NOT_KNOW, 2)
+        return queue
+
+    queue = event_loop.run_until_complete(record())
+    assert len(queue) == 2
+    assert queue.stats.queue_depth == 2
+    assert server.received == []
+
+    event_loop.run_until_complete(queue.flush())
+    assert len(queue) == 0
+    assert server.received == [
+        {ACTION: KNOW, ITEM_ID: 1},
+        {ACTION: NOT_KNOW, ITEM_ID: 2},
+    ]
+    assert queue.stats.flush_count == 1
+    assert queue.stats.last_latency is not None
+
+
+def test_flush_on_size(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the queue is flushed by the size threshold."""
+    server = FakeServer()
+
+    async def record() -> AssessmentQueue:
+        queue = AssessmentQueue(server.send, flush_size=2)
+        queue.record(URL, KNOW, 1)
+        queue.record(URL, KNOW, 2)
+        await queue.schedule_flush()
+        return queue
+
+    queue = event_loop.run_until_complete(record())
+    assert [payload[ITEM_ID] for payload in server.received] == [1, 2]
+    assert queue.stats.max_queue_depth == 2
+
+
+def test_flush_on_timer(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the queue is flushed by the timer."""
+    server = FakeServer()
+
+    async def record() -> AssessmentQueue:
+        queue = AssessmentQueue(server.send, flush_interval=0.01)
+        queue.record(URL, KNOW, 1)
+        await asyncio.sleep(0.05)
+        return queue
+
+    queue = event_loop.run_until_complete(record())
+    assert server.received == [{ACTION: KNOW, ITEM_ID: 1}]
+    assert len(queue) == 0
+
+
+def test_retry_keeps_order(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the not sent assessments are retried in order."""
+    server = FakeServer()
+    server.fail_after = 1
+
+    async def record() -> AssessmentQueue:
+        queue = AssessmentQueue(server.send, flush_interval=60)
+        for item_id in range(1, 4):
+            queue.record(URL, KNOW, item_id)
+        await queue.flush()
+        return queue
+
+    queue = event_loop.run_until_complete(record())
+    assert len(queue) == 2
+    assert queue.stats.failed_count == 1
+
+    server.fail_after = None
+    event_loop.run_until_complete(queue.flush())
+    assert [payload[ITEM_ID] for payload in server.received] == [1, 2, 3]
+    assert queue.stats.sent_count == 3
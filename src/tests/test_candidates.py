@@ -0,0 +1,116 @@
+"""Test the index of the exercise candidates."""
+
+import datetime
+import itertools
+import random
+
+import pytest
+
+from wse.contrib.candidates import (
+    PERIOD_DAYS,
+    PROGRESS_ASSESSMENTS,
+    CandidateIndex,
+)
+
+TODAY = datetime.date(2024, 6, 1)
+
+
+def make_entries(count: int, seed: int = 1) -> list[dict]:
+    """Make the entries, some of them without the optional fields."""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(1, count + 1):
+        entry = {'id': i, 'assessment': rng.randint(-3, 12)}
+        if rng.random() > 0.1:
+            days = rng.randint(0, 400)
+            created = TODAY - datetime.timedelta(days=days)
+            entry['created_at'] = f'{created.isoformat()}T10:00:00'
+        if rng.random() > 0.1:
+            entry['category'] = rng.choice([1, 2, 3, None])
+        if rng.random() < 0.05:
+            del entry['assessment']
+        entries.append(entry)
+    return entries
+
+
+def linear_lookup(entries: list[dict], params: dict) -> list[int]:
+    """Filter the entries with a pass over them, the reference."""
+    start = PERIOD_DAYS.get(params.get('period_start_date'))
+    end = PERIOD_DAYS.get(params.get('period_end_date'))
+    category = params.get('category')
+    stage = PROGRESS_ASSESSMENTS.get(params.get('progress'))
+
+    found = []
+    for entry in entries:
+        created = entry.get('created_at')
+        if created:
+            days = (TODAY - datetime.date.fromisoformat(created[:10])).days
+            if start is not None and days > start:
+                continue
+            if end is not None and days < end:
+                continue
+        if category is not None and entry.get('category', category) != (
+            category
+        ):
+            continue
+        if stage and not stage[0] <= entry.get('assessment', 0) <= stage[1]:
+            continue
+        found.append(entry)
+
+    found.sort(key=lambda e: (e.get('created_at') or '', e['id']))
+    if params.get('count_first'):
+        found = found[: params['count_first']]
+    elif params.get('count_last'):
+        found = found[-params['count_last'] :]
+    return [entry['id'] for entry in found]
+
+
+PARAMS = [
+    {
+        'period_start_date': start,
+        'period_end_date': end,
+        'category': category,
+        'progress': progress,
+        'count_first': first,
+        'count_last': last,
+    }
+    for start, end, category, progress, (first, last) in itertools.product(
+        ['NC', 'M3', 'W1'],
+        ['DT', 'W2'],
+        [None, 2, 5],
+        [None, 'S', 'K'],
+        [(0, 0), (7, 0), (0, 7)],
+    )
+]
+
+
+def test_select_matches_linear_lookup() -> None:
+    """Test the index against the pass over entries."""
+    entries = make_entries(500)
+    index = CandidateIndex(entries)
+    for params in PARAMS:
+        found = index.select(params, TODAY)
+        ids = [entry['id'] for entry in index.items(found)]
+        assert ids == linear_lookup(entries, params), params
+
+
+@pytest.mark.parametrize('count', [0, 1, 64])
+def test_pick(count: int) -> None:
+    """Test that the pick gets the found entry by number."""
+    index = CandidateIndex(make_entries(count))
+    found = index.select({'progress': 'S'}, TODAY)
+    items = index.items(found)
+    assert found.bit_count() == len(items)
+    assert [index.pick(found, i) for i in range(len(items))] == items
+
+
+def test_update_stage() -> None:
+    """Test that the entry is moved to the new study stage."""
+    index = CandidateIndex([{'id': 1, 'assessment': 11}, {'id': 2}])
+    assert index.items(index.select({'progress': 'K'})) == []
+
+    index.update_stage(1, 12)
+    assert index.items(index.select({'progress': 'K'})) == [
+        {'id': 1, 'assessment': 11}
+    ]
+    assert len(index.items(index.select({'progress': 'E'}))) == 0
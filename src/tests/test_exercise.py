@@ -0,0 +1,191 @@
+"""Test the exercise loop of the exercise box."""
+
+import asyncio
+
+import httpx
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from tests.utils import FakeClock
+from wse.app import WSE
+from wse.container.exercise import ExerciseBox
+
+
+class TaskServer:
+    """Reply the numbered tasks when the replies are released."""
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.requests = 0
+        self.released = asyncio.Event()
+
+    async def post(self, url: str, **kwargs: object) -> httpx.Response:
+        """Reply the next task."""
+        self.requests += 1
+        number = self.requests
+        await self.released.wait()
+        payload = {
+            'id': number,
+            'question_text': f'question {number}',
+            'answer_text': f'answer {number}',
+            'item_count': 10,
+            'assessment': 0,
+        }
+        return httpx.Response(200, json=payload)
+
+
+@pytest.fixture
+def server(monkeypatch: MonkeyPatch) -> TaskServer:
+    """Mock the http requests with fake server, fixture."""
+    server = TaskServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'post', server.post)
+    return server
+
+
+@pytest.fixture
+def box(wse: WSE, server: TaskServer) -> ExerciseBox:
+    """Return the exercise box shown in window, fixture."""
+    box = wse.box_foreign_exercise
+    box.local_tasks = None
+    box.is_batch_supported = False
+    box.task.params = {}
+    box.task.status = None
+    box.timer.timeout = 60
+    wse.main_window.content = box
+    return box
+
+
+async def press_next(box: ExerciseBox, count: int) -> list[asyncio.Task]:
+    """Press the next button a few times without waiting."""
+    handlers = []
+    for _ in range(count):
+        handlers.append(asyncio.ensure_future(box.next_handler(box)))
+        await asyncio.sleep(0)
+    return handlers
+
+
+def test_single_loop(
+    box: ExerciseBox,
+    server: TaskServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the rapid presses keep one loop, no extra request."""
+
+    async def exercise() -> list[asyncio.Task]:
+        handlers = await press_next(box, 5)
+        requests = server.requests
+        handlers += await press_next(box, 5)
+        # The waited request is reused by the next loop.
+        assert server.requests == requests
+
+        server.released.set()
+        await asyncio.sleep(0.01)
+        return handlers
+
+    handlers = event_loop.run_until_complete(exercise())
+
+    assert box.is_loop_running()
+    assert sum(not handler.done() for handler in handlers) == 1
+    assert box.question_display.value == 'question 1'
+    assert server.requests == 1 + box.prefetcher.size
+
+
+def test_cancel_on_close(
+    box: ExerciseBox,
+    server: TaskServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the loop and its requests are cancelled on leave."""
+
+    async def exercise() -> asyncio.Task:
+        [handler] = await press_next(box, 1)
+        box.set_window_content(box, box.root.app.box_main)
+        await asyncio.sleep(0)
+        return handler
+
+    handler = event_loop.run_until_complete(exercise())
+
+    assert handler.done() and not handler.cancelled()
+    assert not box.is_loop_running()
+    assert len(box.prefetcher) == 0
+
+
+def test_pause(
+    box: ExerciseBox,
+    server: TaskServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the pause keeps the remaining time of question."""
+    clock = box.timer.clock = FakeClock()
+    server.released.set()
+
+    async def exercise() -> None:
+        await press_next(box, 1)
+        await asyncio.sleep(0.01)
+        assert box.question_display.value == 'question 1'
+
+        clock.advance(40)
+        box.pause_handler(box)
+        clock.advance(3600)
+        await asyncio.sleep(0)
+        assert box.answer_display.value == ''
+
+        box.pause_handler(box)
+        clock.advance(20)
+        await asyncio.sleep(0)
+        assert box.answer_display.value == 'answer 1'
+
+    event_loop.run_until_complete(exercise())
+
+
+def test_adaptive_timeout(
+    box: ExerciseBox,
+    server: TaskServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the question timeout is adapted to the answer times."""
+    clock = box.timer.clock = FakeClock()
+    server.released.set()
+    box.latency.record(box.url_exercise, 2, None, 3.0)
+
+    async def exercise() -> None:
+        await press_next(box, 1)
+        await asyncio.sleep(0.01)
+        assert box.question_display.value == 'question 1'
+
+        clock.advance(2)
+        asyncio.ensure_future(box.know_handler(box))
+        await asyncio.sleep(0.01)
+        assert box.question_display.value == 'question 2'
+
+        clock.advance(2.9)
+        await asyncio.sleep(0)
+        assert box.answer_display.value == ''
+        clock.advance(0.1)
+        await asyncio.sleep(0)
+        assert box.answer_display.value == 'answer 2'
+
+    event_loop.run_until_complete(exercise())
+    assert box.latency.timeout(box.url_exercise, 1) == 2
+
+
+def test_assess_once(
+    box: ExerciseBox,
+    server: TaskServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the double press assesses the shown task once."""
+    server.released.set()
+
+    async def exercise() -> None:
+        await press_next(box, 1)
+        await asyncio.sleep(0.01)
+        recorded = len(box.assessments)
+
+        # The button is pressed again before the next task is shown.
+        asyncio.ensure_future(box.know_handler(box))
+        asyncio.ensure_future(box.know_handler(box))
+        await asyncio.sleep(0.01)
+        assert len(box.assessments) == recorded + 1
+
+    event_loop.run_until_complete(exercise())
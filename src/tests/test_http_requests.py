@@ -0,0 +1,139 @@
+"""Test the pooled http clients and the token storage."""
+
+import asyncio
+import json
+import pathlib
+from http import HTTPStatus
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from wse.contrib.http_requests import (
+    ClientPool,
+    ErrorResponse,
+    TokenStore,
+    app_auth,
+    request_post,
+    request_post_async,
+)
+
+
+def test_client_is_reused() -> None:
+    """Test that the sync client is created once."""
+    pool = ClientPool()
+    client = pool.client
+    assert pool.client is client
+    assert client.auth is app_auth
+
+    pool.close()
+    assert client.is_closed
+    assert pool.client is not client
+    pool.close()
+
+
+def test_async_client_is_reused(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the async client is created once per event loop."""
+    pool = ClientPool()
+
+    async def get_client() -> httpx.AsyncClient:
+        return pool.async_client
+
+    client = event_loop.run_until_complete(get_client())
+    assert event_loop.run_until_complete(get_client()) is client
+
+    event_loop.run_until_complete(pool.aclose())
+    assert client.is_closed
+
+
+def test_stale_async_client_is_closed() -> None:
+    """Test that the client of previous event loop is closed."""
+    pool = ClientPool()
+    previous_loop, loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+
+    async def get_client() -> httpx.AsyncClient:
+        return pool.async_client
+
+    stale = previous_loop.run_until_complete(get_client())
+    client = loop.run_until_complete(get_client())
+    assert client is not stale
+    assert not stale.is_closed
+
+    # The stale client is closed when its loop runs.
+    previous_loop.run_until_complete(asyncio.sleep(0.01))
+    assert stale.is_closed
+
+    loop.run_until_complete(pool.aclose())
+    previous_loop.close()
+    loop.close()
+
+
+def test_pool_limits() -> None:
+    """Test the configurable pool limits."""
+    limits = httpx.Limits(max_connections=1)
+    pool = ClientPool(limits=limits, http2=False)
+    assert pool.limits is limits
+    assert pool.http2 is False
+
+
+@patch('httpx.Client.post')
+def test_request_post_without_token(post: Mock) -> None:
+    """Test that the request without token disables the auth."""
+    request_post('http://testserver/', {'key': 'value'}, token=False)
+    post.assert_called_with(
+        url='http://testserver/', json={'key': 'value'}, auth=None
+    )
+
+
+@patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+def test_request_post_async_connect_error(
+    post: AsyncMock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the async request intercepts the connection error."""
+    post.side_effect = httpx.ConnectError('Connection refused')
+    response = event_loop.run_until_complete(
+        request_post_async('http://testserver/', {'key': 'value'})
+    )
+    assert isinstance(response, ErrorResponse)
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_token_absence_is_cached(tmp_path: pathlib.Path) -> None:
+    """Test that the absent token file is read once."""
+    store = TokenStore(str(tmp_path / 'token.json'))
+    for _ in range(3):
+        assert store.get() is None
+    assert store.load_count == 1
+
+
+def test_token_is_read_once(tmp_path: pathlib.Path) -> None:
+    """Test that the token file is read once."""
+    path = tmp_path / 'token.json'
+    path.write_text(json.dumps({'token': 'abc'}))
+    store = TokenStore(str(path))
+    for _ in range(3):
+        assert store.get() == 'abc'
+    assert store.load_count == 1
+
+
+def test_token_set_and_delete(tmp_path: pathlib.Path) -> None:
+    """Test the token write and delete without file reads."""
+    path = tmp_path / 'token.json'
+    store = TokenStore(str(path))
+
+    store.set('abc')
+    assert json.loads(path.read_text()) == {'token': 'abc'}
+    assert store.get() == 'abc'
+    # No temporary files are left.
+    assert [p.name for p in tmp_path.iterdir()] == ['token.json']
+
+    store.delete()
+    assert not path.exists()
+    assert store.get() is None
+    assert store.load_count == 0
+
+    # Delete the absent token.
+    store.delete()
+    store.invalidate()
+    assert store.get() is None
+    assert store.load_count == 1
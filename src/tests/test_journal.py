@@ -0,0 +1,93 @@
+"""Test the journal of unsent progress events."""
+
+import asyncio
+from pathlib import Path
+
+from wse.constants import KNOW, NOT_KNOW
+from wse.constants.literal import ITEM_ID
+from wse.contrib.assessment import AssessmentQueue
+from wse.contrib.journal import JournalEntry, ProgressJournal
+
+URL = 'http://127.0.0.1/api/v1/progress/'
+
+
+def test_sync_by_batch(tmp_path: Path) -> None:
+    """Test that the appended entries are written by batch."""
+    path = str(tmp_path / 'progress.db')
+    journal = ProgressJournal(path)
+    for key in 'abc':
+        journal.append(JournalEntry(key, URL, {ITEM_ID: key}))
+    assert not journal.is_created
+
+    journal.sync()
+    assert journal.sync_count == 1
+    journal.remove(['b'])
+    journal.close()
+
+    entries = ProgressJournal(path).entries()
+    assert [entry.key for entry in entries] == ['a', 'c']
+    assert entries[0] == JournalEntry('a', URL, {ITEM_ID: 'a'})
+
+
+def test_replay(
+    event_loop: asyncio.AbstractEventLoop,
+    tmp_path: Path,
+) -> None:
+    """Test that the unsent assessments are sent on next app run."""
+    path = str(tmp_path / 'progress.db')
+    received = []
+
+    async def send_offline(entries: list[JournalEntry]) -> int:
+        return 0
+
+    async def send(entries: list[JournalEntry]) -> int:
+        received.extend(entries)
+        return len(entries)
+
+    async def record() -> None:
+        queue = AssessmentQueue(send_offline, ProgressJournal(path))
+        queue.record(URL, KNOW, 1)
+        queue.record(URL, NOT_KNOW, 2)
+        await queue.flush()
+        queue._cancel_timer()
+
+    event_loop.run_until_complete(record())
+
+    journal = ProgressJournal(path)
+    queue = AssessmentQueue(send, journal)
+    assert len(queue) == 2
+    event_loop.run_until_complete(queue.flush())
+
+    assert [entry.payload[ITEM_ID] for entry in received] == [1, 2]
+    assert len({entry.key for entry in received}) == 2
+    assert journal.entries() == []
+
+
+def test_sync_on_timer(
+    event_loop: asyncio.AbstractEventLoop,
+    tmp_path: Path,
+) -> None:
+    """Test that the journal is written before the queue flush."""
+    journal = ProgressJournal(str(tmp_path / 'progress.db'))
+    received = []
+
+    async def send(entries: list[JournalEntry]) -> int:
+        received.extend(entries)
+        return len(entries)
+
+    async def record() -> None:
+        queue = AssessmentQueue(
+            send, journal, flush_interval=60, sync_interval=0.01
+        )
+        queue.record(URL, KNOW, 1)
+        queue.record(URL, KNOW, 2)
+        assert journal.sync_count == 0
+        await asyncio.sleep(0.05)
+        queue._cancel_timer()
+
+    event_loop.run_until_complete(record())
+
+    assert journal.sync_count == 1
+    assert received == []
+    assert len(ProgressJournal(journal.path).entries()) == 2
+    journal.close()
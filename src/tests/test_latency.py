@@ -0,0 +1,68 @@
+"""Test the answer times of the exercise items."""
+
+import pathlib
+
+import pytest
+
+from wse.constants import DEFAULT_TIMEOUT, MAX_TIMEOUT, MIN_TIMEOUT
+from wse.contrib.latency import AnswerLatency
+
+EXERCISE = 'http://wselfedu.online/api/v1/foreign/exercise/'
+
+
+@pytest.fixture
+def latency(tmp_path: pathlib.Path) -> AnswerLatency:
+    """Return the answer times, fixture."""
+    latency = AnswerLatency(str(tmp_path / 'latency.db'), size=4)
+    yield latency
+    latency.close()
+
+
+def test_timeout(latency: AnswerLatency) -> None:
+    """Test that the timeout is the percentile of answer times."""
+    assert latency.timeout(EXERCISE, 1) == DEFAULT_TIMEOUT
+
+    for seconds in (3.0, 2.0, 2.5, 9.0, 2.2):
+        latency.record(EXERCISE, 1, None, seconds)
+    # The oldest time is dropped.
+    assert len(latency.samples[EXERCISE, 'item', '1']) == 4
+    assert latency.timeout(EXERCISE, 1) == pytest.approx(9.0)
+    assert latency.timeout('other', 1) == DEFAULT_TIMEOUT
+
+    latency.fraction = 0.5
+    assert latency.timeout(EXERCISE, 1) == pytest.approx(2.2)
+
+
+def test_category(latency: AnswerLatency) -> None:
+    """Test that the new item gets the timeout of its category."""
+    latency.record(EXERCISE, 1, 7, 4.0)
+    assert latency.timeout(EXERCISE, 2, 7) == pytest.approx(4.0)
+    assert latency.timeout(EXERCISE, 2, 8) == DEFAULT_TIMEOUT
+
+
+@pytest.mark.parametrize(
+    'seconds, timeout',
+    [(0.3, MIN_TIMEOUT), (600, MAX_TIMEOUT), (100_000, MAX_TIMEOUT)],
+)
+def test_bounds(
+    latency: AnswerLatency, seconds: float, timeout: float
+) -> None:
+    """Test that the timeout is limited."""
+    latency.record(EXERCISE, 1, None, seconds)
+    assert latency.timeout(EXERCISE, 1) == timeout
+
+
+def test_persist(latency: AnswerLatency) -> None:
+    """Test that the answer times are kept between sessions."""
+    latency.record(EXERCISE, 1, 7, 2.0)
+    latency.record(EXERCISE, 1, 7, 3.0)
+    latency.close()
+
+    row = latency.connection.execute('SELECT samples FROM latency').fetchone()
+    # The two answer times take four bytes.
+    assert len(row[0]) == 4
+
+    restored = AnswerLatency(latency.path, size=4)
+    assert restored.samples == latency.samples
+    assert restored.timeout(EXERCISE, 1) == pytest.approx(3.0)
+    restored.close()
@@ -0,0 +1,242 @@
+"""Test the local mirror of the user's dictionary."""
+
+import asyncio
+import pathlib
+
+import httpx
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.app import WSE
+from wse.contrib.mirror import DictionaryMirror, dictionary_mirror
+from wse.contrib.page_cache import CachedPage, PageCache, page_cache
+
+URL = 'http://127.0.0.1/api/v1/foreign/'
+PAGE_SIZE = 2
+COUNT = 5
+
+
+def page_url(offset: int) -> str:
+    """Get url of the page by offset."""
+    return f'{URL}?offset={offset}' if offset else URL
+
+
+class FakeServer:
+    """Reply the pages of words with ETag of page content."""
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.words = {i: f'word {i}' for i in range(1, COUNT + 1)}
+        self.replies = []
+
+    def page(self, offset: int) -> dict:
+        """Get the page of words."""
+        ids = sorted(self.words)[offset : offset + PAGE_SIZE]
+        has_next = offset + PAGE_SIZE < len(self.words)
+        return {
+            'count': len(self.words),
+            'next': page_url(offset + PAGE_SIZE) if has_next else None,
+            'previous': None,
+            'results': [
+                {'id': i, 'foreign_word': self.words[i], 'native_word': ''}
+                for i in ids
+            ],
+        }
+
+    async def get(
+        self, url: str, headers: dict | None = None
+    ) -> httpx.Response:
+        """Reply the page, or 304 if the page is not modified."""
+        offset = int(httpx.URL(url).params.get('offset', 0))
+        payload = self.page(offset)
+        etag = f'"{hash(str(payload))}"'
+        if headers and headers.get('If-None-Match') == etag:
+            self.replies.append(304)
+            return httpx.Response(304)
+        self.replies.append(200)
+        return httpx.Response(200, json=payload, headers={'ETag': etag})
+
+
+@pytest.fixture
+def server(monkeypatch: MonkeyPatch) -> FakeServer:
+    """Mock the http requests with fake server, fixture."""
+    server = FakeServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+    return server
+
+
+@pytest.fixture
+def mirror(tmp_path: pathlib.Path) -> DictionaryMirror:
+    """Return the mirror in temp dir, fixture."""
+    mirror = DictionaryMirror(str(tmp_path / 'mirror.db'))
+    yield mirror
+    mirror.close()
+
+
+def test_delta_sync(
+    mirror: DictionaryMirror,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the sync receives only the changed pages."""
+    assert not mirror.is_created
+
+    stats = event_loop.run_until_complete(mirror.sync(URL))
+    assert stats == (3, 3, COUNT, 0, True)
+    assert [e['foreign_word'] for e in mirror.entries(URL)] == [
+        f'word {i}' for i in range(1, COUNT + 1)
+    ]
+
+    # Nothing is changed.
+    stats = event_loop.run_until_complete(mirror.sync(URL))
+    assert stats == (3, 0, 0, 0, True)
+    assert server.replies[-3:] == [304, 304, 304]
+
+    # The word of last page is changed.
+    server.words[5] = 'changed'
+    stats = event_loop.run_until_complete(mirror.sync(URL))
+    assert stats == (3, 1, 1, 0, True)
+    assert mirror.entries(URL)[-1]['foreign_word'] == 'changed'
+
+    # The word is deleted on server.
+    del server.words[5]
+    stats = event_loop.run_until_complete(mirror.sync(URL))
+    assert stats.removed_rows == 1
+    assert len(mirror.entries(URL)) == COUNT - 1
+
+
+def test_failed_sync_keeps_entries(
+    mirror: DictionaryMirror,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the failed sync does not remove the entries."""
+    event_loop.run_until_complete(mirror.sync(URL))
+
+    async def error(*args: object, **kwargs: object) -> httpx.Response:
+        return httpx.Response(500)
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', error)
+    stats = event_loop.run_until_complete(mirror.sync(URL))
+    assert stats.is_complete is False
+    assert len(mirror.entries(URL)) == COUNT
+
+
+def test_not_modified_without_page(
+    mirror: DictionaryMirror,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the not modified page that is not mirrored fails."""
+
+    async def not_modified(*args: object, **kwargs: object) -> httpx.Response:
+        return httpx.Response(304)
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', not_modified)
+    stats = event_loop.run_until_complete(mirror.sync(URL))
+    assert stats.is_complete is False
+    assert stats.pages == 1
+
+
+def test_page_cache_store(mirror: DictionaryMirror) -> None:
+    """Test that the page dropped from memory is read from mirror."""
+    cache = PageCache(maxsize=1, store=mirror)
+    cache.put(CachedPage(URL, {'results': [{'id': 1}]}, etag='"v1"'))
+    cache.put(CachedPage(page_url(2), {'results': []}))
+    assert URL not in cache
+
+    page = cache.get(URL)
+    assert page.payload == {'results': [{'id': 1}]}
+    assert page.etag == '"v1"'
+
+    cache.invalidate(URL + '1/')
+    assert cache.get(URL) is None
+    assert mirror.entries(URL) == [{'id': 1}]
+
+
+def test_cold_start(
+    wse: WSE,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the list shows the mirrored page at once."""
+    event_loop.run_until_complete(dictionary_mirror.sync(URL))
+    page_cache.clear()
+
+    async def wait_response(*args: object, **kwargs: object) -> None:
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', wait_response)
+    box = wse.box_foreign_list
+    task = asyncio.ensure_future(box.populate_table(URL), loop=event_loop)
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    assert [row.foreign_word for row in box.table.data] == [
+        'word 1',
+        'word 2',
+    ]
+    task.cancel()
+
+
+def test_change_entries(mirror: DictionaryMirror) -> None:
+    """Test that the entries changed by forms are changed in mirror."""
+    entries = [{'id': 1, 'foreign_word': 'a', 'assessment': 3}, {'id': 2}]
+    mirror.put_page(CachedPage(URL, {'results': entries}))
+    version = mirror.version
+
+    mirror.update_entry(URL, {'id': '1', 'foreign_word': 'b'})
+    mirror.update_entry(URL, {'id': '3', 'foreign_word': 'c'})
+    assert mirror.entries(URL)[0] == {
+        'id': 1,
+        'foreign_word': 'b',
+        'assessment': 3,
+    }
+    assert len(mirror.entries(URL)) == 2
+
+    mirror.remove_entry(URL, '2')
+    assert [entry['id'] for entry in mirror.entries(URL)] == [1]
+    assert mirror.version > version
+
+    mirror.clear()
+    assert mirror.entries(URL) == []
+    assert mirror.get_page(URL) is None
+
+
+def test_forget_dictionary(
+    wse: WSE,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the dictionary of previous user is dropped."""
+    event_loop.run_until_complete(dictionary_mirror.sync(URL))
+    box = wse.box_foreign_list
+    event_loop.run_until_complete(box.populate_table(URL))
+    box.input_search.value = 'word'
+    event_loop.run_until_complete(box._mirror_indexing)
+    assert len(box.table.data) == COUNT
+
+    wse.forget_dictionary()
+
+    assert box.input_search.value == ''
+    assert len(box.table.data) == 0
+    assert len(box.search_index) == 0
+    assert box.current_pagination_url is None
+    assert URL not in page_cache
+    assert dictionary_mirror.entries(URL) == []
+
+
+def test_saved_entry(
+    wse: WSE,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the entry saved by form is changed in mirror."""
+    event_loop.run_until_complete(dictionary_mirror.sync(URL))
+    box = wse.box_foreign_list
+    box.handle_saved_entry(
+        {'id': '1', 'foreign_word': 'saved', 'native_word': 'б'}
+    )
+    assert dictionary_mirror.entries(URL)[0]['foreign_word'] == 'saved'
+    assert box.search_index.search('saved')[0]['id'] == '1'
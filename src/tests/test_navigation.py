@@ -0,0 +1,100 @@
+"""Test that the page navigation does not wait the server.
+
+The server responses are delayed. The page must be shown before any
+response is received, and the page data must be requested by the
+async client only, the sync client request blocks the event loop.
+The stall time is measured by ``benchmarks/bench_navigation.py``.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.app import WSE
+from wse.constants import (
+    FOREIGN_CREATE_BOX,
+    FOREIGN_LIST_BOX,
+    FOREIGN_MAIN_BOX,
+    FOREIGN_PARAMS_BOX,
+    GLOSSARY_CREATE_BOX,
+    GLOSSARY_LIST_BOX,
+    GLOSSARY_MAIN_BOX,
+    GLOSSARY_PARAMS_BOX,
+    LOGIN_BOX,
+    MAIN_BOX,
+)
+
+RESPONSE_DELAY = 0.01
+"""Delay of the server response, in seconds (`float`).
+"""
+
+
+class SlowServer:
+    """Count the requests and the delayed responses."""
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.sync_requests = 0
+        self.responses = 0
+
+    def send(self, request: httpx.Request, **_: object) -> httpx.Response:
+        """Reply the sync client without content."""
+        self.sync_requests += 1
+        self.responses += 1
+        return httpx.Response(204, request=request)
+
+    async def send_async(
+        self, request: httpx.Request, **_: object
+    ) -> httpx.Response:
+        """Reply the async client after delay without content."""
+        await asyncio.sleep(RESPONSE_DELAY)
+        self.responses += 1
+        return httpx.Response(204, request=request)
+
+
+@pytest.fixture
+def server(monkeypatch: MonkeyPatch) -> SlowServer:
+    """Mock the sync and async http clients, fixture."""
+    server = SlowServer()
+    monkeypatch.setattr(httpx.Client, 'send', server.send)
+    monkeypatch.setattr(httpx.AsyncClient, 'send', server.send_async)
+    return server
+
+
+@pytest.mark.parametrize(
+    'box_name',
+    [
+        MAIN_BOX,
+        LOGIN_BOX,
+        FOREIGN_MAIN_BOX,
+        FOREIGN_PARAMS_BOX,
+        FOREIGN_LIST_BOX,
+        FOREIGN_CREATE_BOX,
+        GLOSSARY_MAIN_BOX,
+        GLOSSARY_PARAMS_BOX,
+        GLOSSARY_LIST_BOX,
+        GLOSSARY_CREATE_BOX,
+    ],
+)
+def test_navigation(
+    box_name: str,
+    wse: WSE,
+    server: SlowServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the page is shown before the server response."""
+    source = wse.box_login if box_name == MAIN_BOX else wse.box_main
+    wse.main_window.content = source
+
+    async def navigate() -> None:
+        opening = source.goto_box_handler(source, box_name)
+        # The page is shown without waiting the data.
+        assert wse.main_window.content is getattr(wse, box_name)
+        assert server.responses == 0
+        if opening is not None:
+            await opening
+
+    event_loop.run_until_complete(navigate())
+    assert server.sync_requests == 0
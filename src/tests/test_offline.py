@@ -0,0 +1,186 @@
+"""Test the exercise tasks generated from the local mirror."""
+
+import asyncio
+import datetime
+import pathlib
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tests.utils import FixtureReader
+from wse.app import WSE
+from wse.contrib.mirror import DictionaryMirror, dictionary_mirror
+from wse.contrib.offline import LocalTaskGenerator
+from wse.contrib.page_cache import CachedPage
+
+URL = 'http://wselfedu.online/api/v1/glossary/'
+
+
+def days_ago(days: int) -> str:
+    """Get the ISO date of days ago."""
+    return (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+
+
+ENTRIES = [
+    {
+        'id': 1,
+        'term': 'old',
+        'definition': 'old term',
+        'category': 1,
+        'assessment': 0,
+        'created_at': days_ago(100),
+    },
+    {
+        'id': 2,
+        'term': 'recent',
+        'definition': 'recent term',
+        'category': 2,
+        'assessment': 0,
+        'created_at': days_ago(2),
+    },
+    {
+        'id': 3,
+        'term': 'known',
+        'definition': 'known term',
+        'category': 1,
+        'assessment': 12,
+        'created_at': days_ago(10),
+    },
+]
+
+
+def put_entries(mirror: DictionaryMirror) -> None:
+    """Write the entries to mirror."""
+    mirror.put_page(CachedPage(URL, {'next': None, 'results': ENTRIES}))
+
+
+@pytest.fixture
+def generator(tmp_path: pathlib.Path) -> LocalTaskGenerator:
+    """Return the generator of mirrored entries, fixture."""
+    mirror = DictionaryMirror(str(tmp_path / 'mirror.db'))
+    put_entries(mirror)
+    yield LocalTaskGenerator(
+        URL, 'term', 'definition', mirror=mirror, rng=random.Random(1)
+    )
+    mirror.close()
+
+
+@pytest.mark.parametrize(
+    'params, ids',
+    [
+        ({}, [1, 2, 3]),
+        ({'period_start_date': 'W1', 'period_end_date': 'DT'}, [2]),
+        ({'period_start_date': 'NC', 'period_end_date': 'D3'}, [1, 3]),
+        ({'category': 1}, [1, 3]),
+        ({'category': None, 'progress': 'S'}, [1, 2]),
+        ({'progress': 'K'}, [3]),
+        ({'count_first': 2, 'count_last': 0}, [1, 3]),
+        ({'count_first': 0, 'count_last': 1}, [2]),
+    ],
+)
+def test_lookup(
+    generator: LocalTaskGenerator, params: dict, ids: list[int]
+) -> None:
+    """Test the lookup conditions of the local tasks."""
+    assert sorted(e['id'] for e in generator.candidates(params)) == ids
+
+
+def test_generate(generator: LocalTaskGenerator) -> None:
+    """Test the task data."""
+    task = generator.generate({'progress': 'K'})
+    assert task == {
+        'id': 3,
+        'question_text': 'known',
+        'answer_text': 'known term',
+        'item_count': 1,
+        'assessment': 12,
+        'category': 1,
+    }
+    assert generator.generate({'category': 3}) is None
+
+
+def test_record(generator: LocalTaskGenerator) -> None:
+    """Test that the answer changes the study stage locally."""
+    params = {'progress': 'K'}
+    assert len(generator.candidates(params)) == 1
+
+    changes = generator.mirror.connection.total_changes
+    generator.record(3, 'not_know')
+    assert generator.candidates(params) == []
+    # The change is written to mirror by batch, not on answer.
+    assert generator.mirror.connection.total_changes == changes
+    generator.save()
+    assert generator.mirror.connection.total_changes == changes + 1
+    entry = generator.mirror.entries(URL)[2]
+    assert entry['assessment'] == 11
+
+    generator.record(3, 'know')
+    generator.record(3, 'know')
+    assert generator.entries['3']['assessment'] == 12
+
+
+@pytest.mark.parametrize(
+    'params, is_supported',
+    [
+        ({}, True),
+        ({'period_start_date': 'NC', 'period_end_date': 'DT'}, True),
+        ({'category': None, 'progress': 'A'}, True),
+        ({'period_start_date': 'W1', 'period_end_date': 'DT'}, False),
+        ({'period_start_date': 'NC', 'period_end_date': 'D3'}, False),
+        ({'category': 5}, False),
+        ({'progress': 'K'}, False),
+        ({'count_first': 0, 'count_last': 10}, False),
+    ],
+)
+def test_list_entries(
+    tmp_path: pathlib.Path, params: dict, is_supported: bool
+) -> None:
+    """Test that the tasks of list entries are requested on server.
+
+    The list endpoint replies the entries without the date, category
+    and assessment, the lookup by them is not supported.
+    """
+    mirror = DictionaryMirror(str(tmp_path / 'mirror.db'))
+    payload = FixtureReader('pagination_foreign_first.json').json()
+    mirror.put_page(CachedPage(URL, payload))
+    generator = LocalTaskGenerator(
+        URL, 'foreign_word', 'native_word', mirror=mirror
+    )
+
+    assert generator.supports(params) is is_supported
+    assert (generator.generate(params) is not None) is is_supported
+    mirror.close()
+
+
+@patch('wse.container.exercise.request_post_async', new_callable=AsyncMock)
+def test_exercise_offline(
+    request_post_async: AsyncMock,
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the exercise task is generated without request."""
+    put_entries(dictionary_mirror)
+    box = wse.box_glossary_exercise
+    box.task.params = {'progress': 'K'}
+
+    event_loop.run_until_complete(box.request_task())
+    assert box.task.question == 'known'
+    request_post_async.assert_not_called()
+
+
+def test_seeded_generator(tmp_path: pathlib.Path) -> None:
+    """Test that the seeded generator repeats the order of tasks."""
+    mirror = DictionaryMirror(str(tmp_path / 'mirror.db'))
+    put_entries(mirror)
+
+    orders = []
+    for _ in range(2):
+        generator = LocalTaskGenerator(
+            URL, 'term', 'definition', mirror=mirror, rng=random.Random(7)
+        )
+        orders.append([generator.generate({})['id'] for _ in range(10)])
+    mirror.close()
+
+    assert orders[0] == orders[1]
+    assert set(orders[0]) == {1, 2, 3}
@@ -0,0 +1,131 @@
+"""Test the cache of table pagination pages."""
+
+import asyncio
+
+import httpx
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.app import WSE
+from wse.contrib.page_cache import CachedPage, PageCache, page_cache
+
+URL = 'http://127.0.0.1/api/v1/foreign/'
+NEXT_URL = 'http://127.0.0.1/api/v1/foreign/?offset=20'
+
+
+def make_page(url: str, next_url: str | None, word: str) -> dict:
+    """Make the pagination page payload."""
+    return {
+        'count': 2,
+        'next': next_url,
+        'previous': None if next_url else URL,
+        'results': [{'id': 1, 'foreign_word': word, 'native_word': word}],
+    }
+
+
+class FakeServer:
+    """Reply the pagination pages with ETag, count the requests."""
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.pages = {
+            URL: make_page(URL, NEXT_URL, 'first'),
+            NEXT_URL: make_page(NEXT_URL, None, 'second'),
+        }
+        self.version = 1
+        self.requests = []
+
+    async def get(
+        self,
+        url: str,
+        headers: dict | None = None,
+    ) -> httpx.Response:
+        """Reply the page, or 304 if the page is not modified."""
+        if url not in self.pages:
+            return httpx.Response(404)
+        self.requests.append((url, headers))
+        etag = f'"v{self.version}"'
+        if headers and headers.get('If-None-Match') == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json=self.pages[url], headers={'ETag': etag}
+        )
+
+
+def test_lru() -> None:
+    """Test that the least recently used page is dropped."""
+    cache = PageCache(maxsize=2)
+    for url in ('a', 'b'):
+        cache.put(CachedPage(url, {}))
+    cache.get('a')
+    cache.put(CachedPage('c', {}))
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert len(cache) == 2
+
+
+def test_invalidate() -> None:
+    """Test that the change of entry drops the pages of collection."""
+    cache = PageCache()
+    cache.put(CachedPage(URL, {}))
+    cache.put(CachedPage(NEXT_URL, {}))
+    cache.put(CachedPage('http://127.0.0.1/api/v1/glossary/', {}))
+
+    cache.invalidate('http://127.0.0.1/api/v1/foreign/5/')
+    assert len(cache) == 1
+
+
+def test_validators() -> None:
+    """Test the headers of conditional request."""
+    page = CachedPage(URL, {}, etag='"v1"', last_modified='Mon')
+    assert page.validators == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon',
+    }
+    assert CachedPage(URL, {}).validators == {}
+
+
+def test_flip_pages(
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the flipped pages are shown from cache."""
+    server = FakeServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+    box = wse.box_foreign_list
+
+    event_loop.run_until_complete(box.populate_table(URL))
+    # Wait for the next page prefetch.
+    event_loop.run_until_complete(asyncio.sleep(0.01))
+    assert NEXT_URL in page_cache
+    assert [url for url, _ in server.requests] == [URL, NEXT_URL]
+
+    async def flip() -> str:
+        task = asyncio.ensure_future(box.populate_table(NEXT_URL))
+        await asyncio.sleep(0)
+        # The cached page is shown before the server response.
+        word = box.table.data[0].foreign_word
+        await task
+        return word
+
+    assert event_loop.run_until_complete(flip()) == 'second'
+    # The cached page is revalidated.
+    assert server.requests[-1] == (NEXT_URL, {'If-None-Match': '"v1"'})
+    assert box.current_pagination_url == NEXT_URL
+
+
+def test_changed_page_is_shown(
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the changed page replaces the cached page."""
+    server = FakeServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+    box = wse.box_foreign_list
+
+    event_loop.run_until_complete(box.populate_table(URL))
+    server.version = 2
+    server.pages[URL] = make_page(URL, NEXT_URL, 'changed')
+    event_loop.run_until_complete(box.populate_table(URL))
+    assert box.table.data[0].foreign_word == 'changed'
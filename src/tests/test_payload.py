@@ -0,0 +1,26 @@
+"""Test the decoding of the JSON payloads."""
+
+import httpx
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.contrib import payload
+
+PAYLOAD = {'count': 1, 'results': [{'id': 1, 'term': 'слово'}]}
+
+
+@pytest.mark.parametrize('backend', [payload.orjson, None])
+def test_round_trip(backend: object, monkeypatch: MonkeyPatch) -> None:
+    """Test that each backend decodes the encoded payload."""
+    monkeypatch.setattr(payload, 'orjson', backend)
+    document = payload.dumps(PAYLOAD)
+
+    assert isinstance(document, str)
+    assert payload.loads(document) == PAYLOAD
+    assert payload.loads(document.encode()) == PAYLOAD
+
+
+def test_decode_response() -> None:
+    """Test that the response body is decoded."""
+    response = httpx.Response(200, json=PAYLOAD)
+    assert payload.decode(response) == PAYLOAD
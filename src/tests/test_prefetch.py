@@ -0,0 +1,84 @@
+"""Test the prefetch of exercise tasks."""
+
+import asyncio
+from http import HTTPStatus
+
+from httpx import Response
+
+from wse.contrib.prefetch import TaskPrefetcher
+
+
+class FakeServer:
+    """Count the task requests, reply the numbered tasks."""
+
+    def __init__(self, status: int = HTTPStatus.OK) -> None:
+        """Construct the server."""
+        self.status = status
+        self.requests = []
+
+    async def fetch(self, params: dict) -> Response:
+        """Reply the next task."""
+        self.requests.append(params)
+        task_id = len(self.requests)
+        await asyncio.sleep(0)
+        return Response(self.status, json={'id': task_id})
+
+
+def test_prefetch(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the upcoming tasks are requested in advance."""
+    server = FakeServer()
+    prefetcher = TaskPrefetcher(server.fetch, size=2)
+    params = {'category': None}
+
+    response = event_loop.run_until_complete(prefetcher.get(params))
+    assert response.json() == {'id': 1}
+    assert len(prefetcher) == 2
+    assert len(server.requests) == 3
+
+    response = event_loop.run_until_complete(prefetcher.get(params))
+    assert response.json() == {'id': 2}
+    assert len(server.requests) == 4
+
+
+def test_invalidate_on_params_change(
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the buffer is dropped if the params are changed."""
+    server = FakeServer()
+    prefetcher = TaskPrefetcher(server.fetch, size=2)
+
+    event_loop.run_until_complete(prefetcher.get({'progress': 'S'}))
+    event_loop.run_until_complete(prefetcher.get({'progress': 'R'}))
+    assert server.requests[-1] == {'progress': 'R'}
+    assert prefetcher.params == {'progress': 'R'}
+
+    prefetcher.invalidate()
+    assert len(prefetcher) == 0
+    assert prefetcher.params is None
+
+
+def test_invalidate_on_no_task(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the buffer is dropped if there is no task."""
+    server = FakeServer(status=HTTPStatus.NO_CONTENT)
+    prefetcher = TaskPrefetcher(server.fetch, size=2)
+
+    response = event_loop.run_until_complete(prefetcher.get({}))
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert len(prefetcher) == 0
+
+
+def test_keep_request_on_cancel(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the request of cancelled call is reused by next."""
+    server = FakeServer()
+    prefetcher = TaskPrefetcher(server.fetch, size=1)
+
+    async def cancel_get() -> None:
+        waiting = asyncio.ensure_future(prefetcher.get({}))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+    event_loop.run_until_complete(cancel_get())
+    response = event_loop.run_until_complete(prefetcher.get({}))
+    assert response.json() == {'id': 1}
+    assert len(server.requests) == 2
@@ -0,0 +1,56 @@
+"""Test the spaced repetition scheduler."""
+
+import random
+
+from wse.contrib.scheduler import RepetitionScheduler
+
+
+def make_scheduler(seed: int, count: int = 10) -> RepetitionScheduler:
+    """Make the seeded scheduler of new items."""
+    scheduler = RepetitionScheduler(random.Random(seed))
+    scheduler.extend((i, 0) for i in range(count))
+    return scheduler
+
+
+def test_seeded_order() -> None:
+    """Test that the seeded scheduler repeats the order."""
+    first, second = make_scheduler(1), make_scheduler(1)
+    order = [first.next() for _ in range(30)]
+
+    assert order == [second.next() for _ in range(30)]
+    assert set(order) == {str(i) for i in range(10)}
+    other = make_scheduler(2)
+    assert order != [other.next() for _ in range(30)]
+
+
+def test_interval_by_assessment() -> None:
+    """Test that the unknown item is shown sooner than known one."""
+    scheduler = make_scheduler(1, count=20)
+    known, unknown = scheduler.next(), scheduler.next()
+    scheduler.record(known, 5)
+    scheduler.record(unknown, -1)
+
+    shown = [scheduler.next() for _ in range(30)]
+    # The item is due in 2 tasks, it may tie with the new item.
+    assert unknown in shown[:4]
+    assert known not in shown
+
+
+def test_remove() -> None:
+    """Test that the removed item is not shown."""
+    scheduler = make_scheduler(1, count=3)
+    item_id = scheduler.next()
+    scheduler.remove(item_id)
+
+    assert item_id not in scheduler
+    assert len(scheduler) == 2
+    assert item_id not in [scheduler.next() for _ in range(10)]
+
+
+def test_empty() -> None:
+    """Test that the empty scheduler has no next item."""
+    scheduler = RepetitionScheduler()
+    assert scheduler.next() is None
+    scheduler.extend([(1, 0)])
+    scheduler.remove(1)
+    assert scheduler.next() is None
@@ -0,0 +1,68 @@
+"""Test the mapping of the response items to the source rows."""
+
+import pytest
+
+from wse.source.foreign import WordSource
+from wse.source.glossary import TermSource
+from wse.source.schema import Field, RowSchema, identifier, text
+
+
+class Row:
+    """Row of the test schema."""
+
+    __slots__ = ('id', 'name')
+
+    def __init__(self, id: str, name: str) -> None:
+        """Construct the row."""
+        self.id = id
+        self.name = name
+
+
+SCHEMA = RowSchema(Row, [Field('id', identifier), Field('name', key='title')])
+
+
+def test_row_by_keys() -> None:
+    """Test that the row is mapped by keys, not by key order."""
+    row = SCHEMA.row({'title': 'apple', 'color': 'green', 'id': 6})
+    assert (row.id, row.name) == ('6', 'apple')
+    assert SCHEMA.values({'id': '7', 'title': None}) == ('7', '')
+
+
+@pytest.mark.parametrize(
+    'item',
+    [
+        {'id': 1},
+        {'id': True, 'title': 'apple'},
+        {'id': None, 'title': 'apple'},
+        {'id': 1, 'title': ['apple']},
+    ],
+)
+def test_malformed_item(item: dict) -> None:
+    """Test that the malformed item is skipped and counted."""
+    mapped = SCHEMA.map([{'id': 1, 'title': 'apple'}, item])
+    assert [row.id for row in mapped.rows] == ['1']
+    assert mapped.malformed == 1
+
+
+@pytest.mark.parametrize(
+    'source, item',
+    [
+        (WordSource(), {'native_word': 'б', 'foreign_word': 'a', 'id': 7}),
+        (TermSource(), {'definition': 'б', 'term': 'a', 'id': 7}),
+    ],
+)
+def test_source_schema(source: WordSource | TermSource, item: dict) -> None:
+    """Test that the source loads the well-formed items."""
+    source.load_items([item, {'id': 8}])
+
+    assert len(source) == 1
+    assert source.malformed_count == 1
+    row = source.get_by_id('7')
+    assert [getattr(row, name) for name in source.accessors] == ['a', 'б']
+
+
+def test_text() -> None:
+    """Test the conversion of text."""
+    assert text('word') == 'word'
+    with pytest.raises(TypeError):
+        text(1)
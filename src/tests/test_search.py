@@ -0,0 +1,339 @@
+"""Test the search of the dictionary entries."""
+
+import asyncio
+
+import httpx
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.app import WSE
+from wse.contrib.mirror import dictionary_mirror
+from wse.contrib.page_cache import CachedPage
+from wse.contrib.search import SearchIndex, normalize
+
+URL = 'http://127.0.0.1/api/v1/foreign/'
+
+WORDS = [
+    {'id': 1, 'foreign_word': 'Apple', 'native_word': 'яблоко'},
+    {'id': 2, 'foreign_word': 'application', 'native_word': 'заявление'},
+    {'id': 3, 'foreign_word': 'pineapple', 'native_word': 'ананас'},
+    {'id': 4, 'foreign_word': 'tree', 'native_word': 'ёлка'},
+]
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    """Return the index of words, fixture."""
+    index = SearchIndex(['foreign_word', 'native_word'])
+    index.extend(WORDS)
+    return index
+
+
+def ids(entries: list[dict]) -> list[int]:
+    """Get ids of entries."""
+    return [entry['id'] for entry in entries]
+
+
+def test_normalize() -> None:
+    """Test the folding of case, diacritics and Latin homoglyphs."""
+    assert normalize('ЁЛКА') == normalize('елка')
+    assert normalize('Café') == normalize('cafe')
+    # The Latin 'c' and 'o' typed instead of Cyrillic ones.
+    assert normalize('coк') == normalize('сок')
+
+
+@pytest.mark.parametrize(
+    'query, expected',
+    [
+        ('a', [1, 2, 3]),
+        ('ap', [1, 2]),
+        ('APPL', [1, 2, 3]),
+        ('apple', [1, 3]),
+        ('apple ябл', [1]),
+        ('елк', [4]),
+        ('ёлка', [4]),
+        ('nothing', []),
+        ('  ', []),
+    ],
+)
+def test_search(index: SearchIndex, query: str, expected: list) -> None:
+    """Test the prefix and part of word search."""
+    assert ids(index.search(query)) == expected
+
+
+def test_limit(index: SearchIndex) -> None:
+    """Test the limit of found entries."""
+    assert len(index.search('appl', limit=2)) == 2
+
+
+def test_limit_order() -> None:
+    """Test that the limit keeps the earliest added entries."""
+    index = SearchIndex(['foreign_word'])
+    index.extend({'id': i, 'foreign_word': f'apple {i}'} for i in range(500))
+    assert ids(index.search('apple', limit=5)) == [0, 1, 2, 3, 4]
+    assert ids(index.search('ap', limit=3)) == [0, 1, 2]
+
+
+def test_matches(index: SearchIndex) -> None:
+    """Test the check of the entry that is not indexed."""
+    entry = {'id': 5, 'foreign_word': 'Apricot', 'native_word': 'абрикос'}
+    assert index.matches(entry, 'apr')
+    assert not index.matches(entry, 'apple')
+    assert not index.matches(entry, '  ')
+    assert 5 not in index
+
+
+def test_add_and_remove(index: SearchIndex) -> None:
+    """Test that the entry is replaced and removed."""
+    index.add({'id': 1, 'foreign_word': 'pear', 'native_word': 'груша'})
+    assert ids(index.search('apple')) == [3]
+    assert ids(index.search('pear')) == [1]
+
+    index.remove(1)
+    assert index.search('pear') == []
+    assert 1 not in index
+    assert len(index) == 3
+
+
+def test_search_handler(
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test the search box of the list page."""
+    page = {'next': None, 'previous': None, 'results': WORDS[:2]}
+    # The mirror has the entries that are not received yet.
+    dictionary_mirror.put_page(
+        CachedPage(f'{URL}?offset=2', {'next': None, 'results': WORDS[2:]})
+    )
+
+    async def get(*args: object, **kwargs: object) -> httpx.Response:
+        return httpx.Response(200, json=page)
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', get)
+    box = wse.box_foreign_list
+    monkeypatch.setattr(box, 'source_url', URL)
+    event_loop.run_until_complete(box.populate_table())
+
+    box.input_search.value = 'apple'
+    box.search_handler(box.input_search)
+    assert box.is_search
+    # The mirrored entries are not indexed yet.
+    assert [row.id for row in box.table.data] == ['1']
+    event_loop.run_until_complete(box._mirror_indexing)
+    assert [row.id for row in box.table.data] == ['1', '3']
+
+    box.input_search.value = ''
+    box.search_handler(box.input_search)
+    assert box.table.data is box.entry
+    assert len(box.table.data) == 2
+
+
+def test_delete_found_entry(
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the entry deleted while searching is removed."""
+    page = {'next': None, 'previous': None, 'results': WORDS[:2]}
+
+    async def get(*args: object, **kwargs: object) -> httpx.Response:
+        return httpx.Response(200, json=page)
+
+    async def delete(*args: object, **kwargs: object) -> httpx.Response:
+        return httpx.Response(204)
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', get)
+    monkeypatch.setattr(httpx.AsyncClient, 'delete', delete)
+    monkeypatch.setattr('wse.general.table.SERVER_SEARCH', False)
+    box = wse.box_foreign_list
+    monkeypatch.setattr(box, 'source_url', URL)
+    event_loop.run_until_complete(box.populate_table())
+
+    box.input_search.value = 'apple'
+    box.search_handler(box.input_search)
+    box.table._impl.simulate_selection(0)
+    event_loop.run_until_complete(box.delete_handler(box.table))
+    assert len(box.table.data) == 0
+
+    box.clear_search()
+    assert [row.id for row in box.table.data] == ['2']
+
+
+def test_mirror_index_batches(
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the mirrored entries are indexed by batches."""
+    monkeypatch.setattr('wse.general.table.SEARCH_INDEX_BATCH', 1)
+    monkeypatch.setattr('wse.general.table.SERVER_SEARCH', False)
+    dictionary_mirror.put_page(
+        CachedPage(URL, {'next': None, 'results': WORDS})
+    )
+    box = wse.box_foreign_list
+    monkeypatch.setattr(box, 'source_url', URL)
+
+    box.input_search.value = 'apple'
+    box.search_handler(box.input_search)
+    # The keystroke does not read the mirror.
+    assert len(box.search_index) == 0
+
+    # The batch is indexed on each step of the event loop.
+    indexing = box.index_mirrored_entries()
+    indexing.send(None)
+    assert len(box.search_index) == 1
+    assert [row.id for row in box.table.data] == []
+    indexing.close()
+
+    event_loop.run_until_complete(box._mirror_indexing)
+    assert len(box.search_index) == len(WORDS)
+    assert [row.id for row in box.table.data] == ['1', '3']
+
+
+class SearchServer:
+    """Reply the words found by the search parameter after delay."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Construct the server."""
+        self.delay = delay
+        self.queries = []
+        self.cancelled = []
+
+    async def get(self, url: str, **kwargs: object) -> httpx.Response:
+        """Reply the found words."""
+        query = httpx.URL(url).params.get('search')
+        if query is None:
+            # Other requests of the app.
+            return httpx.Response(404)
+        self.queries.append(query)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(query)
+            raise
+        results = [
+            {'id': 10, 'foreign_word': f'server {query}', 'native_word': ''}
+        ]
+        return httpx.Response(200, json={'next': None, 'results': results})
+
+
+@pytest.fixture
+def search_box(wse: WSE, monkeypatch: MonkeyPatch) -> object:
+    """Return the list page with short debounce delay, fixture."""
+    monkeypatch.setattr('wse.general.table.SEARCH_DEBOUNCE', 0.01)
+    return wse.box_foreign_list
+
+
+def type_query(box: object, query: str) -> None:
+    """Type the query to the search box."""
+    box.input_search.value = query
+    box.search_handler(box.input_search)
+
+
+def test_server_search_debounce(
+    search_box: object,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the keystrokes make one request of the last query."""
+    server = SearchServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+
+    for query in ('a', 'ap', 'app'):
+        type_query(search_box, query)
+    event_loop.run_until_complete(asyncio.sleep(0.05))
+
+    assert server.queries == ['app']
+    assert [row.foreign_word for row in search_box.table.data] == [
+        'server app'
+    ]
+
+
+def test_server_search_cancel(
+    search_box: object,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the superseded request is cancelled."""
+    server = SearchServer(delay=0.1)
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+
+    type_query(search_box, 'old')
+    event_loop.run_until_complete(asyncio.sleep(0.05))
+    assert server.queries == ['old']
+
+    type_query(search_box, 'new')
+    event_loop.run_until_complete(asyncio.sleep(0.2))
+
+    assert server.cancelled == ['old']
+    assert [row.foreign_word for row in search_box.table.data] == [
+        'server new'
+    ]
+
+
+def test_stale_response(
+    search_box: object,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the response of previous query is not shown."""
+    server = SearchServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+    monkeypatch.setattr('wse.general.table.SERVER_SEARCH', False)
+    type_query(search_box, 'new')
+
+    search_box._search_number = 2
+    event_loop.run_until_complete(search_box.server_search('old', 1))
+    assert server.queries == ['old']
+    assert len(search_box.table.data) == 0
+
+    # The search is cleared while waiting for response.
+    search_box.clear_search()
+    event_loop.run_until_complete(search_box.server_search('new', 2))
+    assert len(search_box.found_entries) == 0
+
+
+def test_server_ignores_search(
+    search_box: object,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the unfiltered server page is checked by query."""
+
+    async def get(
+        _: httpx.AsyncClient, url: str, **kwargs: object
+    ) -> httpx.Response:
+        if httpx.URL(url).params.get('search') is None:
+            return httpx.Response(404)
+        return httpx.Response(200, json={'next': None, 'results': WORDS})
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', get)
+    search_box.search_index.add(WORDS[0])
+
+    type_query(search_box, 'apple')
+    event_loop.run_until_complete(asyncio.sleep(0.05))
+
+    # The local entry is kept with the server entries found by query.
+    assert [row.id for row in search_box.table.data] == ['1', '3']
+
+
+def test_server_search_error(
+    search_box: object,
+    event_loop: asyncio.AbstractEventLoop,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the failed server search keeps the local entries."""
+
+    async def get(*args: object, **kwargs: object) -> httpx.Response:
+        raise httpx.ReadTimeout('timeout')
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', get)
+    search_box.search_index.add(WORDS[0])
+
+    type_query(search_box, 'apple')
+    task = search_box._search_task
+    event_loop.run_until_complete(task)
+
+    assert task.exception() is None
+    assert [row.id for row in search_box.table.data] == ['1']
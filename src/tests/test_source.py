@@ -0,0 +1,146 @@
+"""Test the table entries sources."""
+
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from wse.general.table import BaseTable
+from wse.source.foreign import WordSource
+from wse.source.glossary import TermSource
+
+WORDS = [(str(i), f'word {i}', f'слово {i}') for i in range(5)]
+TERMS = [(str(i), f'term {i}', f'definition {i}') for i in range(5)]
+
+ROW_BYTES_BUDGET = 80
+"""Memory budget of the loaded source row, in bytes (`int`).
+"""
+
+
+class Recorder:
+    """Record the source notifications."""
+
+    def __init__(self) -> None:
+        """Construct the recorder."""
+        self.notifications = []
+
+    def __getattr__(self, notification: str) -> object:
+        """Record the notification."""
+        return lambda **kwargs: self.notifications.append(notification)
+
+
+@pytest.mark.parametrize(
+    'source, entries',
+    [
+        (WordSource(), WORDS),
+        (TermSource(), TERMS),
+    ],
+)
+def test_load(source: WordSource | TermSource, entries: list) -> None:
+    """Test that the bulk load emits single clear and refresh."""
+    recorder = Recorder()
+    source.add_entry(entries[0])
+    source.add_listener(recorder)
+
+    source.load(entries)
+
+    assert len(source) == len(entries)
+    assert source.index(source[3]) == 3
+    assert recorder.notifications == ['clear', 'refresh']
+
+
+@pytest.mark.parametrize(
+    'source, items',
+    [
+        (WordSource(), [{'id': 7, 'foreign_word': 'a', 'native_word': 'б'}]),
+        (TermSource(), [{'id': 7, 'term': 'a', 'definition': 'б'}]),
+    ],
+)
+def test_load_items(source: WordSource | TermSource, items: list) -> None:
+    """Test that the rows are built from the response items."""
+    recorder = Recorder()
+    source.add_listener(recorder)
+
+    source.load_items(items)
+
+    row = source.get_by_id('7')
+    assert [getattr(row, name) for name in source.accessors] == ['a', 'б']
+    assert recorder.notifications == ['clear', 'refresh']
+
+
+def test_add_entry_index() -> None:
+    """Test the index of the inserted entry."""
+    source = WordSource()
+    indexes = []
+    source.notify = lambda _, **kwargs: indexes.append(kwargs['index'])
+
+    for entry in WORDS:
+        source.add_entry(entry)
+    assert indexes == list(range(len(WORDS)))
+
+
+def test_table_refresh() -> None:
+    """Test that the table shows the bulk loaded entries."""
+    source = WordSource()
+    table = BaseTable(
+        headings=['foreign', 'native'],
+        data=source,
+        accessors=source.accessors,
+    )
+    with patch.object(table._impl, 'change_source') as change_source:
+        source.load(WORDS)
+
+    change_source.assert_called_once_with(source=source)
+    assert [row.foreign_word for row in table.data] == [
+        word for _, word, _ in WORDS
+    ]
+
+
+@pytest.mark.parametrize(
+    'source, entry',
+    [
+        (WordSource(), WORDS[0]),
+        (TermSource(), TERMS[0]),
+    ],
+)
+def test_row_memory(source: WordSource | TermSource, entry: tuple) -> None:
+    """Test the memory per row of the large vocabulary."""
+    rows = 10_000
+    entries = [entry] * rows
+
+    tracemalloc.start()
+    try:
+        source.load(entries)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert size / rows < ROW_BYTES_BUDGET
+
+
+@pytest.mark.parametrize(
+    'source, entries',
+    [
+        (WordSource(), WORDS),
+        (TermSource(), TERMS),
+    ],
+)
+def test_id_index(source: WordSource | TermSource, entries: list) -> None:
+    """Test the look up, update and remove of entry by id."""
+    source.load(entries)
+    recorder = Recorder()
+    source.add_listener(recorder)
+
+    removed = source.remove_by_id('1')
+    assert removed is not None
+    assert source.get_by_id('1') is None
+    assert [source.index(row) for row in source] == list(range(4))
+    assert source.get_by_id('4') is source[3]
+
+    row = source.update_entry(('2', 'new', 'новое'))
+    assert row is source.get_by_id('2')
+    assert source.index(row) == 1
+    assert source.update_entry(('99', 'new', 'новое')) is None
+    assert source.remove_by_id('99') is None
+
+    assert recorder.notifications == ['pre_remove', 'remove', 'change']
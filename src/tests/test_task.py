@@ -0,0 +1,88 @@
+"""Test the exercise task and the batch of tasks."""
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+from httpx import Response
+
+from wse.app import WSE
+from wse.constants import TASK_PREFETCH_SIZE
+from wse.contrib.task import Task
+
+TASK_1 = {'id': 1, 'question_text': 'question 1', 'answer_text': 'answer 1'}
+TASK_2 = {'id': 2, 'question_text': 'question 2', 'answer_text': 'answer 2'}
+
+
+def test_task_queue() -> None:
+    """Test the queue of upcoming tasks."""
+    task = Task()
+    assert task.next() is False
+
+    task.extend([TASK_1, TASK_2])
+    assert len(task) == 2
+    assert task.next() is True
+    assert task.question == 'question 1'
+    assert task.next() is True
+    assert task.item_id == 2
+    assert task.next() is False
+    assert task.answer == 'answer 2'
+
+
+def test_task_params_change_clears_queue() -> None:
+    """Test that the queue is cleared if the params are changed."""
+    task = Task()
+    task.params = {'progress': 'S'}
+    task.extend([TASK_1])
+
+    task.params = {'progress': 'S'}
+    assert len(task) == 1
+
+    task.params = {'progress': 'R'}
+    assert len(task) == 0
+
+
+def test_to_tasks(wse: WSE) -> None:
+    """Test the batch support detection by response payload."""
+    box = wse.box_glossary_exercise
+    assert box.is_batch_supported is None
+
+    assert box.to_tasks(TASK_1) == [TASK_1]
+    assert box.is_batch_supported is False
+
+    assert box.to_tasks({'tasks': [TASK_1, TASK_2]}) == [TASK_1, TASK_2]
+    assert box.is_batch_supported is True
+    assert box.prefetcher.size == 1
+
+    # The server without batch support gets the single tasks ahead.
+    assert box.to_tasks(TASK_2) == [TASK_2]
+    assert box.is_batch_supported is False
+    assert box.prefetcher.size == TASK_PREFETCH_SIZE
+
+
+@patch('wse.container.exercise.request_post_async', new_callable=AsyncMock)
+def test_fetch_task_fallback(
+    request_post_async: AsyncMock,
+    wse: WSE,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test the fallback to single task if batch is rejected."""
+    box = wse.box_glossary_exercise
+    request_post_async.side_effect = [
+        Response(HTTPStatus.BAD_REQUEST),
+        Response(HTTPStatus.OK, json=TASK_1),
+        Response(HTTPStatus.OK, json=TASK_2),
+    ]
+    params = {'progress': 'S'}
+
+    response = event_loop.run_until_complete(box.fetch_task(params))
+    assert response.json() == TASK_1
+    assert box.is_batch_supported is False
+    assert request_post_async.call_args_list[0].args[1] == {
+        'progress': 'S',
+        'batch_size': 10,
+    }
+
+    # The batch is not requested anymore.
+    event_loop.run_until_complete(box.fetch_task(params))
+    assert request_post_async.call_args.args[1] == params
@@ -0,0 +1,132 @@
+"""Test the event timer."""
+
+import asyncio
+
+import pytest
+
+from tests.utils import FakeClock
+from wse.contrib.timer import Timer
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return the fake clock, fixture."""
+    return FakeClock()
+
+
+async def started(timer: Timer, timeout: float | None = None) -> asyncio.Task:
+    """Start the timer in background."""
+    task = asyncio.ensure_future(timer.start(timeout))
+    await asyncio.sleep(0)
+    return task
+
+
+def test_timeout(
+    clock: FakeClock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the timer expires by the clock time."""
+
+    async def count_down() -> None:
+        timer = Timer(timeout=5, clock=clock)
+        task = await started(timer)
+        tasks = len(asyncio.all_tasks())
+
+        clock.advance(4.5)
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert timer.remaining == 0.5
+        # The countdown does not create the task.
+        assert len(asyncio.all_tasks()) == tasks
+
+        clock.advance(0.5)
+        await asyncio.sleep(0)
+        assert task.done()
+        assert not timer.is_timer()
+        assert timer.remaining is None
+
+    event_loop.run_until_complete(count_down())
+
+
+def test_pause(
+    clock: FakeClock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the pause keeps the remaining time."""
+
+    async def count_down() -> None:
+        timer = Timer(timeout=5, clock=clock)
+        task = await started(timer)
+
+        clock.advance(3)
+        timer.on_pause()
+        assert clock.pending == 0
+        clock.advance(60)
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert timer.remaining == 2
+
+        timer.unpause()
+        clock.advance(1.5)
+        await asyncio.sleep(0)
+        assert not task.done()
+        clock.advance(0.5)
+        await asyncio.sleep(0)
+        assert task.done()
+
+    event_loop.run_until_complete(count_down())
+
+
+def test_start_paused(
+    clock: FakeClock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the paused timer starts countdown on unpause."""
+
+    async def count_down() -> None:
+        timer = Timer(clock=clock)
+        timer.on_pause()
+        task = await started(timer, timeout=2)
+        clock.advance(10)
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert timer.remaining == 2
+
+        timer.unpause()
+        clock.advance(2)
+        await asyncio.sleep(0)
+        assert task.done()
+
+    event_loop.run_until_complete(count_down())
+
+
+def test_cancel(
+    clock: FakeClock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the cancelled timer drops the deadline callback."""
+
+    async def count_down() -> None:
+        timer = Timer(timeout=5, clock=clock)
+        task = await started(timer)
+        timer.cancel()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert clock.pending == 0
+
+        # The cancelled waiting drops the countdown.
+        task = await started(timer)
+        task.cancel()
+        await asyncio.sleep(0)
+        assert not timer.is_timer()
+        assert clock.pending == 0
+
+    event_loop.run_until_complete(count_down())
+
+
+def test_event_loop_clock(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Test that the timer counts down by event loop without clock."""
+    timer = Timer(timeout=0.01)
+    start = event_loop.time()
+    event_loop.run_until_complete(timer.start())
+    assert event_loop.time() - start >= 0.01
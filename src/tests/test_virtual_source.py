@@ -0,0 +1,279 @@
+"""Test the virtual source of all entries of the collection."""
+
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from wse.app import WSE
+from wse.source.foreign import WordSource
+from wse.source.virtual import VirtualSource
+
+URL = 'http://127.0.0.1/api/v1/foreign/'
+COUNT = 50_000
+
+
+class FakeServer:
+    """Reply the chunks of the large dictionary by limit and offset."""
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.requests = []
+
+    async def get(self, url: str, **kwargs: object) -> httpx.Response:
+        """Reply the chunk of words."""
+        query = parse_qs(urlsplit(url).query)
+        if not query:
+            return httpx.Response(404)
+        limit = int(query['limit'][0])
+        offset = int(query['offset'][0])
+        self.requests.append(offset)
+        results = [
+            {'id': i, 'foreign_word': f'word {i}', 'native_word': f'{i}'}
+            for i in range(offset, min(offset + limit, COUNT))
+        ]
+        return httpx.Response(200, json={'count': COUNT, 'results': results})
+
+
+@pytest.fixture
+def server(monkeypatch: MonkeyPatch) -> FakeServer:
+    """Mock the http requests with fake server, fixture."""
+    server = FakeServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+    return server
+
+
+@pytest.fixture
+def source(
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> VirtualSource:
+    """Return the loaded source, fixture."""
+    source = VirtualSource(
+        WordSource.schema, URL, ['foreign_word', 'native_word'], max_chunks=3
+    )
+    event_loop.run_until_complete(source.load())
+    return source
+
+
+def test_load(source: VirtualSource, server: FakeServer) -> None:
+    """Test that the source length is the count of server entries."""
+    assert len(source) == COUNT
+    assert source[0].foreign_word == 'word 0'
+    assert source.chunk_count == 1
+    with pytest.raises(IndexError):
+        source[COUNT]
+
+
+def test_fetch_on_access(
+    source: VirtualSource,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the row chunk is requested on first access."""
+    refreshed = []
+
+    class Listener:
+        def refresh(self) -> None:
+            refreshed.append(True)
+
+    source.add_listener(Listener())
+
+    row = source[25_050]
+    assert row.foreign_word is None
+    assert source[25_099] is not None
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    assert row.foreign_word == 'word 25050'
+    assert source.index(row) == 25_050
+    assert server.requests == [0, 25_000]
+    # The received chunk is one notification.
+    assert len(refreshed) == 1
+
+
+def test_malformed_item(
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the malformed item keeps the blank row."""
+    results = [{'id': 1, 'foreign_word': 'a', 'native_word': 'б'}, {'id': 2}]
+
+    async def get(*args: object, **kwargs: object) -> httpx.Response:
+        return httpx.Response(200, json={'count': 2, 'results': results})
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', get)
+    source = VirtualSource(WordSource.schema, URL, ['foreign_word'])
+    event_loop.run_until_complete(source.load())
+
+    assert source[0].foreign_word == 'a'
+    assert source[1].foreign_word is None
+    assert source.malformed_count == 1
+
+
+def test_bounded_chunks(
+    source: VirtualSource,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the scroll of all rows keeps the limited chunks."""
+    for index in range(len(source)):
+        source[index]
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    assert source.chunk_count == 3
+    # The requests of the dropped chunks are cancelled.
+    assert len(server.requests) <= 1 + source.chunk_count
+    assert source[COUNT - 1].foreign_word == f'word {COUNT - 1}'
+
+
+def test_held_rows(
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the rows held by table backend are filled.
+
+    The backend reads every row on refresh, the chunks of held rows
+    are dropped from cache, but the rows are filled.
+    """
+    source = VirtualSource(
+        WordSource.schema, URL, ['foreign_word'], chunk_size=1000
+    )
+    event_loop.run_until_complete(source.load())
+
+    rows = [source[index] for index in range(len(source))]
+    event_loop.run_until_complete(asyncio.sleep(0.01))
+
+    assert source.chunk_count == source.max_chunks
+    assert all(row.foreign_word is not None for row in rows)
+    assert len(server.requests) == COUNT // 1000
+    # The row dropped with its chunk is the same row on next access.
+    assert source[0] is rows[0]
+    assert source.index(rows[0]) == 0
+
+
+class BackendServer:
+    """Reply the chunks of dictionary, count the requests at once."""
+
+    count = 2000
+
+    def __init__(self) -> None:
+        """Construct the server."""
+        self.offsets = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get(self, url: str, **kwargs: object) -> httpx.Response:
+        """Reply the chunk of words after the event loop steps."""
+        query = parse_qs(urlsplit(url).query)
+        limit = int(query['limit'][0])
+        offset = int(query['offset'][0])
+        self.offsets.append(offset)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.active -= 1
+        if offset == 1900:
+            raise httpx.ReadTimeout('timeout')
+        results = [
+            {'id': i, 'foreign_word': f'word {i}', 'native_word': f'{i}'}
+            for i in range(offset, min(offset + limit, self.count))
+        ]
+        return httpx.Response(
+            200, json={'count': self.count, 'results': results}
+        )
+
+
+def test_read_all_rows(
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test the backend that reads every row on each refresh.
+
+    The chunk requests at once are limited, the filled held rows are
+    not requested again, the failed request leaves the rows blank.
+    """
+    server = BackendServer()
+    monkeypatch.setattr(httpx.AsyncClient, 'get', server.get)
+    source = VirtualSource(
+        WordSource.schema,
+        URL,
+        ['foreign_word'],
+        max_chunks=3,
+        max_fetches=4,
+    )
+    event_loop.run_until_complete(source.load())
+    rows = []
+
+    class Backend:
+        def refresh(self) -> None:
+            rows[:] = [source[index] for index in range(len(source))]
+
+    source.add_listener(Backend())
+
+    async def receive_all() -> None:
+        source.notify('refresh')
+        while source._fetching:
+            await asyncio.sleep(0)
+
+    event_loop.run_until_complete(receive_all())
+
+    assert server.max_active == 4
+    assert sorted(server.offsets) == list(range(0, server.count, 100))
+    assert all(row.foreign_word is not None for row in rows[:1900])
+    assert all(row.foreign_word is None for row in rows[1900:])
+    assert source.index(rows[1000]) == 1000
+    assert source.get_by_id('1000') is rows[1000]
+
+
+def test_fetch_again(
+    monkeypatch: MonkeyPatch,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test that the cancelled request keeps the next one of chunk."""
+    released = asyncio.Event()
+    results = [{'id': 1, 'foreign_word': 'a', 'native_word': 'б'}]
+
+    async def get(*args: object, **kwargs: object) -> httpx.Response:
+        await released.wait()
+        return httpx.Response(200, json={'count': 100, 'results': results})
+
+    monkeypatch.setattr(httpx.AsyncClient, 'get', get)
+    source = VirtualSource(
+        WordSource.schema, URL, ['foreign_word'], chunk_size=10
+    )
+    released.set()
+    event_loop.run_until_complete(source.load())
+    released.clear()
+
+    source[50]
+    source._cancel_fetch(5)
+    source._fetch_chunk(5)
+    task = source._fetching[5]
+    event_loop.run_until_complete(asyncio.sleep(0.01))
+    assert source._fetching[5] is task
+
+    released.set()
+    event_loop.run_until_complete(task)
+    assert 5 not in source._fetching
+
+
+def test_scroll_all_handler(
+    wse: WSE,
+    server: FakeServer,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test the switch of table between all entries and page."""
+    box = wse.box_foreign_list
+    btn = box._btn_scroll_all
+    assert btn.text == 'Все'
+
+    event_loop.run_until_complete(btn.on_press())
+    assert box.table.data is box.all_entries
+    assert len(box.table.data) == COUNT
+    assert box._btn_next.enabled is False
+
+    event_loop.run_until_complete(btn.on_press())
+    assert box.table.data is box.entry
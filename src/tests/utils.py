@@ -1,8 +1,11 @@
 """Utils for testing."""
 
+import heapq
 import json
 import os
 import pathlib
+from collections.abc import Callable
+from http import HTTPStatus
 
 
 class FixtureReader:
@@ -14,6 +17,12 @@ class FixtureReader:
     module_dir = pathlib.Path(__file__).parent
     """Current module dir path (`str`).
     """
+    status_code = HTTPStatus.OK
+    """Status code of the http response (`int`).
+    """
+    headers = {}
+    """Headers of the http response (`dict`).
+    """
 
     def __init__(self, fixture: str) -> None:
         """Construct the reader."""
@@ -29,6 +38,12 @@ class FixtureReader:
         """Return the url."""
         return ''
 
+    @property
+    def content(self) -> bytes:
+        """Return the fixture as response body (`bytes`, reade-only)."""
+        with open(self.fixture_path, 'rb') as file:
+            return file.read()
+
     def json(self) -> dict:
         """Reade the fixture.
 
@@ -37,3 +52,61 @@ class FixtureReader:
         with open(self.fixture_path, 'r') as file:
             fixture = json.load(file)
         return fixture
+
+
+class FakeHandle:
+    """Handle of the callback scheduled on the fake clock."""
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        """Construct the handle."""
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the callback call."""
+        self.cancelled = True
+
+
+class FakeClock:
+    """Clock of the controlled time, for the timer.
+
+    The time is moved forward by :meth:`advance`, the callbacks of the
+    passed time are called in order of time.
+
+    Usage::
+
+        clock = FakeClock()
+        timer = Timer(timeout=5, clock=clock)
+        ...
+        clock.advance(5)
+    """
+
+    def __init__(self) -> None:
+        """Construct the clock."""
+        self.now = 0.0
+        self._calls: list[tuple[float, int, FakeHandle]] = []
+        self._count = 0
+
+    @property
+    def pending(self) -> int:
+        """Count of the scheduled callbacks (`int`, reade-only)."""
+        return sum(not handle.cancelled for *_, handle in self._calls)
+
+    def time(self) -> float:
+        """Get the current time, in seconds."""
+        return self.now
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> FakeHandle:
+        """Schedule the callback to call at the time."""
+        handle = FakeHandle(callback)
+        heapq.heappush(self._calls, (when, self._count, handle))
+        self._count += 1
+        return handle
+
+    def advance(self, seconds: float) -> None:
+        """Move the time forward, call the callbacks of passed time."""
+        self.now += seconds
+        while self._calls and self._calls[0][0] <= self.now:
+            *_, handle = heapq.heappop(self._calls)
+            if not handle.cancelled:
+                handle.callback()
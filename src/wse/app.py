@@ -1,35 +1,44 @@
 """WSE application."""
 
+import asyncio
+from urllib.parse import urljoin
+
 import toga
 
-from wse import page
 from wse.constants import (
+    DICTIONARY_SYNC,
+    DICTIONARY_SYNC_DELAY,
+    FOREIGN_PATH,
+    GLOSSARY_PATH,
+    HOST_API,
+    PAGE_PREWARM,
+    PAGE_PREWARM_DELAY,
     SCREEN_SIZE,
 )
-from wse.general.box_page import BoxApp
+from wse.general.box_page import BoxApp, LazyBox
 
 
 class WSE(toga.App):
     """WSE application."""
 
-    # Page boxes.
-    box_main: page.MainBox
+    # Page boxes, created on first access.
+    box_main = LazyBox('wse.page.MainBox')
     # Foreign language study page boxes.
-    box_foreign_main: page.MainForeignPage
-    box_foreign_params: page.ParamForeignPage
-    box_foreign_exercise: page.ExerciseForeignPage
-    box_foreign_create: page.CreateWordPage
-    box_foreign_update: page.UpdateWordPage
-    box_foreign_list: page.ListForeignPage
+    box_foreign_main = LazyBox('wse.page.MainForeignPage')
+    box_foreign_params = LazyBox('wse.page.ParamForeignPage')
+    box_foreign_exercise = LazyBox('wse.page.ExerciseForeignPage')
+    box_foreign_create = LazyBox('wse.page.CreateWordPage')
+    box_foreign_update = LazyBox('wse.page.UpdateWordPage')
+    box_foreign_list = LazyBox('wse.page.ListForeignPage')
     # Glossary study page boxes.
-    box_glossary_main: page.MainGlossaryPage
-    box_glossary_params: page.ParamGlossaryBox
-    box_glossary_exercise: page.ExerciseGlossaryBox
-    box_glossary_create: page.CreateTermPage
-    box_glossary_update: page.UpdateTermPage
-    box_glossary_list: page.ListTermPage
+    box_glossary_main = LazyBox('wse.page.MainGlossaryPage')
+    box_glossary_params = LazyBox('wse.page.ParamGlossaryBox')
+    box_glossary_exercise = LazyBox('wse.page.ExerciseGlossaryBox')
+    box_glossary_create = LazyBox('wse.page.CreateTermPage')
+    box_glossary_update = LazyBox('wse.page.UpdateTermPage')
+    box_glossary_list = LazyBox('wse.page.ListTermPage')
     # Login box.
-    box_login: page.LoginBox
+    box_login = LazyBox('wse.page.LoginBox')
 
     # Menu.
     menu: toga.Group
@@ -40,29 +49,12 @@ class WSE(toga.App):
     def startup(self) -> None:
         """Initialise widgets to start application.
 
-        * Initialises the page boxes.
         * Creates the app command menu.
         * Define the main window.
-        """
-        # Page boxes.
-        self.box_main = page.MainBox()
-        # Foreign language study page boxes.
-        self.box_foreign_main = page.MainForeignPage()
-        self.box_foreign_params = page.ParamForeignPage()
-        self.box_foreign_exercise = page.ExerciseForeignPage()
-        self.box_foreign_create = page.CreateWordPage()
-        self.box_foreign_update = page.UpdateWordPage()
-        self.box_foreign_list = page.ListForeignPage()
-        # Glossary study page boxes.
-        self.box_glossary_main = page.MainGlossaryPage()
-        self.box_glossary_params = page.ParamGlossaryBox()
-        self.box_glossary_exercise = page.ExerciseGlossaryBox()
-        self.box_glossary_create = page.CreateTermPage()
-        self.box_glossary_update = page.UpdateTermPage()
-        self.box_glossary_list = page.ListTermPage()
-        # Login box.
-        self.box_login = page.LoginBox()
 
+        The page boxes are created on first access, the main page box
+        is created to show the main window.
+        """
         # Menu.
         self.menu = toga.Group('Menu')
         # Menu commands.
@@ -97,13 +89,95 @@ class WSE(toga.App):
         )
         # Application start with Main page box content.
         self.main_window.content = self.box_main
-        self.box_main.on_open()
+        self.box_main.invoke_on_open()
         self.main_window.show()
 
+    async def on_running(self) -> None:
+        """Run the background jobs when the main window is shown.
+
+        * Sends the assessments left from the previous app run.
+        * Creates the page boxes at idle time.
+        * Syncs the local mirror of the dictionary.
+        """
+        # The http client is imported after the main window is shown.
+        from wse.contrib.assessment import assessment_queue
+
+        if PAGE_PREWARM:
+            asyncio.ensure_future(self.prewarm_pages())
+        if DICTIONARY_SYNC:
+            asyncio.ensure_future(self.sync_dictionary())
+        if assessment_queue:
+            await assessment_queue.flush()
+
+    @classmethod
+    def page_names(cls) -> list[str]:
+        """Get the app attr names of page boxes."""
+        return [
+            name
+            for name, attr in vars(cls).items()
+            if isinstance(attr, LazyBox)
+        ]
+
+    async def prewarm_pages(self) -> None:
+        """Create the page boxes that are not created yet.
+
+        One page box is created per event loop turn, so the user
+        events are not delayed.
+        """
+        await asyncio.sleep(PAGE_PREWARM_DELAY)
+        for name in self.page_names():
+            if not LazyBox.is_created(self, name):
+                getattr(self, name)
+                await asyncio.sleep(0)
+
+    def forget_dictionary(self) -> None:
+        """Drop the dictionary of the previous user.
+
+        Called on the user logout and login. The cached pages, the
+        local mirror and the received entries of list pages are
+        dropped.
+        """
+        from wse.contrib.mirror import dictionary_mirror
+        from wse.contrib.page_cache import page_cache
+
+        page_cache.clear()
+        dictionary_mirror.clear()
+        for name in ('box_foreign_list', 'box_glossary_list'):
+            if LazyBox.is_created(self, name):
+                getattr(self, name).forget_entries()
+
+    async def sync_dictionary(self) -> None:
+        """Sync the local mirror of foreign words and glossary terms."""
+        from wse.contrib.mirror import dictionary_mirror
+
+        await asyncio.sleep(DICTIONARY_SYNC_DELAY)
+        for path in (FOREIGN_PATH, GLOSSARY_PATH):
+            await dictionary_mirror.sync(urljoin(HOST_API, path))
+
+    async def on_exit(self) -> bool:
+        """Send the recorded assessments, close the connections.
+
+        Called on app exit.
+        """
+        from wse.contrib.assessment import assessment_queue
+        from wse.contrib.http_requests import client_pool
+        from wse.contrib.latency import answer_latency
+        from wse.contrib.mirror import dictionary_mirror
+
+        await assessment_queue.flush()
+        assessment_queue.journal.close()
+        dictionary_mirror.close()
+        answer_latency.close()
+        await client_pool.aclose()
+        return True
+
     def move_to_page(self, box: BoxApp) -> None:
         """Move to page box."""
+        content = self.main_window.content
+        if content is not box:
+            content.on_close()
         self.main_window.content = box
-        box.on_open()
+        box.invoke_on_open()
 
     def goto_main(self, _: toga.Widget, **kwargs: object) -> None:
         """Goto main box, command handler."""
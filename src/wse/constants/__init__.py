@@ -7,8 +7,11 @@ from wse.constants.literal import (
     ANSWER_TEXT,
     ASSESSMENT,
     AUTH_TOKEN,
+    BATCH_SIZE,
     CATEGORIES,
     CATEGORY,
+    COUNT,
+    CREATED_AT,
     DETAIL,
     EDGE_PERIODS,
     ERROR,
@@ -32,6 +35,7 @@ from wse.constants.literal import (
     RESULTS,
     RUSSIAN_WORD,
     STYLE,
+    TASKS,
     TERM_ID,
     TIMEOUT,
     USERNAME,
@@ -57,6 +61,9 @@ from wse.constants.page import (
     USER_UPDATE_BOX,
 )
 from wse.constants.settings import (
+    ADAPTIVE_TIMEOUT,
+    ASSESSMENT_FLUSH_INTERVAL,
+    ASSESSMENT_FLUSH_SIZE,
     BTN_GOTO_FOREIGN_CREATE,
     BTN_GOTO_FOREIGN_LIST,
     BTN_GOTO_FOREIGN_MAIN,
@@ -72,14 +79,37 @@ from wse.constants.settings import (
     BUTTON_HEIGHT,
     CONNECTION_ERROR_MSG,
     DEFAULT_TIMEOUT,
+    DICTIONARY_SYNC,
+    DICTIONARY_SYNC_DELAY,
     FONT_SIZE_APP,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
     INPUT_HEIGHT,
+    JOURNAL_SYNC_INTERVAL,
+    LATENCY_PERCENTILE,
+    LATENCY_SAMPLES,
+    LOCAL_TASKS,
     LOGIN_BAD_MSG,
     LOGIN_MSG,
     LOGOUT_MSG,
+    MAX_TIMEOUT,
+    MIN_TIMEOUT,
     NO_TASK_MSG,
+    PAGE_CACHE_SIZE,
+    PAGE_PREWARM,
+    PAGE_PREWARM_DELAY,
     SCREEN_SIZE,
+    SEARCH_DEBOUNCE,
+    SEARCH_INDEX_BATCH,
+    SEARCH_LIMIT,
+    SEARCH_PARAM,
+    SERVER_SEARCH,
+    TABLE_CHUNK_CACHE_SIZE,
+    TABLE_CHUNK_SIZE,
+    TASK_BATCH_SIZE,
     TASK_ERROR_MSG,
+    TASK_PREFETCH_SIZE,
     TEXT_DISPLAY_FONT_SIZE,
     TEXT_DISPLAY_FONT_STYLE,
     TEXT_DISPLAY_PADDING,
@@ -132,12 +162,16 @@ from wse.constants.url import (
 
 __all__ = (  # noqa: F405
     'ACTION',
+    'ADAPTIVE_TIMEOUT',
     'ALIAS',
     'ANSWER',
     'ANSWER_TEXT',
     'ASSESSMENT',
+    'ASSESSMENT_FLUSH_INTERVAL',
+    'ASSESSMENT_FLUSH_SIZE',
     'AUTH_BOX',
     'AUTH_TOKEN',
+    'BATCH_SIZE',
     'BTN_GOTO_FOREIGN_CREATE',
     'BTN_GOTO_FOREIGN_LIST',
     'BTN_GOTO_FOREIGN_MAIN',
@@ -154,8 +188,12 @@ __all__ = (  # noqa: F405
     'CATEGORIES',
     'CATEGORY',
     'CONNECTION_ERROR_MSG',
+    'COUNT',
+    'CREATED_AT',
     'DEFAULT_TIMEOUT',
     'DETAIL',
+    'DICTIONARY_SYNC',
+    'DICTIONARY_SYNC_DELAY',
     'EDGE_PERIODS',
     'ERROR',
     'EXERCISE_CHOICES',
@@ -188,11 +226,18 @@ __all__ = (  # noqa: F405
     'HTTP_400_BAD_REQUEST',
     'HTTP_401_UNAUTHORIZED',
     'HTTP_500_INTERNAL_SERVER_ERROR',
+    'HTTP_KEEPALIVE_EXPIRY',
+    'HTTP_MAX_CONNECTIONS',
+    'HTTP_MAX_KEEPALIVE_CONNECTIONS',
     'HUMANLY',
     'ID',
     'INPUT_HEIGHT',
     'ITEMS',
+    'JOURNAL_SYNC_INTERVAL',
     'KNOW',
+    'LATENCY_PERCENTILE',
+    'LATENCY_SAMPLES',
+    'LOCAL_TASKS',
     'LOGIN_BAD_MSG',
     'LOGIN_BOX',
     'LOGIN_MSG',
@@ -201,10 +246,15 @@ __all__ = (  # noqa: F405
     'LOGOUT_PATH',
     'LOOKUP_CONDITIONS',
     'MAIN_BOX',
+    'MAX_TIMEOUT',
+    'MIN_TIMEOUT',
     'NAME',
     'NEXT',
     'NOT_KNOW',
     'NO_TASK_MSG',
+    'PAGE_CACHE_SIZE',
+    'PAGE_PREWARM',
+    'PAGE_PREWARM_DELAY',
     'PASSWORD',
     'PERIOD_END',
     'PERIOD_START',
@@ -216,8 +266,18 @@ __all__ = (  # noqa: F405
     'RESULTS',
     'RUSSIAN_WORD',
     'SCREEN_SIZE',
+    'SEARCH_DEBOUNCE',
+    'SEARCH_INDEX_BATCH',
+    'SEARCH_LIMIT',
+    'SEARCH_PARAM',
+    'SERVER_SEARCH',
     'STYLE',
+    'TABLE_CHUNK_CACHE_SIZE',
+    'TABLE_CHUNK_SIZE',
+    'TASKS',
+    'TASK_BATCH_SIZE',
     'TASK_ERROR_MSG',
+    'TASK_PREFETCH_SIZE',
     'TERM_ID',
     'TEXT_DISPLAY_FONT_SIZE',
     'TEXT_DISPLAY_FONT_STYLE',
@@ -6,8 +6,11 @@ ANSWER = 'answer'
 ANSWER_TEXT = 'answer_text'
 ASSESSMENT = 'assessment'
 AUTH_TOKEN = 'auth_token'
+BATCH_SIZE = 'batch_size'
 CATEGORIES = 'categories'
 CATEGORY = 'category'
+COUNT = 'count'
+CREATED_AT = 'created_at'
 DETAIL = 'detail'
 EDGE_PERIODS = 'edge_period_items'
 ERROR = 'error'
@@ -32,6 +35,7 @@ QUESTION_TEXT = 'question_text'
 RESULTS = 'results'
 RUSSIAN_WORD = 'native_word'
 STYLE = 'style'
+TASKS = 'tasks'
 TERM_ID = 'term_id'
 TIMEOUT = 'timeout'
 USERNAME = 'username'
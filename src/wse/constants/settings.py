@@ -5,6 +5,103 @@ from travertino.constants import ITALIC
 DEFAULT_TIMEOUT = 5
 """Time to answer on task question in exercises (`int`).
 """
+ADAPTIVE_TIMEOUT = True
+"""Adapt the question timeout of the exercise task to the recent answer
+times of the item (`bool`).
+"""
+LATENCY_SAMPLES = 8
+"""Count of the recent answer times kept per item and category
+(`int`).
+"""
+LATENCY_PERCENTILE = 0.9
+"""Percentile of the recent answer times to be the question timeout
+(`float`).
+"""
+MIN_TIMEOUT = 1.5
+"""Minimum adapted question timeout, in seconds (`float`).
+"""
+MAX_TIMEOUT = 10.0
+"""Maximum adapted question timeout, in seconds (`float`).
+"""
+TASK_PREFETCH_SIZE = 3
+"""Count of the upcoming exercise tasks requested in advance (`int`).
+"""
+LOCAL_TASKS = True
+"""Generate the exercise tasks from the local mirror of dictionary, if
+the dictionary is mirrored (`bool`).
+"""
+TASK_BATCH_SIZE = 10
+"""Count of the exercise tasks requested per request, if the server
+supports the batch of tasks (`int`).
+"""
+ASSESSMENT_FLUSH_SIZE = 10
+"""Count of the recorded assessments to send them to server (`int`).
+"""
+ASSESSMENT_FLUSH_INTERVAL = 5.0
+"""Time to send the recorded assessments to server, in seconds
+(`float`).
+"""
+JOURNAL_SYNC_INTERVAL = 0.5
+"""Time to write the recorded assessments to journal, in seconds
+(`float`).
+"""
+PAGE_CACHE_SIZE = 20
+"""Count of the cached pagination pages of entry tables (`int`).
+"""
+TABLE_CHUNK_SIZE = 100
+"""Count of the entries requested per chunk of the table with all
+entries (`int`).
+"""
+TABLE_CHUNK_CACHE_SIZE = 10
+"""Count of the cached chunks of the table with all entries (`int`).
+"""
+SEARCH_LIMIT = 100
+"""Maximum count of the entries found by the search on the list page
+(`int`).
+"""
+SEARCH_DEBOUNCE = 0.3
+"""Time from the last keystroke to the search request, in seconds
+(`float`).
+"""
+SEARCH_PARAM = 'search'
+"""Query parameter of the search on the list endpoint (`str`).
+"""
+SERVER_SEARCH = True
+"""Request the search on server after the local search (`bool`).
+"""
+SEARCH_INDEX_BATCH = 500
+"""Count of the mirrored entries added to the search index at once,
+the index is built in background by the batches (`int`).
+"""
+DICTIONARY_SYNC = True
+"""Sync the local mirror of the dictionary after the app start
+(`bool`).
+"""
+DICTIONARY_SYNC_DELAY = 1.0
+"""Time to start the sync of the local mirror of the dictionary after
+the app start, in seconds (`float`).
+"""
+PAGE_PREWARM = True
+"""Create the page boxes at idle time after the app start (`bool`).
+"""
+PAGE_PREWARM_DELAY = 0.5
+"""Time to start the creation of page boxes at idle time after the app
+start, in seconds (`float`).
+"""
+
+########################################################################
+# Http client constants
+########################################################################
+
+HTTP_MAX_CONNECTIONS = 10
+"""Maximum number of connections in the http client pool (`int`).
+"""
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 5
+"""Maximum number of idle keep-alive connections in the pool (`int`).
+"""
+HTTP_KEEPALIVE_EXPIRY = 30.0
+"""Time limit on idle keep-alive connections, in seconds (`float`).
+"""
 
 ########################################################################
 # Widget constants
@@ -31,6 +31,9 @@ TOKEN_PATH = '/auth/token/login/'
 
 FOREIGN_EXERCISE_PATH = '/api/v1/foreign/exercise/'
 """Learning foreign word exercise path (`str`).
+
+Returns the list of tasks by ``tasks`` key if the server supports
+the batch of tasks requested by ``batch_size`` key.
 """
 FOREIGN_ASSESSMENT_PATH = '/api/v1/foreign/assessment/'
 """User knowledge assessment update of foreign word path (`str`).
@@ -50,6 +53,9 @@ FOREIGN_DETAIL_PATH = '/api/v1/foreign/%s/'
 
 GLOSSARY_EXERCISE_PATH = '/api/v1/glossary/exercise/'
 """Glossary exercise path (`str`).
+
+Returns the list of tasks by ``tasks`` key if the server supports
+the batch of tasks requested by ``batch_size`` key.
 """
 GLOSSARY_PARAMS_PATH = '/api/v1/glossary/params/'
 """Glossary exercise parameters path (`str`).
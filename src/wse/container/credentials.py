@@ -1,10 +1,10 @@
 """Credentials container."""
 
+import typing
 from http import HTTPStatus
 from urllib.parse import urljoin
 
 import toga
-from httpx import Response
 from toga.style import Pack
 
 from wse.constants import (
@@ -14,12 +14,16 @@ from wse.constants import (
     PASSWORD,
     USERNAME,
 )
-from wse.contrib.http_requests import ErrorResponse, request_post
 from wse.contrib.validator import validate_credentials
 from wse.general.box_page import BoxApp
 from wse.general.button import BtnApp
 from wse.general.label import TitleLabel
 
+if typing.TYPE_CHECKING:
+    from httpx import Response
+
+    from wse.contrib.http_requests import ErrorResponse
+
 
 class Credentials(BoxApp):
     """Credentials input widgets container."""
@@ -97,9 +101,12 @@ class Credentials(BoxApp):
     ####################################################################
     # Auth.
 
-    async def send_request(self, url: str, payload: dict) -> Response:
+    async def send_request(self, url: str, payload: dict) -> 'Response':
         """Send request."""
-        return request_post(url, payload)
+        # The http client is imported on first request.
+        from wse.contrib.http_requests import request_post_async
+
+        return await request_post_async(url, payload)
 
     def _extract_credentials(self) -> dict:
         """Extract user data from form, validate it."""
@@ -129,7 +136,7 @@ class Credentials(BoxApp):
 
     async def _show_response_message(
         self,
-        response: Response | ErrorResponse,
+        response: 'Response | ErrorResponse',
     ) -> None:
         """Show response message."""
         if response.status_code == self.success_status_code:
@@ -5,19 +5,23 @@ For exercises:
     * Foreign word study exercise
 """
 
+import asyncio
 from http import HTTPStatus
 
 import toga
+from httpx import Response
 from toga.style.pack import COLUMN, ROW, Pack
 
 from wse.constants import (
-    ACTION,
+    ADAPTIVE_TIMEOUT,
     ANSWER,
+    BATCH_SIZE,
     CATEGORIES,
     CATEGORY,
     EDGE_PERIODS,
     EXERCISE_CHOICES,
     KNOW,
+    LOCAL_TASKS,
     LOOKUP_CONDITIONS,
     NO_TASK_MSG,
     NOT_KNOW,
@@ -25,10 +29,16 @@ from wse.constants import (
     PERIOD_START,
     PROGRESS,
     QUESTION,
+    TASK_BATCH_SIZE,
     TASK_ERROR_MSG,
+    TASK_PREFETCH_SIZE,
+    TASKS,
 )
-from wse.constants.literal import ITEM_ID
-from wse.contrib.http_requests import request_post, request_post_async
+from wse.contrib.assessment import assessment_queue
+from wse.contrib.http_requests import request_post_async
+from wse.contrib.latency import answer_latency
+from wse.contrib.offline import LocalTaskGenerator
+from wse.contrib.prefetch import TaskPrefetcher
 from wse.contrib.task import Task
 from wse.contrib.timer import Timer
 from wse.general.box import FlexBox
@@ -272,6 +282,21 @@ class ExerciseBox(BoxApp):
         self.timer = Timer()
         # The box has task control.
         self.task = Task()
+        # The upcoming tasks are requested in advance.
+        self.prefetcher = TaskPrefetcher(self.fetch_task)
+        # Is the batch of tasks supported by server, unknown if None.
+        self.is_batch_supported: bool | None = None
+        # The assessments are sent to server in background.
+        self.assessments = assessment_queue
+        # The question timeout is adapted to the answer times of item.
+        self.latency = answer_latency
+        self._question_timeout: float | None = None
+        # Is the shown task assessed, or no task is shown.
+        self._is_assessed = True
+        # The tasks are generated from the local mirror of dictionary.
+        self.local_tasks: LocalTaskGenerator | None = None
+        # The running exercise loop, the box runs one loop at most.
+        self._loop_task: asyncio.Task | None = None
         # To override attrs.
         self.url_exercise = ''
         self.url_progress = ''
@@ -319,24 +344,83 @@ class ExerciseBox(BoxApp):
 
     async def know_handler(self, _: toga.Widget) -> None:
         """Mark that know the answer, button handler."""
-        know_payload = {ACTION: KNOW, ITEM_ID: self.task.item_id}
-        await request_post_async(self.url_progress, know_payload)
+        self.record_assessment(KNOW)
         await self.move_to_next_task()
 
     async def not_know_handler(self, _: toga.Widget) -> None:
         """Mark that not know the answer, button handler."""
-        not_know_payload = {ACTION: NOT_KNOW, ITEM_ID: self.task.item_id}
-        await request_post_async(self.url_progress, not_know_payload)
+        self.record_assessment(NOT_KNOW)
         await self.move_to_next_task()
 
+    def record_assessment(self, action: str) -> None:
+        """Record the user assessment of the task item.
+
+        The assessment is sent to server in background, and changed in
+        the local mirror of dictionary at once. The answer time of item
+        is recorded. The shown task is assessed once, the repeated
+        press while the next task is loading is skipped.
+        """
+        if self._is_assessed:
+            return
+        self._is_assessed = True
+        self.record_answer_time()
+        self.assessments.record(self.url_progress, action, self.task.item_id)
+        if self.local_tasks is not None:
+            self.local_tasks.record(self.task.item_id, action)
+
+    def answer_time(self) -> float | None:
+        """Get the time from the task question shown, without pause.
+
+        :return: The time in seconds, ``None`` if the task is not shown.
+        """
+        elapsed = self.timer.elapsed
+        if elapsed is None:
+            return None
+        if self.task.status == ANSWER:
+            return elapsed
+        # The answer is shown after the question timeout.
+        return self._question_timeout + elapsed
+
+    def record_answer_time(self) -> None:
+        """Record the answer time of the task item."""
+        seconds = self.answer_time()
+        if seconds is not None:
+            self.latency.record(
+                self.url_exercise,
+                self.task.item_id,
+                self.task.category,
+                seconds,
+            )
+
+    def question_timeout(self) -> float:
+        """Get the time to show the task question without an answer.
+
+        The timeout is adapted to the recent answer times of item, if
+        :py:data:`~wse.constants.settings.ADAPTIVE_TIMEOUT` is set.
+        """
+        if not ADAPTIVE_TIMEOUT:
+            return self.timer.timeout
+        return self.latency.timeout(
+            self.url_exercise,
+            self.task.item_id,
+            self.task.category,
+            default=self.timer.timeout,
+        )
+
     async def move_to_next_task(self) -> None:
         """Move to next task."""
         self.task.status = QUESTION
         await self.loop_task()
 
     def pause_handler(self, _: toga.Widget) -> None:
-        """Exercise pause, button handler."""
-        self.timer.on_pause()
+        """Pause or resume the exercise, button handler.
+
+        The pause keeps the remaining time of the task timeout.
+        """
+        if self.timer.is_pause():
+            self.timer.unpause()
+        else:
+            self.timer.on_pause()
 
     async def next_handler(self, _: toga.Widget) -> None:
         """Switch to the next task, button handler."""
@@ -346,13 +430,91 @@ class ExerciseBox(BoxApp):
     # End Button handlers
     #####################
 
+    def on_close(self) -> None:
+        """Stop the loop, drop the prefetched tasks, send assessments.
+
+        Called when the box is left. The assessments are sent by the
+        app queue, the sending is not cancelled with the box. The local
+        assessments and the answer times are saved.
+        """
+        self.cancel_loop()
+        self.timer.unpause()
+        self.prefetcher.invalidate()
+        self.task.clear()
+        self._is_assessed = True
+        if self.assessments:
+            self.assessments.schedule_flush()
+        if self.local_tasks is not None:
+            self.local_tasks.save()
+        self.latency.sync()
+
+    async def fetch_task(self, params: dict | None) -> Response:
+        """Send the http request of the task data.
+
+        Requests the batch of tasks, until the server is found not to
+        support it.
+        """
+        if self.is_batch_supported is False:
+            return await request_post_async(self.url_exercise, params)
+
+        payload = {**(params or {}), BATCH_SIZE: TASK_BATCH_SIZE}
+        response = await request_post_async(self.url_exercise, payload)
+        if response.status_code == HTTPStatus.BAD_REQUEST:
+            # The server may reject the unknown batch size key.
+            response = await request_post_async(self.url_exercise, params)
+            if response.status_code == HTTPStatus.OK:
+                self.is_batch_supported = False
+        return response
+
+    def to_tasks(self, payload: dict) -> list[dict]:
+        """Get the list of task data from the response payload.
+
+        The server with batch support replies the list of tasks by
+        ``tasks`` key, otherwise the single task, then the prefetch
+        size is restored to keep the single tasks ahead.
+        """
+        if isinstance(payload.get(TASKS), list):
+            if not self.is_batch_supported:
+                self.is_batch_supported = True
+                # The single prefetched request keeps the batch ahead.
+                self.prefetcher.size = 1
+            return payload[TASKS]
+        self.is_batch_supported = False
+        self.prefetcher.size = TASK_PREFETCH_SIZE
+        return [payload]
+
+    def generate_task(self) -> bool:
+        """Set the task data generated from the local mirror.
+
+        :return: ``False`` if the local task is not generated, ``True``
+            otherwise.
+        """
+        if not LOCAL_TASKS or self.local_tasks is None:
+            return False
+        if not self.local_tasks.is_available:
+            return False
+        data = self.local_tasks.generate(self.task.params)
+        if data is None:
+            return False
+        self.task.data = data
+        return True
+
     async def request_task(self) -> None:
-        """Request the task data."""
-        r = request_post(self.url_exercise, self.task.params)
-        if r.status_code == HTTPStatus.OK:
-            self.task.data = r.json()
+        """Set the next task data, request the tasks if no task left.
+
+        The task is generated locally if the dictionary is mirrored,
+        the server is requested otherwise.
+        """
+        if self.task.next() or self.generate_task():
             return
-        elif r.status_code == HTTPStatus.NO_CONTENT:
+
+        r = await self.prefetcher.get(self.task.params)
+        if r.status_code == HTTPStatus.OK:
+            self.task.extend(self.to_tasks(r.json()))
+            if self.task.next():
+                return
+
+        if r.status_code in (HTTPStatus.OK, HTTPStatus.NO_CONTENT):
             await self.show_message('', NO_TASK_MSG)
             self.move_to_box_params(self)
         else:
@@ -363,15 +525,43 @@ class ExerciseBox(BoxApp):
         """Show the task question without an answer."""
         self.question_display.update(self.task.question)
         self.answer_display.clean()
+        self._is_assessed = False
 
     def show_answer(self) -> None:
         """Show the task answer."""
         self.answer_display.update(self.task.answer)
 
     async def loop_task(self) -> None:
-        """Show new task in loop."""
-        self.timer.cancel()
+        """Show new task in loop.
 
+        The loop runs as the task owned by the box. The running loop is
+        cancelled before the new one is started, so the button pressed
+        during the task request or the timeout does not start the second
+        loop. The loop is cancelled when the box is left.
+        """
+        self.cancel_loop()
+        task = self._loop_task = asyncio.ensure_future(self._run_loop())
+        try:
+            await task
+        except asyncio.CancelledError:
+            # The loop is stopped by the box, not the caller.
+            if self._loop_task is task:
+                raise
+        finally:
+            if self._loop_task is task:
+                self._loop_task = None
+
+    def cancel_loop(self) -> None:
+        """Cancel the running exercise loop."""
+        task, self._loop_task = self._loop_task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    def is_loop_running(self) -> bool:
+        """Is the exercise loop running."""
+        return self._loop_task is not None and not self._loop_task.done()
+
+    async def _run_loop(self) -> None:
         while self.is_enable_new_task():
             if self.task.status != ANSWER:
                 self.clean_text_panel()
@@ -380,20 +570,16 @@ class ExerciseBox(BoxApp):
                     break
                 self.show_question()
                 self.task.status = ANSWER
+                timeout = self._question_timeout = self.question_timeout()
             else:
                 self.show_answer()
                 self.task.status = QUESTION
-            await self.timer.start()
+                timeout = None
+            await self.timer.start(timeout)
 
     def is_enable_new_task(self) -> bool:
         """Return `False` to cancel task update, `True` otherwise."""
-        if not self.timer.is_pause():
-            return self.is_visible_box(self)
-        return False
-
-    def is_visible_box(self, widget: toga.Box) -> bool:
-        """Is the box of widget is main_window content."""
-        return bool(widget.root.app.main_window.content == self)
+        return not self.timer.is_pause()
 
     def clean_text_panel(self) -> None:
         """Clean the test panel."""
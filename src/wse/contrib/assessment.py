@@ -0,0 +1,250 @@
+"""Write-behind queue of the user knowledge assessments."""
+
+import asyncio
+import itertools
+import os.path
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import httpx
+
+from wse.constants import (
+    ACTION,
+    ASSESSMENT_FLUSH_INTERVAL,
+    ASSESSMENT_FLUSH_SIZE,
+    JOURNAL_SYNC_INTERVAL,
+)
+from wse.constants.literal import ITEM_ID
+from wse.contrib.http_requests import request_post_async
+from wse.contrib.journal import JournalEntry, ProgressJournal
+
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+"""Header of the assessment idempotency key (`str`).
+"""
+
+
+class FlushStats:
+    """Statistics of the assessment queue flushes.
+
+    :ivar flush_count: Count of the flushes of queue.
+    :vartype flush_count: int
+    :ivar failed_count: Count of the flushes that failed.
+    :vartype failed_count: int
+    :ivar sent_count: Count of the sent assessments.
+    :vartype sent_count: int
+    :ivar last_latency: Duration of the last flush, in seconds.
+    :vartype last_latency: float or None
+    :ivar max_latency: Maximum duration of flush, in seconds.
+    :vartype max_latency: float
+    :ivar queue_depth: Count of the assessments in queue.
+    :vartype queue_depth: int
+    :ivar max_queue_depth: Maximum count of the assessments in queue.
+    :vartype max_queue_depth: int
+    """
+
+    def __init__(self) -> None:
+        """Construct the statistics."""
+        self.flush_count = 0
+        self.failed_count = 0
+        self.sent_count = 0
+        self.last_latency = None
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Mean duration of flush, in seconds (`float`, reade-only)."""
+        if not self.flush_count:
+            return None
+        return self.total_latency / self.flush_count
+
+    def add_flush(self, latency: float, sent: int, failed: bool) -> None:
+        """Add the flush result to statistics."""
+        self.flush_count += 1
+        self.failed_count += failed
+        self.sent_count += sent
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_latency += latency
+
+    def set_queue_depth(self, depth: int) -> None:
+        """Set the current count of the assessments in queue."""
+        self.queue_depth = depth
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+
+class AssessmentQueue:
+    """Write-behind queue of the user knowledge assessments.
+
+    The assessment is recorded locally and the method returns
+    immediately. The recorded assessments are sent in order by batch:
+    on timer, when the queue reaches the size threshold, or by
+    explicit flush. The assessments that failed to send are kept in
+    queue and sent on next flush.
+
+    If the journal is set, the assessments are written to journal
+    by batch on the short timer and before sending, and removed after
+    sending, the journal entries left from the previous app run are
+    sent first.
+
+    :param send: The coroutine function to send the batch of
+        assessments in order, returns the count of sent assessments.
+    :param journal: The journal of unsent assessments.
+    :type journal: ProgressJournal or None
+    :param int flush_size: Count of the assessments to flush the queue.
+    :param float flush_interval: Time to flush the queue after the
+        first recorded assessment, in seconds.
+    :param float sync_interval: Time to write the journal after the
+        first recorded assessment, in seconds.
+    :ivar stats: The flush statistics.
+    :vartype stats: FlushStats
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[JournalEntry]], Awaitable[int]],
+        journal: ProgressJournal | None = None,
+        flush_size: int = ASSESSMENT_FLUSH_SIZE,
+        flush_interval: float = ASSESSMENT_FLUSH_INTERVAL,
+        sync_interval: float = JOURNAL_SYNC_INTERVAL,
+    ) -> None:
+        """Construct the queue."""
+        self.send = send
+        self.journal = journal
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.sync_interval = sync_interval
+        self.stats = FlushStats()
+        self._events: deque[JournalEntry] = deque()
+        self._is_loaded = journal is None
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._sync_timer: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        """Get count of assessments in queue."""
+        self._load()
+        return len(self._events)
+
+    def record(self, url: str, action: str, item_id: int) -> None:
+        """Record the assessment to send it later.
+
+        :param str url: URL to send the assessment.
+        :param str action: The assessment action, 'know' or 'not_know'.
+        :param int item_id: The assessed item ID.
+        """
+        self._load()
+        payload = {ACTION: action, ITEM_ID: item_id}
+        entry = JournalEntry(uuid.uuid4().hex, url, payload)
+        self._events.append(entry)
+        if self.journal is not None:
+            self.journal.append(entry)
+            self._start_sync_timer()
+        self.stats.set_queue_depth(len(self._events))
+
+        if len(self._events) >= self.flush_size:
+            self.schedule_flush()
+        else:
+            self._start_timer()
+
+    def schedule_flush(self) -> asyncio.Task:
+        """Run the queue flush in background."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+        return self._flush_task
+
+    async def flush(self) -> None:
+        """Send the recorded assessments in order."""
+        self._cancel_timer()
+
+        async with self._lock:
+            self._load()
+            while self._events:
+                batch = list(itertools.islice(self._events, self.flush_size))
+                start = time.perf_counter()
+                if self.journal is not None:
+                    # The batch is durable before sending.
+                    self.journal.sync()
+                sent = await self.send(batch)
+                if self.journal is not None:
+                    self.journal.remove(entry.key for entry in batch[:sent])
+                latency = time.perf_counter() - start
+
+                for _ in range(sent):
+                    self._events.popleft()
+                failed = sent < len(batch)
+                self.stats.add_flush(latency, sent, failed)
+                self.stats.set_queue_depth(len(self._events))
+
+                if failed:
+                    # Retry the rest of assessments on timer.
+                    self._start_timer()
+                    break
+
+    def _load(self) -> None:
+        if not self._is_loaded:
+            self._is_loaded = True
+            self._events.extendleft(reversed(self.journal.entries()))
+            self.stats.set_queue_depth(len(self._events))
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.flush_interval, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self.schedule_flush()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start_sync_timer(self) -> None:
+        # The group commit of journal does not wait for the flush.
+        if self._sync_timer is None:
+            loop = asyncio.get_running_loop()
+            self._sync_timer = loop.call_later(
+                self.sync_interval, self._on_sync_timer
+            )
+
+    def _on_sync_timer(self) -> None:
+        self._sync_timer = None
+        self.journal.sync()
+
+
+async def send_assessments(entries: list[JournalEntry]) -> int:
+    """Send the http requests of the user assessments in order.
+
+    :return: Count of the sent assessments, the sending stops on
+        connection or server error to retry later.
+    """
+    for count, entry in enumerate(entries):
+        try:
+            response = await request_post_async(
+                entry.url,
+                entry.payload,
+                headers={IDEMPOTENCY_KEY_HEADER: entry.key},
+            )
+        except httpx.HTTPError:
+            return count
+        if response.is_server_error:
+            return count
+    return len(entries)
+
+
+assessment_queue = AssessmentQueue(
+    send_assessments,
+    journal=ProgressJournal(
+        os.path.join(Path(__file__).parent.parent, 'resources/progress.db')
+    ),
+)
+"""The app queue of the user knowledge assessments.
+"""
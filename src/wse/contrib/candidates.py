@@ -0,0 +1,249 @@
+"""Index of the exercise candidates by the lookup conditions."""
+
+import bisect
+import datetime
+import typing
+
+from wse.constants import (
+    ASSESSMENT,
+    CATEGORY,
+    CREATED_AT,
+    ID,
+    PERIOD_END,
+    PERIOD_START,
+    PROGRESS,
+)
+
+PERIOD_DAYS = {
+    'DT': 0,
+    'D3': 3,
+    'W1': 7,
+    'W2': 14,
+    'W3': 21,
+    'W4': 28,
+    'W7': 49,
+    'M3': 90,
+    'M6': 180,
+    'M9': 270,
+    'NC': None,
+}
+"""Days ago of the period edge by alias, ``None`` if the edge is not
+limited (`dict[str, int | None]`).
+"""
+PROGRESS_ASSESSMENTS = {
+    'S': (-3, 6),
+    'R': (7, 10),
+    'E': (11, 11),
+    'K': (12, 12),
+}
+"""Range of the item assessment by study stage alias, the same as on
+server (`dict[str, tuple[int, int]]`).
+"""
+_STAGES = {
+    assessment: alias
+    for alias, (low, high) in PROGRESS_ASSESSMENTS.items()
+    for assessment in range(low, high + 1)
+}
+
+
+class CandidateIndex:
+    """Index of the entries by the lookup conditions of exercise.
+
+    The entries are ordered by the date of addition, so the period is
+    the range of positions found by bisection, and the first or last
+    added items are the lowest or highest positions. Each category and
+    each study stage has the bitset of entry positions, the bitset is
+    the Python ``int``. The lookup is the intersection of bitsets, it
+    costs a few big integer operations instead of a pass over entries.
+
+    The entry fields that are missing are not used to filter, as the
+    entry without the date of addition is in every period.
+
+    :param entries: The iterable of entries.
+    :ivar entries: The entries ordered by date of addition and id.
+    :vartype entries: list[dict]
+    """
+
+    def __init__(self, entries: typing.Iterable[dict]) -> None:
+        """Construct the index."""
+        self.entries = sorted(
+            entries, key=lambda e: (e.get(CREATED_AT) or '', int(e[ID]))
+        )
+        self.positions = {
+            str(entry[ID]): position
+            for position, entry in enumerate(self.entries)
+        }
+        size = len(self.entries)
+
+        # The entries without date are first in order.
+        dates = [entry.get(CREATED_AT) for entry in self.entries]
+        self.undated = sum(1 for created in dates if not created)
+        # Count of the entries without the field of lookup condition.
+        self.missing = {
+            field: sum(1 for entry in self.entries if field not in entry)
+            for field in (CATEGORY, ASSESSMENT)
+        }
+        self.dates = [
+            datetime.date.fromisoformat(created[:10]).toordinal()
+            for created in dates[self.undated :]
+        ]
+
+        length = size // 8 + 1
+        categories: dict[object, bytearray] = {}
+        uncategorized = bytearray(length)
+        stages = {alias: bytearray(length) for alias in PROGRESS_ASSESSMENTS}
+        for position, entry in enumerate(self.entries):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if CATEGORY in entry:
+                bits = categories.get(entry[CATEGORY])
+                if bits is None:
+                    bits = categories[entry[CATEGORY]] = bytearray(length)
+            else:
+                bits = uncategorized
+            bits[byte] |= bit
+            alias = _STAGES.get(entry.get(ASSESSMENT, 0))
+            if alias is not None:
+                stages[alias][byte] |= bit
+
+        self.categories = {
+            category: int.from_bytes(bits, 'little')
+            for category, bits in categories.items()
+        }
+        self.uncategorized = int.from_bytes(uncategorized, 'little')
+        self.stages = {
+            alias: int.from_bytes(bits, 'little')
+            for alias, bits in stages.items()
+        }
+
+    def __len__(self) -> int:
+        """Get count of indexed entries."""
+        return len(self.entries)
+
+    @staticmethod
+    def stage(assessment: int) -> str | None:
+        """Get the study stage alias of assessment."""
+        return _STAGES.get(assessment)
+
+    def select(self, params: dict, today: datetime.date | None = None) -> int:
+        """Get the bitset of entries that match the lookup conditions.
+
+        :param dict params: The lookup conditions.
+        :param today: The date the period is counted from.
+        :type today: datetime.date or None
+        :return: The bitset of entry positions.
+        """
+        today = today or datetime.date.today()
+        found = self.period_bits(
+            _edge_date(today, params.get(PERIOD_START)),
+            _edge_date(today, params.get(PERIOD_END)),
+        )
+
+        category = params.get(CATEGORY)
+        if category is not None:
+            found &= self.categories.get(category, 0) | self.uncategorized
+
+        if params.get(PROGRESS) in self.stages:
+            found &= self.stages[params[PROGRESS]]
+
+        count_first = params.get('count_first') or 0
+        count_last = params.get('count_last') or 0
+        if count_first:
+            found = _lowest(found, count_first)
+        elif count_last:
+            total = found.bit_count()
+            if total > count_last:
+                found &= ~_lowest(found, total - count_last)
+        return found
+
+    def supports(self, params: dict) -> bool:
+        """Have all entries the fields of the active lookup conditions.
+
+        The missing field is not used to filter, so the lookup by it
+        selects the entries the server does not select. The tasks of
+        such conditions are requested on server.
+        """
+        # The period until today does not limit the entries.
+        is_dated = (
+            PERIOD_DAYS.get(params.get(PERIOD_START)) is not None
+            or PERIOD_DAYS.get(params.get(PERIOD_END)) not in (None, 0)
+            or bool(params.get('count_first') or params.get('count_last'))
+        )
+        if is_dated and self.undated:
+            return False
+        if params.get(CATEGORY) is not None and self.missing[CATEGORY]:
+            return False
+        if params.get(PROGRESS) in self.stages and self.missing[ASSESSMENT]:
+            return False
+        return True
+
+    def period_bits(
+        self,
+        start: datetime.date | None,
+        end: datetime.date | None,
+    ) -> int:
+        """Get the bitset of entries added within the period."""
+        low = self.undated
+        if start is not None:
+            low += bisect.bisect_left(self.dates, start.toordinal())
+        high = len(self.entries)
+        if end is not None:
+            high = self.undated + bisect.bisect_right(
+                self.dates, end.toordinal()
+            )
+        if low >= high:
+            period = 0
+        else:
+            period = ((1 << high) - 1) ^ ((1 << low) - 1)
+        return period | ((1 << self.undated) - 1)
+
+    def pick(self, found: int, number: int) -> dict:
+        """Get the entry by its number among the found entries."""
+        return self.entries[_lowest(found, number + 1).bit_length() - 1]
+
+    def items(self, found: int) -> list[dict]:
+        """Get the found entries in order of addition."""
+        bits = bin(found)[:1:-1]
+        return [
+            self.entries[position]
+            for position, bit in enumerate(bits)
+            if bit == '1'
+        ]
+
+    def update_stage(self, item_id: int | str, assessment: int) -> None:
+        """Move the entry to the study stage of new assessment."""
+        position = self.positions.get(str(item_id))
+        if position is None:
+            return
+        bit = 1 << position
+        for alias in self.stages:
+            self.stages[alias] &= ~bit
+        alias = self.stage(assessment)
+        if alias is not None:
+            self.stages[alias] |= bit
+
+
+def _edge_date(
+    today: datetime.date, alias: str | None
+) -> datetime.date | None:
+    days = PERIOD_DAYS.get(alias)
+    if days is None:
+        return None
+    return today - datetime.timedelta(days=days)
+
+
+def _lowest(bits: int, count: int) -> int:
+    # Keep the count of lowest set bits, the bit position is found by
+    # bisection of the bit counts of high parts.
+    total = bits.bit_count()
+    if total <= count:
+        return bits
+    if count == 1:
+        return bits & -bits
+    low, high = (bits & -bits).bit_length(), bits.bit_length()
+    while low < high:
+        middle = (low + high) // 2
+        if total - (bits >> middle).bit_count() >= count:
+            high = middle
+        else:
+            low = middle + 1
+    return bits & ((1 << low) - 1)
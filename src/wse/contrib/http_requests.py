@@ -1,7 +1,10 @@
 """App http requests module."""
 
+import asyncio
+import importlib.util
 import json
 import os.path
+import tempfile
 import typing
 from http import HTTPStatus
 from pathlib import Path
@@ -10,7 +13,79 @@ import httpx
 from httpx import Request, Response
 
 import wse.constants as const
-from wse.constants import CONNECTION_ERROR_MSG
+from wse.constants import (
+    CONNECTION_ERROR_MSG,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+"""Is the optional ``h2`` package installed to use HTTP/2 (`bool`).
+"""
+
+
+class TokenStore:
+    """File storage of the user authentication token with cache.
+
+    The token file is read once, the read value is cached, including
+    the absence of the token. The token is written atomically, through
+    a temporary file and rename.
+
+    :param str path: Path to the token file.
+    :ivar load_count: Count of the token file reads.
+    :vartype load_count: int
+    """
+
+    def __init__(self, path: str) -> None:
+        """Construct the store."""
+        self.path = path
+        self.load_count = 0
+        self._token = None
+        self._is_loaded = False
+
+    def get(self) -> str | None:
+        """Get the token, read the file on first call."""
+        if not self._is_loaded:
+            self._token = self._load()
+            self._is_loaded = True
+        return self._token
+
+    def set(self, token: str) -> None:
+        """Save the token to file and cache."""
+        dir_name = os.path.dirname(self.path)
+        with tempfile.NamedTemporaryFile(
+            'w', dir=dir_name, suffix='.tmp', delete=False
+        ) as file:
+            json.dump({'token': token}, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(file.name, self.path)
+        self._token = token
+        self._is_loaded = True
+
+    def delete(self) -> None:
+        """Delete the token file, cache the token absence."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        self._token = None
+        self._is_loaded = True
+
+    def invalidate(self) -> None:
+        """Drop the cached token, the file will be read again."""
+        self._token = None
+        self._is_loaded = False
+
+    def _load(self) -> str | None:
+        self.load_count += 1
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+                return data.get('token')
+        except FileNotFoundError:
+            return None
 
 
 class AppAuth(httpx.Auth):
@@ -18,6 +93,8 @@ class AppAuth(httpx.Auth):
 
     :ivar token: User authentication token.
     :vartype token: str
+    :ivar store: The token storage.
+    :vartype store: TokenStore
     """
 
     token_path = os.path.join(
@@ -29,7 +106,7 @@ class AppAuth(httpx.Auth):
 
     def __init__(self) -> None:
         """Construct the token auth."""
-        self._token = None
+        self.store = TokenStore(self.token_path)
 
     def auth_flow(
         self,
@@ -48,33 +125,20 @@ class AppAuth(httpx.Auth):
 
     def delete_token(self) -> None:
         """Delete current auth token."""
-        self._token = None
         del self.token
 
     @property
     def token(self) -> str | None:
         """The user authentication token."""
-        if self._token:
-            return self._token
-
-        try:
-            with open(self.token_path, 'r') as file:
-                data = json.load(file)
-                return data.get('token')
-        except FileNotFoundError:
-            return None
+        return self.store.get()
 
     @token.setter
     def token(self, token: str) -> None:
-        data = {'token': token}
-        with open(self.token_path, 'w') as file:
-            json.dump(data, file, indent=2)
-        self._token = token
+        self.store.set(token)
 
     @token.deleter
     def token(self) -> None:
-        os.unlink(self.token_path)
-        self._token = None
+        self.store.delete()
 
 
 app_auth = AppAuth()
@@ -93,6 +157,97 @@ class ErrorResponse(Response):
         self.conn_error_msg = CONNECTION_ERROR_MSG
 
 
+#########################################################################
+# Client pool
+#########################################################################
+
+
+class ClientPool:
+    """App-lifetime http clients with keep-alive connection pooling.
+
+    The clients are created on first use and reused by all requests,
+    so the TCP connections to the server are not opened on every
+    request. HTTP/2 is used if the ``h2`` package is installed.
+
+    :param httpx.Limits limits: The connection pool limits, by default
+        the limits from the app settings.
+    :param http2: Use HTTP/2, by default if it is available.
+    :type http2: bool or None
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ) -> None:
+        """Construct the pool."""
+        self.limits = limits or httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._client = None
+        self._async_client = None
+        self._async_client_loop = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled sync http client (`httpx.Client`, reade-only)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                auth=app_auth, limits=self.limits, http2=self.http2
+            )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The pooled async client (`httpx.AsyncClient`, reade-only).
+
+        The connections of the async client are bound to the event
+        loop, the client is recreated if the running loop is changed.
+        The client of the previous loop is closed on its loop.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_client is None
+            or self._async_client.is_closed
+            or self._async_client_loop is not loop
+        ):
+            self._close_stale_client()
+            self._async_client = httpx.AsyncClient(
+                auth=app_auth, limits=self.limits, http2=self.http2
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the sync client connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _close_stale_client(self) -> None:
+        # The connections of the client are closed on the loop of them,
+        # when the loop runs again. The closed loop has no connections
+        # to close.
+        client, loop = self._async_client, self._async_client_loop
+        if client is None or client.is_closed or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the connections of all clients, on app exit."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+
+client_pool = ClientPool()
+
+
 #########################################################################
 # Request
 #########################################################################
@@ -100,16 +255,15 @@ class ErrorResponse(Response):
 
 def request_get(url: str) -> Response:
     """Send GET request."""
-    with httpx.Client(auth=app_auth) as client:
-        try:
-            response = client.get(
-                url=url,
-            )
-        except httpx.ConnectError:
-            print('Connection error')
-            return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
-        else:
-            return response
+    try:
+        response = client_pool.client.get(
+            url=url,
+        )
+    except httpx.ConnectError:
+        print('Connection error')
+        return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
+    else:
+        return response
 
 
 def request_post(
@@ -118,14 +272,14 @@ def request_post(
     token: bool = True,
 ) -> Response | ErrorResponse:
     """Send POST request."""
-    auth = app_auth if token else None
-
-    with httpx.Client(auth=auth) as client:
-        try:
-            response = client.post(url=url, json=payload)
-        except httpx.ConnectError:
-            print('Connection error')
-            return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
+    # The pooled client authenticates requests by default.
+    kwargs = {} if token else {'auth': None}
+
+    try:
+        response = client_pool.client.post(url=url, json=payload, **kwargs)
+    except httpx.ConnectError:
+        print('Connection error')
+        return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
     return response
 
 
@@ -134,34 +288,55 @@ def request_post(
 #########################################################################
 
 
-async def request_get_async(url: str) -> Response:
+async def request_get_async(
+    url: str,
+    headers: dict[str, str] | None = None,
+) -> Response:
     """Request the async GET method."""
-    async with httpx.AsyncClient(auth=app_auth) as client:
-        response = await client.get(url)
-    return response
+    kwargs = {'headers': headers} if headers else {}
+
+    try:
+        return await client_pool.async_client.get(url, **kwargs)
+    except httpx.ConnectError:
+        print('Connection error')
+        return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
 async def request_post_async(
-    url: str, payload: dict | None = None
-) -> Response:  # noqa: E501
+    url: str,
+    payload: dict | None = None,
+    headers: dict[str, str] | None = None,
+    token: bool = True,
+) -> Response:
     """Request the async POST method."""
-    async with httpx.AsyncClient(auth=app_auth) as client:
-        response = await client.post(url, json=payload)
-    return response
+    # The pooled client authenticates requests by default.
+    kwargs = {} if token else {'auth': None}
+    if headers:
+        kwargs['headers'] = headers
+
+    try:
+        return await client_pool.async_client.post(url, json=payload, **kwargs)
+    except httpx.ConnectError:
+        print('Connection error')
+        return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
 async def request_put_async(url: str, payload: dict) -> Response:
     """Request the async POST method."""
-    async with httpx.AsyncClient(auth=app_auth) as client:
-        response = await client.put(url, json=payload)
-    return response
+    try:
+        return await client_pool.async_client.put(url, json=payload)
+    except httpx.ConnectError:
+        print('Connection error')
+        return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
 async def request_delete_async(url: str) -> Response:
     """Request the async DELETE method."""
-    async with httpx.AsyncClient(auth=app_auth) as client:
-        response = await client.delete(url)
-    return response
+    try:
+        return await client_pool.async_client.delete(url)
+    except httpx.ConnectError:
+        print('Connection error')
+        return ErrorResponse(HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
 #########################################################################
@@ -177,7 +352,7 @@ class HttpGetMixin:
     @classmethod
     async def request_get_async(cls, url: str, payload: dict) -> Response:
         """Send http request, GET method."""
-        return await request_put_async(url, payload)
+        return await request_get_async(url)
 
 
 class HttpPostMixin:
@@ -190,6 +365,11 @@ class HttpPostMixin:
         """Send http request, POST method."""
         return await request_post_async(url, payload)
 
+    @classmethod
+    async def send_request_async(cls, url: str, payload: dict) -> Response:
+        """Send http request of the form data, POST method."""
+        return await cls.request_post_async(url, payload)
+
 
 class HttpPutMixin:
     """Request PUT method, the mixin."""
@@ -200,3 +380,8 @@ class HttpPutMixin:
     async def request_put_async(cls, url: str, payload: dict) -> Response:
         """Send http request, PUT method."""
         return await request_put_async(url, payload)
+
+    @classmethod
+    async def send_request_async(cls, url: str, payload: dict) -> Response:
+        """Send http request of the form data, PUT method."""
+        return await cls.request_put_async(url, payload)
@@ -0,0 +1,124 @@
+"""Durable journal of the unsent progress events."""
+
+import json
+import os.path
+import sqlite3
+import typing
+
+
+class JournalEntry(typing.NamedTuple):
+    """Progress event to send to server.
+
+    :ivar key: The idempotency key of event, the server may use it to
+        skip the repeated event.
+    :vartype key: str
+    :ivar url: URL to send the event.
+    :vartype url: str
+    :ivar payload: The event data.
+    :vartype payload: dict
+    """
+
+    key: str
+    url: str
+    payload: dict
+
+
+class ProgressJournal:
+    """Append-only journal of the unsent progress events.
+
+    The journal is the SQLite database in WAL mode. The appended
+    entries are buffered in memory and written by batch in a single
+    transaction, so the batch costs one disk sync, and the append adds
+    no disk access to the caller.
+
+    The database file is created on first write.
+
+    :param str path: Path to the database file.
+    :ivar sync_count: Count of the batch writes to database.
+    :vartype sync_count: int
+    """
+
+    def __init__(self, path: str) -> None:
+        """Construct the journal."""
+        self.path = path
+        self.sync_count = 0
+        self._buffer: list[JournalEntry] = []
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to journal database (`sqlite3.Connection`)."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=FULL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS progress ('
+                'seq INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'key TEXT NOT NULL UNIQUE, '
+                'url TEXT NOT NULL, '
+                'payload TEXT NOT NULL)'
+            )
+            self._connection = connection
+        return self._connection
+
+    @property
+    def is_created(self) -> bool:
+        """Is the database file created (`bool`, reade-only)."""
+        return self._connection is not None or os.path.exists(self.path)
+
+    def append(self, entry: JournalEntry) -> None:
+        """Add the entry to journal, to write on next sync."""
+        self._buffer.append(entry)
+
+    def sync(self) -> None:
+        """Write the appended entries to database."""
+        if not self._buffer:
+            return
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO progress (key, url, payload) '
+                'VALUES (?, ?, ?)',
+                [
+                    (entry.key, entry.url, json.dumps(entry.payload))
+                    for entry in self._buffer
+                ],
+            )
+        self._buffer.clear()
+        self.sync_count += 1
+
+    def entries(self) -> list[JournalEntry]:
+        """Get the journal entries in order of appending."""
+        if not self.is_created:
+            return list(self._buffer)
+        rows = self.connection.execute(
+            'SELECT key, url, payload FROM progress ORDER BY seq'
+        )
+        entries = [
+            JournalEntry(key, url, json.loads(payload))
+            for key, url, payload in rows
+        ]
+        return entries + self._buffer
+
+    def remove(self, keys: typing.Iterable[str]) -> None:
+        """Remove the sent entries from journal."""
+        keys = set(keys)
+        if not keys:
+            return
+        # The not written entries are just dropped.
+        self._buffer = [e for e in self._buffer if e.key not in keys]
+        if not self.is_created:
+            return
+        with self.connection:
+            self.connection.executemany(
+                'DELETE FROM progress WHERE key = ?',
+                [(key,) for key in keys],
+            )
+
+    def close(self) -> None:
+        """Write the appended entries and close the database."""
+        if self._buffer:
+            self.sync()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
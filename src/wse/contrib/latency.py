@@ -0,0 +1,197 @@
+"""Answer times of the exercise items, the adaptive question timeout."""
+
+import math
+import os.path
+import sqlite3
+import sys
+from array import array
+from pathlib import Path
+
+from wse.constants import (
+    DEFAULT_TIMEOUT,
+    LATENCY_PERCENTILE,
+    LATENCY_SAMPLES,
+    MAX_TIMEOUT,
+    MIN_TIMEOUT,
+)
+
+ITEM = 'item'
+"""Kind of the answer times of item (`str`).
+"""
+CATEGORY_KIND = 'category'
+"""Kind of the answer times of item category (`str`).
+"""
+SAMPLE_RATE = 10
+"""Count of the time units of stored answer time per second (`int`).
+"""
+
+
+def pack(samples: array) -> bytes:
+    """Pack the answer times to bytes, two bytes per time."""
+    if sys.byteorder == 'big':
+        samples = array('H', samples)
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def unpack(data: bytes) -> array:
+    """Unpack the answer times from bytes."""
+    samples = array('H', data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples
+
+
+def percentile(samples: array, fraction: float) -> int:
+    """Get the nearest-rank percentile of the samples.
+
+    >>> from array import array
+    >>> from wse.contrib.latency import percentile
+    >>> percentile(array('H', [30, 10, 20, 40]), 0.5)
+    20
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class AnswerLatency:
+    """Recent answer times of the exercise items and their categories.
+
+    The time from the question shown to the user assessment of item is
+    recorded for the item and its category. The question timeout of
+    item is the percentile of its recent answer times, of category
+    answer times if the item is not answered yet, so the known items
+    are shown faster.
+
+    The answer times are kept in tenths of second, two bytes per time,
+    the limited count of recent times per item. The changed times are
+    written to the SQLite database by :meth:`sync`, the database file
+    is created on first write.
+
+    :param str path: Path to the database file.
+    :param int size: Count of the recent answer times per item.
+    :param float fraction: The percentile of answer times to be the
+        timeout, from 0 to 1.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int = LATENCY_SAMPLES,
+        fraction: float = LATENCY_PERCENTILE,
+    ) -> None:
+        """Construct the answer times."""
+        self.path = path
+        self.size = size
+        self.fraction = fraction
+        self._samples: dict[tuple[str, str, str], array] | None = None
+        self._changed: set[tuple[str, str, str]] = set()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to database (`sqlite3.Connection`)."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS latency ('
+                'exercise TEXT NOT NULL, '
+                'kind TEXT NOT NULL, '
+                'key TEXT NOT NULL, '
+                'samples BLOB NOT NULL, '
+                'PRIMARY KEY (exercise, kind, key))'
+            )
+            self._connection = connection
+        return self._connection
+
+    @property
+    def samples(self) -> dict[tuple[str, str, str], array]:
+        """Answer times by exercise, kind and key (`dict`, reade-only).
+
+        Loaded from database on first access.
+        """
+        if self._samples is None:
+            self._samples = {}
+            if self._connection is not None or os.path.exists(self.path):
+                rows = self.connection.execute(
+                    'SELECT exercise, kind, key, samples FROM latency'
+                )
+                for exercise, kind, key, data in rows:
+                    self._samples[exercise, kind, key] = unpack(data)
+        return self._samples
+
+    def record(
+        self,
+        exercise: str,
+        item_id: object,
+        category: object,
+        seconds: float,
+    ) -> None:
+        """Record the answer time of item.
+
+        :param str exercise: The exercise URL, the items of exercises
+            are counted separately.
+        :param item_id: The answered item ID.
+        :param category: The item category, not counted if ``None``.
+        :param float seconds: The answer time.
+        """
+        sample = min(round(seconds * SAMPLE_RATE), 0xFFFF)
+        keys = [(exercise, ITEM, str(item_id))]
+        if category is not None:
+            keys.append((exercise, CATEGORY_KIND, str(category)))
+        for key in keys:
+            samples = self.samples.setdefault(key, array('H'))
+            samples.append(sample)
+            del samples[: -self.size]
+            self._changed.add(key)
+
+    def timeout(
+        self,
+        exercise: str,
+        item_id: object,
+        category: object = None,
+        default: float = DEFAULT_TIMEOUT,
+    ) -> float:
+        """Get the question timeout of item, in seconds.
+
+        :param str exercise: The exercise URL.
+        :param item_id: The item ID.
+        :param category: The item category.
+        :param float default: The timeout of item without answer times.
+        """
+        samples = self.samples.get((exercise, ITEM, str(item_id)))
+        if not samples and category is not None:
+            samples = self.samples.get(
+                (exercise, CATEGORY_KIND, str(category))
+            )
+        if not samples:
+            return default
+        seconds = percentile(samples, self.fraction) / SAMPLE_RATE
+        return min(max(seconds, MIN_TIMEOUT), MAX_TIMEOUT)
+
+    def sync(self) -> None:
+        """Write the changed answer times to database."""
+        if not self._changed:
+            return
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO latency '
+                '(exercise, kind, key, samples) VALUES (?, ?, ?, ?)',
+                [(*key, pack(self.samples[key])) for key in self._changed],
+            )
+        self._changed.clear()
+
+    def close(self) -> None:
+        """Write the changed answer times and close the database."""
+        self.sync()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+answer_latency = AnswerLatency(
+    os.path.join(Path(__file__).parent.parent, 'resources/latency.db')
+)
+"""The app answer times of the exercise items.
+"""
@@ -0,0 +1,366 @@
+"""Local mirror of the user's dictionary."""
+
+import os.path
+import sqlite3
+import typing
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from wse.constants import ID, NEXT, RESULTS
+from wse.contrib.payload import dumps, loads
+
+if typing.TYPE_CHECKING:
+    from wse.contrib.page_cache import CachedPage
+
+
+class SyncStats(typing.NamedTuple):
+    """Result of the mirror sync.
+
+    :ivar pages: Count of the requested pages.
+    :vartype pages: int
+    :ivar changed_pages: Count of the pages changed on server.
+    :vartype changed_pages: int
+    :ivar rows: Count of the received entries.
+    :vartype rows: int
+    :ivar removed_rows: Count of the entries removed from mirror.
+    :vartype removed_rows: int
+    :ivar is_complete: Are all pages of collection synced.
+    :vartype is_complete: bool
+    """
+
+    pages: int
+    changed_pages: int
+    rows: int
+    removed_rows: int
+    is_complete: bool
+
+
+class DictionaryMirror:
+    """Local mirror of the pagination pages and entries of dictionary.
+
+    The mirror is the SQLite database, it keeps the pages with their
+    ``ETag``/``Last-Modified`` validators and the entries of each
+    collection. The page of mirror is shown at once on the cold app
+    start, the sync revalidates each page and receives only the
+    changed pages.
+
+    The entries changed by the exercise answers are buffered in
+    memory and written by batch with :meth:`write_entries`, so the
+    answer adds no disk access to the caller. The buffered entries are
+    written before the mirror is read or changed otherwise.
+
+    The database file is created on first write.
+
+    :param str path: Path to the database file.
+    :ivar version: The counter of mirror changes.
+    :vartype version: int
+    """
+
+    def __init__(self, path: str) -> None:
+        """Construct the mirror."""
+        self.path = path
+        self.version = 0
+        self._buffer: dict[tuple[str, str], dict] = {}
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to mirror database (`sqlite3.Connection`)."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, '
+                'collection TEXT NOT NULL, '
+                'etag TEXT, '
+                'last_modified TEXT, '
+                'payload TEXT NOT NULL)'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'collection TEXT NOT NULL, '
+                'id TEXT NOT NULL, '
+                'data TEXT NOT NULL, '
+                'PRIMARY KEY (collection, id))'
+            )
+            self._connection = connection
+        return self._connection
+
+    @property
+    def is_created(self) -> bool:
+        """Is the database file created (`bool`, reade-only)."""
+        return self._connection is not None or os.path.exists(self.path)
+
+    @staticmethod
+    def collection(url: str) -> str:
+        """Get the collection of url, the url path."""
+        return urlsplit(url).path
+
+    def get_page(self, url: str) -> 'CachedPage | None':
+        """Get the mirrored page by url."""
+        from wse.contrib.page_cache import CachedPage
+
+        if not self.is_created:
+            return None
+        row = self.connection.execute(
+            'SELECT etag, last_modified, payload FROM pages WHERE url = ?',
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, payload = row
+        return CachedPage(url, loads(payload), etag, last_modified)
+
+    def put_page(self, page: 'CachedPage') -> None:
+        """Write the page and its entries to mirror."""
+        self.write_entries()
+        collection = self.collection(page.url)
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO pages '
+                '(url, collection, etag, last_modified, payload) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    page.url,
+                    collection,
+                    page.etag,
+                    page.last_modified,
+                    dumps(page.payload),
+                ),
+            )
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO entries (collection, id, data) '
+                'VALUES (?, ?, ?)',
+                [
+                    (collection, str(entry[ID]), dumps(entry))
+                    for entry in page.payload[RESULTS]
+                ],
+            )
+        self.version += 1
+
+    def put_entry(self, url: str, entry: dict) -> None:
+        """Write the entry changed locally to mirror.
+
+        The entry is replaced with the server entry on next sync.
+        """
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO entries (collection, id, data) '
+                'VALUES (?, ?, ?)',
+                (self.collection(url), str(entry[ID]), dumps(entry)),
+            )
+        self.version += 1
+
+    def buffer_entry(self, url: str, entry: dict) -> None:
+        """Add the entry changed locally to write on next batch.
+
+        The caller keeps the changed entry, so the mirror version is
+        not changed.
+        """
+        self._buffer[self.collection(url), str(entry[ID])] = entry
+
+    def write_entries(self) -> None:
+        """Write the buffered entries to mirror."""
+        if not self._buffer:
+            return
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO entries (collection, id, data) '
+                'VALUES (?, ?, ?)',
+                [
+                    (collection, item_id, dumps(entry))
+                    for (collection, item_id), entry in self._buffer.items()
+                ],
+            )
+        self._buffer.clear()
+
+    def update_entry(self, url: str, fields: dict) -> None:
+        """Change the fields of the mirrored entry saved by form.
+
+        The entry that is not mirrored is not added, it is received
+        on next sync.
+
+        :param str url: The url of the entries collection.
+        :param dict fields: The saved fields with entry id.
+        """
+        self.write_entries()
+        if not self.is_created:
+            return
+        key = (self.collection(url), str(fields[ID]))
+        row = self.connection.execute(
+            'SELECT data FROM entries WHERE collection = ? AND id = ?', key
+        ).fetchone()
+        if row is None:
+            return
+        entry = loads(row[0])
+        entry.update((k, v) for k, v in fields.items() if k != ID)
+        self.put_entry(url, entry)
+
+    def remove_entry(self, url: str, item_id: object) -> None:
+        """Remove the entry deleted on server from mirror.
+
+        :param str url: The url of the entries collection.
+        :param item_id: The deleted entry id.
+        """
+        self.write_entries()
+        if not self.is_created:
+            return
+        with self.connection:
+            cursor = self.connection.execute(
+                'DELETE FROM entries WHERE collection = ? AND id = ?',
+                (self.collection(url), str(item_id)),
+            )
+        if cursor.rowcount:
+            self.version += 1
+
+    def clear(self) -> None:
+        """Remove all pages and entries, the dictionary of user."""
+        self._buffer.clear()
+        if not self.is_created:
+            return
+        with self.connection:
+            self.connection.execute('DELETE FROM pages')
+            self.connection.execute('DELETE FROM entries')
+        self.version += 1
+
+    def entries(self, url: str) -> list[dict]:
+        """Get the mirrored entries of the collection of url."""
+        self.write_entries()
+        if not self.is_created:
+            return []
+        rows = self.connection.execute(
+            'SELECT data FROM entries WHERE collection = ? '
+            'ORDER BY CAST(id AS INTEGER)',
+            (self.collection(url),),
+        )
+        return [loads(data) for (data,) in rows]
+
+    def entry_batches(self, url: str, size: int) -> Iterator[list[dict]]:
+        """Get the mirrored entries of the collection by batches.
+
+        Each batch is read by its own query, the database is not kept
+        read between the batches, so the caller may yield the event
+        loop after each batch.
+
+        :param str url: The url of the entries collection.
+        :param int size: Count of the entries of batch.
+        """
+        self.write_entries()
+        if not self.is_created:
+            return
+        collection = self.collection(url)
+        rowid = 0
+        while True:
+            rows = self.connection.execute(
+                'SELECT rowid, data FROM entries '
+                'WHERE collection = ? AND rowid > ? '
+                'ORDER BY rowid LIMIT ?',
+                (collection, rowid, size),
+            ).fetchall()
+            if not rows:
+                return
+            rowid = rows[-1][0]
+            yield [loads(data) for _, data in rows]
+
+    def invalidate(self, url: str) -> None:
+        """Drop the pages of the entries collection changed by url.
+
+        The mirrored entries are kept, the dropped pages are received
+        on next sync.
+        """
+        if not self.is_created:
+            return
+        path = self.collection(url)
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM pages WHERE ? LIKE collection || '%'",
+                (path,),
+            )
+
+    async def sync(self, url: str) -> SyncStats:
+        """Sync the mirror with all pages of the collection.
+
+        Each mirrored page is revalidated by the conditional request,
+        the unchanged page is not transferred. If all pages are synced,
+        the entries and pages that are no more on server are removed.
+        The ``304 Not Modified`` response of the page that is not
+        mirrored fails the sync.
+
+        :param str url: Url of the first page of collection.
+        """
+        from wse.contrib.http_requests import request_get_async
+        from wse.contrib.page_cache import CachedPage
+
+        pages = changed_pages = rows = 0
+        seen_urls, seen_ids = [], []
+        while url:
+            page = self.get_page(url)
+            headers = page.validators if page is not None else None
+            response = await request_get_async(url, headers=headers)
+            pages += 1
+
+            if response.status_code == HTTPStatus.OK:
+                page = CachedPage.from_response(url, response)
+                self.put_page(page)
+                changed_pages += 1
+                rows += len(page.payload[RESULTS])
+            elif (
+                response.status_code != HTTPStatus.NOT_MODIFIED or page is None
+            ):
+                # The not modified reply to the request without
+                # validators has no page to keep.
+                return SyncStats(pages, changed_pages, rows, 0, False)
+
+            seen_urls.append(url)
+            seen_ids.extend(str(entry[ID]) for entry in page.payload[RESULTS])
+            url = page.payload[NEXT]
+
+        removed_rows = self._remove_unseen(
+            self.collection(seen_urls[0]), seen_urls, seen_ids
+        )
+        return SyncStats(pages, changed_pages, rows, removed_rows, True)
+
+    def close(self) -> None:
+        """Write the buffered entries and close the database."""
+        self.write_entries()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _remove_unseen(
+        self, collection: str, urls: list[str], ids: list[str]
+    ) -> int:
+        # Remove the pages and entries that are no more on server.
+        self.write_entries()
+        with self.connection:
+            self.connection.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY)'
+            )
+            self.connection.execute('DELETE FROM seen')
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO seen VALUES (?)',
+                [(key,) for key in urls + ids],
+            )
+            self.connection.execute(
+                'DELETE FROM pages WHERE collection = ? '
+                'AND url NOT IN (SELECT key FROM seen)',
+                (collection,),
+            )
+            cursor = self.connection.execute(
+                'DELETE FROM entries WHERE collection = ? '
+                'AND id NOT IN (SELECT key FROM seen)',
+                (collection,),
+            )
+        if cursor.rowcount:
+            self.version += 1
+        return cursor.rowcount
+
+
+dictionary_mirror = DictionaryMirror(
+    os.path.join(Path(__file__).parent.parent, 'resources/mirror.db')
+)
+"""The app mirror of the user's dictionary.
+"""
@@ -0,0 +1,176 @@
+"""Exercise tasks generated from the local mirror of dictionary."""
+
+import random
+
+from wse.constants import (
+    ANSWER_TEXT,
+    ASSESSMENT,
+    CATEGORY,
+    ID,
+    KNOW,
+    NOT_KNOW,
+    QUESTION_TEXT,
+)
+from wse.contrib.candidates import PROGRESS_ASSESSMENTS, CandidateIndex
+from wse.contrib.mirror import DictionaryMirror, dictionary_mirror
+from wse.contrib.scheduler import RepetitionScheduler
+
+ASSESSMENT_DELTAS = {KNOW: 1, NOT_KNOW: -1}
+"""Change of the item assessment by user answer (`dict[str, int]`).
+"""
+
+
+class LocalTaskGenerator:
+    """Generator of exercise tasks from the local mirror of dictionary.
+
+    Picks the item by the same lookup conditions as the server: period
+    of item addition, category, study stage, count of first or last
+    added items. If the mirrored entries have not the fields of the
+    active lookup conditions, no task is generated, so the task is
+    requested on server. The items are selected by
+    :class:`~wse.contrib.candidates.CandidateIndex`, the selected items
+    are shown in order of
+    :class:`~wse.contrib.scheduler.RepetitionScheduler`.
+
+    The assessment of answered item is changed locally, so the study
+    stage is changed while offline. The changed entries are written to
+    mirror by batch on :meth:`save`. The assessments are sent to server
+    by :class:`~wse.contrib.assessment.AssessmentQueue`, the next sync
+    of mirror brings the server assessments.
+
+    :param str url: Url of the entries collection.
+    :param str question: The entry field of task question.
+    :param str answer: The entry field of task answer.
+    :param mirror: The local mirror of dictionary.
+    :type mirror: DictionaryMirror
+    :param rng: The random generator to order the items, seed it for
+        the repeated order.
+    :type rng: random.Random or None
+    """
+
+    def __init__(
+        self,
+        url: str,
+        question: str,
+        answer: str,
+        mirror: DictionaryMirror = dictionary_mirror,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Construct the generator."""
+        self.url = url
+        self.question = question
+        self.answer = answer
+        self.mirror = mirror
+        self.rng = rng or random.Random()
+        self._entries: dict[str, dict] = {}
+        self._index = CandidateIndex([])
+        self._version: int | None = None
+        self._params: dict | None = None
+        self._found = 0
+        self._scheduler = RepetitionScheduler(self.rng)
+
+    @property
+    def is_available(self) -> bool:
+        """Has the mirror the entries (`bool`, reade-only)."""
+        return bool(self.entries)
+
+    @property
+    def entries(self) -> dict[str, dict]:
+        """Mirrored entries by id (`dict[str, dict]`, reade-only).
+
+        The entries are read again if the mirror is changed.
+        """
+        self._reload()
+        return self._entries
+
+    @property
+    def index(self) -> CandidateIndex:
+        """Index of the mirrored entries (`CandidateIndex`, reade-only).
+
+        The index is built again if the mirror is changed.
+        """
+        self._reload()
+        return self._index
+
+    def select(self, params: dict | None) -> int:
+        """Get the bitset of entries that match the lookup conditions.
+
+        The bitset is kept until the params or the mirror are changed,
+        the selected items are scheduled again if it is changed.
+        """
+        index = self.index
+        if params != self._params:
+            self._params = dict(params or {})
+            self._found = index.select(self._params)
+            self._scheduler = RepetitionScheduler(self.rng)
+            self._scheduler.extend(
+                (entry[ID], entry.get(ASSESSMENT, 0))
+                for entry in index.items(self._found)
+            )
+        return self._found
+
+    def candidates(self, params: dict | None) -> list[dict]:
+        """Get the entries that match the lookup conditions."""
+        return self.index.items(self.select(params))
+
+    def supports(self, params: dict | None) -> bool:
+        """Have the mirrored entries the fields of lookup conditions."""
+        return self.index.supports(params or {})
+
+    def generate(self, params: dict | None) -> dict | None:
+        """Get the task data, or ``None`` if no entry matches.
+
+        ``None`` is returned also if the mirrored entries have not the
+        fields of lookup conditions, the task is requested on server.
+        """
+        if not self.supports(params):
+            return None
+        found = self.select(params)
+        item_id = self._scheduler.next()
+        if item_id is None:
+            return None
+        entry = self._entries[item_id]
+        return {
+            ID: entry[ID],
+            QUESTION_TEXT: entry[self.question],
+            ANSWER_TEXT: entry[self.answer],
+            'item_count': found.bit_count(),
+            ASSESSMENT: entry.get(ASSESSMENT, 0),
+            CATEGORY: entry.get(CATEGORY),
+        }
+
+    def record(self, item_id: int | str, action: str) -> None:
+        """Change the item assessment by the user answer."""
+        entry = self.entries.get(str(item_id))
+        if entry is None:
+            return
+        low = min(low for low, _ in PROGRESS_ASSESSMENTS.values())
+        high = max(high for _, high in PROGRESS_ASSESSMENTS.values())
+        assessment = entry.get(ASSESSMENT, 0) + ASSESSMENT_DELTAS[action]
+        entry[ASSESSMENT] = max(low, min(high, assessment))
+        # The entry is written with the next batch, not on the answer.
+        self.mirror.buffer_entry(self.url, entry)
+
+        # The study stage of item may be changed.
+        self._index.update_stage(item_id, entry[ASSESSMENT])
+        if self._params is not None:
+            self._found = self._index.select(self._params)
+        position = self._index.positions[str(item_id)]
+        if self._found >> position & 1:
+            self._scheduler.record(item_id, entry[ASSESSMENT])
+        else:
+            self._scheduler.remove(item_id)
+
+    def save(self) -> None:
+        """Write the assessments changed by answers to mirror."""
+        self.mirror.write_entries()
+
+    def _reload(self) -> None:
+        if self._version != self.mirror.version:
+            self._version = self.mirror.version
+            self._entries = {
+                str(entry[ID]): entry
+                for entry in self.mirror.entries(self.url)
+            }
+            self._index = CandidateIndex(self._entries.values())
+            self._params = None
@@ -0,0 +1,135 @@
+"""Cache of the pagination pages of entry tables."""
+
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from httpx import Response
+
+from wse.constants import PAGE_CACHE_SIZE
+from wse.contrib.mirror import DictionaryMirror, dictionary_mirror
+from wse.contrib.payload import decode
+
+
+class CachedPage:
+    """Pagination page received from server.
+
+    :param str url: The page url.
+    :param dict payload: The page data.
+    :param etag: The ``ETag`` response header value.
+    :type etag: str or None
+    :param last_modified: The ``Last-Modified`` response header value.
+    :type last_modified: str or None
+    """
+
+    def __init__(
+        self,
+        url: str,
+        payload: dict,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Construct the page."""
+        self.url = url
+        self.payload = payload
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_response(cls, url: str, response: Response) -> 'CachedPage':
+        """Create the page from the http response."""
+        return cls(
+            url,
+            decode(response),
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+        )
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Headers of the conditional request (`dict`, reade-only).
+
+        The server replies 304 Not Modified if the page is unchanged.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """LRU cache of the pagination pages by url.
+
+    If the store is set, the pages are also written to the store, the
+    page dropped from cache is read from the store.
+
+    :param int maxsize: Maximum count of the cached pages.
+    :param store: The durable store of pages.
+    :type store: DictionaryMirror or None
+    """
+
+    def __init__(
+        self,
+        maxsize: int = PAGE_CACHE_SIZE,
+        store: DictionaryMirror | None = None,
+    ) -> None:
+        """Construct the cache."""
+        self.maxsize = maxsize
+        self.store = store
+        self._pages: OrderedDict[str, CachedPage] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get count of cached pages."""
+        return len(self._pages)
+
+    def __contains__(self, url: str) -> bool:
+        """Is the page of url cached."""
+        return url in self._pages
+
+    def get(self, url: str) -> CachedPage | None:
+        """Get the cached page by url."""
+        page = self._pages.get(url)
+        if page is not None:
+            self._pages.move_to_end(url)
+        elif self.store is not None:
+            page = self.store.get_page(url)
+            if page is not None:
+                self._add(page)
+        return page
+
+    def put(self, page: CachedPage) -> CachedPage:
+        """Add the page to cache, drop the least recently used page."""
+        self._add(page)
+        if self.store is not None:
+            self.store.put_page(page)
+        return page
+
+    def invalidate(self, url: str) -> None:
+        """Drop the pages of the entries collection changed by url.
+
+        The page is dropped if the changed url path starts with the
+        page url path, for example, the change of ``/api/v1/foreign/5/``
+        drops the pages of ``/api/v1/foreign/``.
+        """
+        path = urlsplit(url).path
+        for page_url in list(self._pages):
+            if path.startswith(urlsplit(page_url).path):
+                del self._pages[page_url]
+        if self.store is not None:
+            self.store.invalidate(url)
+
+    def clear(self) -> None:
+        """Drop all cached pages, the stored pages are kept."""
+        self._pages.clear()
+
+    def _add(self, page: CachedPage) -> None:
+        self._pages[page.url] = page
+        self._pages.move_to_end(page.url)
+        while len(self._pages) > self.maxsize:
+            self._pages.popitem(last=False)
+
+
+page_cache = PageCache(store=dictionary_mirror)
+"""The app cache of the pagination pages.
+"""
@@ -0,0 +1,41 @@
+"""Decoding and encoding of the JSON payloads.
+
+The faster ``orjson`` backend is used if it is installed, the standard
+``json`` module is used otherwise.
+"""
+
+import json
+
+from httpx import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+"""Name of the used JSON backend (`str`).
+"""
+
+
+def loads(data: bytes | str) -> object:
+    """Decode the JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: object) -> str:
+    """Encode the payload to the JSON document."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
+
+def decode(response: Response) -> object:
+    """Decode the response payload.
+
+    The response body is decoded from bytes once, without the text
+    decoding of :meth:`httpx.Response.json`.
+    """
+    return loads(response.content)
@@ -0,0 +1,85 @@
+"""Prefetch of the exercise tasks."""
+
+import asyncio
+import copy
+from collections import deque
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+
+from httpx import Response
+
+from wse.constants import TASK_PREFETCH_SIZE
+
+
+class TaskPrefetcher:
+    """Buffer of the upcoming exercise tasks.
+
+    Keeps the requests of the next tasks running in the background
+    while the user reads the current task, so the next task is shown
+    without waiting the server response.
+
+    The buffer is dropped if the task lookup parameters are changed,
+    or the server has no more tasks for them. If the caller is
+    cancelled while waiting the response, the request is kept at the
+    buffer head for the next call, so it is not sent again.
+
+    :param fetch: The coroutine function to request the task by lookup
+        parameters.
+    :param int size: Count of the buffered upcoming tasks.
+    :ivar params: The task lookup parameters of buffered tasks.
+    :vartype params: dict or None
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[dict], Awaitable[Response]],
+        size: int = TASK_PREFETCH_SIZE,
+    ) -> None:
+        """Construct the prefetcher."""
+        self.fetch = fetch
+        self.size = size
+        self.params = None
+        self._tasks: deque[asyncio.Task] = deque()
+
+    def __len__(self) -> int:
+        """Get count of buffered tasks."""
+        return len(self._tasks)
+
+    async def get(self, params: dict) -> Response:
+        """Get the response with next task.
+
+        :param dict params: The task lookup parameters.
+        """
+        if params != self.params:
+            self.invalidate()
+            self.params = copy.copy(params)
+
+        self._fill(1)
+        task = self._tasks.popleft()
+        # Request the following tasks while current task is awaited.
+        self._fill(self.size)
+        try:
+            response = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                self._tasks.appendleft(task)
+            raise
+
+        if response.status_code != HTTPStatus.OK:
+            self.invalidate()
+        return response
+
+    def invalidate(self) -> None:
+        """Drop the buffered tasks."""
+        while self._tasks:
+            task = self._tasks.popleft()
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Retrieve the exception to not log it.
+                task.exception()
+        self.params = None
+
+    def _fill(self, size: int) -> None:
+        while len(self._tasks) < size:
+            self._tasks.append(asyncio.create_task(self.fetch(self.params)))
@@ -0,0 +1,113 @@
+"""Spaced repetition scheduler of the exercise items."""
+
+import heapq
+import random
+import typing
+
+MAX_INTERVAL_EXPONENT = 12
+"""Exponent of the longest repetition interval (`int`).
+"""
+
+
+class RepetitionScheduler:
+    """Scheduler of the item repetitions in the exercise session.
+
+    The session time is counted in shown tasks. The item is due again
+    after the interval that doubles with each point of the item
+    assessment, so the unknown items are shown again in a few tasks,
+    and the well-known items are not shown again in the session.
+
+    The due items are kept in the heap, so the next item is got in
+    ``O(log n)``. The rescheduled item is pushed again, its previous
+    heap entry is skipped on pop.
+
+    The new items are shown in random order. The order is repeated,
+    if the random generator is seeded.
+
+    :param rng: The random generator to order the items.
+    :type rng: random.Random or None
+    :ivar step: Count of the shown tasks, the session time.
+    :vartype step: int
+    """
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        """Construct the scheduler."""
+        self.rng = rng or random.Random()
+        self.step = 0
+        self._heap: list[tuple[int, float, str]] = []
+        self._keys: dict[str, tuple[int, float]] = {}
+        self._assessments: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Get count of scheduled items."""
+        return len(self._keys)
+
+    def __contains__(self, item_id: object) -> bool:
+        """Is the item scheduled."""
+        return str(item_id) in self._keys
+
+    @staticmethod
+    def interval(assessment: int) -> int:
+        """Get count of tasks until the item is shown again."""
+        exponent = min(max(assessment, 0), MAX_INTERVAL_EXPONENT)
+        return 2 ** (exponent + 1)
+
+    def extend(self, items: typing.Iterable[tuple[object, int]]) -> None:
+        """Add the new items, one item is due per task.
+
+        :param items: The pairs of item id and item assessment.
+        """
+        items = list(items)
+        self.rng.shuffle(items)
+        for due, (item_id, assessment) in enumerate(items, self.step):
+            key = str(item_id)
+            self._assessments[key] = assessment
+            self._keys[key] = (due, self.rng.random())
+        self._heap = [
+            (due, rank, key) for key, (due, rank) in self._keys.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def next(self) -> str | None:
+        """Get the id of the item that is due first.
+
+        The item is scheduled again by its current assessment, as if
+        the task is passed without answer.
+
+        :return: The item id, ``None`` if no item is scheduled.
+        """
+        while self._heap:
+            due, rank, key = self._heap[0]
+            if self._keys.get(key) != (due, rank):
+                # The entry of rescheduled or removed item.
+                heapq.heappop(self._heap)
+                continue
+            self.step = max(self.step, due) + 1
+            self._push(key, self._assessments[key])
+            return key
+        return None
+
+    def record(self, item_id: object, assessment: int) -> None:
+        """Schedule the item by its new assessment."""
+        key = str(item_id)
+        if key in self._keys:
+            self._push(key, assessment)
+
+    def remove(self, item_id: object) -> None:
+        """Remove the item from schedule."""
+        key = str(item_id)
+        self._keys.pop(key, None)
+        self._assessments.pop(key, None)
+
+    def _push(self, key: str, assessment: int) -> None:
+        due = self.step + self.interval(assessment)
+        rank = self.rng.random()
+        self._assessments[key] = assessment
+        self._keys[key] = (due, rank)
+        heapq.heappush(self._heap, (due, rank, key))
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            # Drop the skipped entries.
+            self._heap = [
+                (due, rank, key) for key, (due, rank) in self._keys.items()
+            ]
+            heapq.heapify(self._heap)
@@ -0,0 +1,205 @@
+"""Search index of the dictionary entries."""
+
+import bisect
+import heapq
+import re
+import unicodedata
+from collections.abc import Iterable, Iterator
+
+from wse.constants import ID, SEARCH_LIMIT
+
+HOMOGLYPHS = str.maketrans('aceopxykmthb', 'асеорхукмтнв')
+"""Latin letters folded to the Cyrillic letters of the same look, the
+text typed on the wrong keyboard layout is found (`dict[int, str]`).
+"""
+TOKEN = re.compile(r'\w+')
+"""Pattern of the text token (`re.Pattern`).
+"""
+
+
+def normalize(text: str) -> str:
+    """Fold the text for search.
+
+    The text is case folded, the diacritics are removed, so ``ё`` is
+    ``е``, and the Latin letters of Cyrillic look are folded to the
+    Cyrillic letters.
+
+    >>> from wse.contrib.search import normalize
+    >>> normalize('Ёлка Café')
+    'елка саfе'
+    >>> normalize('KOT') == normalize('кот')
+    True
+    """
+    text = text.casefold()
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(c for c in text if not unicodedata.combining(c))
+    return text.translate(HOMOGLYPHS)
+
+
+def trigrams(token: str) -> set[str]:
+    """Get the trigrams of the token."""
+    return {token[i : i + 3] for i in range(len(token) - 2)}
+
+
+class SearchIndex:
+    """Inverted index of the dictionary entries.
+
+    The entry is found if each word of query is a part of the entry
+    text. The candidate entries are the intersection of the entries of
+    the trigrams of query words. If all query words are shorter than
+    three letters, the candidates are the entries of words with the
+    prefix, found in the sorted words. The candidates are checked by
+    the text.
+
+    The entries are added as the pagination pages are received, the
+    entry added again replaces the previous one.
+
+    :param fields: The entry fields to search in.
+    :type fields: Iterable[str]
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """Construct the index."""
+        self.fields = tuple(fields)
+        self._entries: dict[str, dict] = {}
+        self._texts: dict[str, str] = {}
+        self._order: dict[str, int] = {}
+        self._count = 0
+        self._words: dict[str, set[str]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+        self._sorted_words: list[str] = []
+        self._is_sorted = True
+
+    def __len__(self) -> int:
+        """Get count of indexed entries."""
+        return len(self._entries)
+
+    def __contains__(self, item_id: object) -> bool:
+        """Is the entry indexed."""
+        return str(item_id) in self._entries
+
+    def add(self, entry: dict) -> None:
+        """Add the entry to index, replace the entry of the same id."""
+        key = str(entry[ID])
+        if key in self._entries:
+            self.remove(key)
+
+        text = self._text(entry)
+        self._entries[key] = entry
+        self._texts[key] = text
+        self._order[key] = self._count
+        self._count += 1
+        for word in set(TOKEN.findall(text)):
+            keys = self._words.get(word)
+            if keys is None:
+                keys = self._words[word] = set()
+                self._is_sorted = False
+            keys.add(key)
+            for trigram in trigrams(word):
+                self._trigrams.setdefault(trigram, set()).add(key)
+
+    def extend(self, entries: Iterable[dict]) -> None:
+        """Add the entries to index."""
+        for entry in entries:
+            self.add(entry)
+
+    def remove(self, item_id: object) -> None:
+        """Remove the entry from index."""
+        key = str(item_id)
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        del self._entries[key]
+        del self._order[key]
+        for word in set(TOKEN.findall(text)):
+            keys = self._words[word]
+            keys.discard(key)
+            if not keys:
+                del self._words[word]
+                self._is_sorted = False
+            for trigram in trigrams(word):
+                keys = self._trigrams[trigram]
+                keys.discard(key)
+                if not keys:
+                    del self._trigrams[trigram]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for mapping in (
+            self._entries,
+            self._texts,
+            self._order,
+            self._words,
+            self._trigrams,
+        ):
+            mapping.clear()
+        self._sorted_words = []
+        self._is_sorted = True
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+        """Get the entries found by query.
+
+        :param str query: The search query.
+        :param int limit: Maximum count of the found entries.
+        :return: The found entries in order of addition, the earliest
+            added entries if more entries are found than the limit.
+        """
+        words = TOKEN.findall(normalize(query))
+        if not words:
+            return []
+        found = heapq.nsmallest(
+            limit,
+            (
+                key
+                for key in self._candidates(words)
+                if all(word in self._texts[key] for word in words)
+            ),
+            key=self._order.__getitem__,
+        )
+        return [self._entries[key] for key in found]
+
+    def matches(self, entry: dict, query: str) -> bool:
+        """Is the entry found by query, the entry may be not indexed.
+
+        :param dict entry: The entry to check.
+        :param str query: The search query.
+        """
+        words = TOKEN.findall(normalize(query))
+        text = self._text(entry)
+        return bool(words) and all(word in text for word in words)
+
+    def _text(self, entry: dict) -> str:
+        return normalize(
+            ' '.join(str(entry.get(field) or '') for field in self.fields)
+        )
+
+    def _candidates(self, words: list[str]) -> Iterator[str]:
+        long_words = [word for word in words if len(word) >= 3]
+        if long_words:
+            postings = sorted(
+                (
+                    self._trigrams.get(trigram, set())
+                    for word in long_words
+                    for trigram in trigrams(word)
+                ),
+                key=len,
+            )
+            yield from postings[0].intersection(*postings[1:])
+            return
+
+        # The longest word is the most selective.
+        word = max(words, key=len)
+        if not self._is_sorted:
+            self._sorted_words = sorted(self._words)
+            self._is_sorted = True
+        seen = set()
+        position = bisect.bisect_left(self._sorted_words, word)
+        while position < len(self._sorted_words):
+            indexed = self._sorted_words[position]
+            if not indexed.startswith(word):
+                break
+            for key in self._words[indexed] - seen:
+                seen.add(key)
+                yield key
+            position += 1
@@ -1,13 +1,20 @@
 """Task."""
 
-from wse.constants.literal import ANSWER_TEXT, ID, QUESTION_TEXT
+from collections import deque
+from collections.abc import Iterable
+
+from wse.constants.literal import ANSWER_TEXT, CATEGORY, ID, QUESTION_TEXT
 
 
 class Task:
     """Task.
 
+    Holds the current task data and the queue of the upcoming task
+    data received from server.
+
     :ivar params: Item lookup parameters to create  task by item.
-        Are sent to the server.
+        Are sent to the server. The queue of upcoming tasks is cleared
+        if the params are changed.
     :vartype params: dict[str, object] or None
     :ivar status: The task status, may be 'question' or 'answer'.
     :vartype status: str or None
@@ -16,9 +23,25 @@ class Task:
     def __init__(self) -> None:
         """Construct the task."""
         self._data = None
-        self.params = None
+        self._params = None
+        self._queue: deque[dict] = deque()
         self.status = None
 
+    def __len__(self) -> int:
+        """Get count of upcoming tasks."""
+        return len(self._queue)
+
+    @property
+    def params(self) -> dict[str, object] | None:
+        """Item lookup parameters (`dict[str, object]` or None)."""
+        return self._params
+
+    @params.setter
+    def params(self, value: dict[str, object] | None) -> None:
+        if value != self._params:
+            self._queue.clear()
+        self._params = value
+
     @property
     def data(self) -> dict[str, str | int | None]:
         """Task data for its execution (`dict[str, str | int | None]`).
@@ -31,6 +54,24 @@ class Task:
     def data(self, value: dict[str, str | int | None]) -> None:
         self._data = value
 
+    def extend(self, payloads: Iterable[dict]) -> None:
+        """Add the task data to queue of upcoming tasks."""
+        self._queue.extend(payloads)
+
+    def next(self) -> bool:
+        """Set the next task data from queue of upcoming tasks.
+
+        :return: ``False`` if the queue is empty, ``True`` otherwise.
+        """
+        if not self._queue:
+            return False
+        self._data = self._queue.popleft()
+        return True
+
+    def clear(self) -> None:
+        """Clear the queue of upcoming tasks."""
+        self._queue.clear()
+
     @property
     def question(self) -> str:
         """The text of the task question (`str`, reade-only)."""
@@ -45,3 +86,8 @@ class Task:
     def item_id(self) -> int:
         """Item ID on task (`int`, reade-only)."""
         return self.data[ID]
+
+    @property
+    def category(self) -> object:
+        """Item category on task, if replied (`object`, reade-only)."""
+        return self.data.get(CATEGORY)
@@ -1,41 +1,143 @@
 """Event time control."""
 
 import asyncio
+import typing
+from collections.abc import Callable
 
 from wse.constants import DEFAULT_TIMEOUT
 
 
+class Clock(typing.Protocol):
+    """Clock of the timer, the event loop is the clock."""
+
+    def time(self) -> float:
+        """Get the current monotonic time, in seconds."""
+
+    def call_at(
+        self, when: float, callback: Callable[[], None]
+    ) -> asyncio.Handle:
+        """Schedule the callback to call at the time."""
+
+
 class Timer:
-    """Event time control."""
+    """Event time control.
 
-    def __init__(self) -> None:
+    The timeout is counted down by the clock time. The countdown does
+    not create the task, the deadline callback is scheduled on the
+    clock. The pause keeps the remaining time of countdown, the
+    countdown is resumed with the remaining time.
+
+    :param float timeout: The default timeout, in seconds.
+    :param clock: The clock to count down by, the running event loop
+        if ``None``.
+    :type clock: Clock or None
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Clock | None = None,
+    ) -> None:
         """Construct the time control."""
-        self.timer = None
+        self.timeout = timeout
+        self.clock = clock
         self.pause = False
-        self.timeout = DEFAULT_TIMEOUT
+        self._clock: Clock | None = None
+        self._waiter: asyncio.Future | None = None
+        self._handle: asyncio.Handle | None = None
+        self._deadline: float | None = None
+        self._remaining: float | None = None
+        self._duration: float | None = None
+
+    @property
+    def remaining(self) -> float | None:
+        """Remaining time of countdown (`float` or None, reade-only).
+
+        In seconds, ``None`` if the timer is not started.
+        """
+        if self._deadline is not None:
+            return max(self._deadline - self._clock.time(), 0.0)
+        return self._remaining
 
-    async def start(self) -> None:
-        """Start event timer."""
-        self.timer = asyncio.create_task(asyncio.sleep(self.timeout))
-        await self.timer
+    @property
+    def elapsed(self) -> float | None:
+        """Counted down time of countdown (`float` or None, reade-only).
+
+        In seconds, without the pause, ``None`` if the timer is not
+        started.
+        """
+        remaining = self.remaining
+        if remaining is None:
+            return None
+        return self._duration - remaining
+
+    async def start(self, timeout: float | None = None) -> None:
+        """Start event timer, wait the timeout.
+
+        The previous countdown is cancelled. If the timer is paused,
+        the countdown starts on unpause.
+
+        :param timeout: The timeout of the event, in seconds, the
+            default timeout if ``None``.
+        :type timeout: float or None
+        """
+        self.cancel()
+        loop = asyncio.get_running_loop()
+        self._clock = self.clock or loop
+        self._waiter = waiter = loop.create_future()
+        self._duration = self.timeout if timeout is None else timeout
+        self._remaining = self._duration
+        if not self.pause:
+            self._schedule()
+        try:
+            await waiter
+        finally:
+            if self._waiter is waiter:
+                self._reset()
 
     def is_timer(self) -> bool:
         """Is the timer started."""
-        return bool(self.timer)
+        return self._waiter is not None and not self._waiter.done()
 
     def cancel(self) -> None:
         """Cancel event timer."""
         if self.is_timer():
-            self.timer.cancel()
+            self._waiter.cancel()
+        self._reset()
 
     def on_pause(self) -> None:
-        """Pause the event."""
+        """Pause the event, keep the remaining time."""
         self.pause = True
+        if self._handle is not None:
+            self._remaining = self.remaining
+            self._handle.cancel()
+            self._handle = None
+            self._deadline = None
 
     def is_pause(self) -> bool:
         """Is the event paused."""
         return self.pause
 
     def unpause(self) -> None:
-        """Unpause the event."""
+        """Unpause the event, resume the countdown."""
         self.pause = False
+        if self.is_timer() and self._handle is None:
+            self._schedule()
+
+    def _schedule(self) -> None:
+        self._deadline = self._clock.time() + self._remaining
+        self._handle = self._clock.call_at(self._deadline, self._expire)
+
+    def _expire(self) -> None:
+        self._handle = None
+        if self.is_timer():
+            self._waiter.set_result(None)
+
+    def _reset(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._waiter = None
+        self._handle = None
+        self._deadline = None
+        self._remaining = None
+        self._duration = None
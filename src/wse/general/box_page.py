@@ -1,5 +1,10 @@
 """Base application page box with methods."""
 
+import asyncio
+import importlib
+import inspect
+from collections.abc import Awaitable
+
 import toga
 from toga.style.pack import COLUMN
 from typing_extensions import Self
@@ -37,10 +42,21 @@ class GoToBoxMixin:
 
     @classmethod
     def set_window_content(cls, widget: toga.Widget, box: Self) -> None:
-        """Set page box to window content."""
+        """Set page box to window content.
+
+        Invoke the :py:meth:`on_close` method of the page box that is
+        replaced in the window content.
+        """
+        content = widget.window.content
+        if content is not box and isinstance(content, GoToBoxMixin):
+            content.on_close()
         widget.window.content = box
 
-    def goto_box_handler(self, widget: toga.Widget, box_name: str) -> None:
+    def goto_box_handler(
+        self,
+        widget: toga.Widget,
+        box_name: str,
+    ) -> asyncio.Future | None:
         """Go to page box by box name, button handler.
 
         Invoke the :py:meth:`on_open` method when the current page box
@@ -48,19 +64,92 @@ class GoToBoxMixin:
 
         :param toga.Button widget: The widget that generated the event.
         :param str box_name: The page box name to go.
+        :return: The running :py:meth:`on_open` coroutine, if any.
         """
         box = self.get_box(widget, box_name)
         self.set_window_content(widget, box)
-        box.on_open()
+        return box.invoke_on_open()
+
+    def invoke_on_open(self) -> asyncio.Future | None:
+        """Invoke the :py:meth:`on_open` method.
+
+        The page box is shown without waiting the coroutine
+        :py:meth:`on_open`, it runs on the event loop and fills in
+        the page box when the data arrives.
 
-    def on_open(self) -> None:
+        :return: The running :py:meth:`on_open` coroutine, if any.
+        """
+        opening = getattr(self, '_opening', None)
+        if opening is not None and not opening.done():
+            # The previous opening would fill in the stale data.
+            opening.cancel()
+        result = self.on_open()
+        if inspect.isawaitable(result):
+            self._opening = asyncio.ensure_future(result)
+            return self._opening
+        return None
+
+    def on_open(self) -> Awaitable[None] | None:
         """Run when the current box is assigned to the window content.
 
         Override it if it necessary to run same actions, then the
-        current box is assigned to :term:`window content`.
+        current box is assigned to :term:`window content`. May be
+        overridden by coroutine, to request the page data without
+        blocking the event loop.
         """
         pass
 
+    def on_close(self) -> None:
+        """Run when the current box is removed from the window content.
+
+        Override it if it necessary to run same actions, then the
+        current box is replaced in :term:`window content`.
+        """
+        pass
+
+
+class LazyBox:
+    """Page box of the app, created on first access, the descriptor.
+
+    The created page box is stored in the app instance dict, so the
+    next access bypasses the descriptor. The page box class may be set
+    by import path, then the page module is imported on first access.
+
+    Usage::
+
+        class App(toga.App):
+            box_main = LazyBox('wse.page.MainBox')
+
+    :param box_class: The page box class or its import path.
+    :type box_class: type[toga.Box] or str
+    """
+
+    def __init__(self, box_class: type[toga.Box] | str) -> None:
+        """Construct the descriptor."""
+        self.box_class = box_class
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Set the app attr name of page box."""
+        self.name = name
+
+    def __get__(self, app: toga.App | None, owner: type) -> toga.Box | Self:
+        """Get the page box, create it on first access."""
+        if app is None:
+            return self
+        if isinstance(self.box_class, str):
+            module_name, class_name = self.box_class.rsplit('.', 1)
+            module = importlib.import_module(module_name)
+            self.box_class = getattr(module, class_name)
+        box = self.box_class()
+        app.__dict__[self.name] = box
+        return box
+
+    @staticmethod
+    def is_created(app: toga.App, name: str) -> bool:
+        """Is the page box of app created."""
+        return name in app.__dict__
+
 
 class MessageBoxMixin:
     """Dialog message mixin."""
@@ -5,6 +5,7 @@ from httpx import Response
 from toga.sources import Source
 
 from wse.constants import ID
+from wse.contrib.page_cache import page_cache
 from wse.general.button import BtnApp
 
 
@@ -156,6 +157,9 @@ class ManagingWidgetDataFromResponse(ManagingWidgetData):
 
         response = await self.send_request_async(url, widget_data)
         if response.status_code == self.success_http_status:
+            # The cached table pages contain the changed entries.
+            page_cache.invalidate(url)
+            self.handle_saved(widget_data)
             self.clear_entry_input()
             self.handle_success(widget)
 
@@ -174,6 +178,16 @@ class ManagingWidgetDataFromResponse(ManagingWidgetData):
             'Subclasses must provide a send_request_async() method.'
         )
 
+    def handle_saved(self, payload: dict) -> None:
+        """Invoke with the saved entry data if success.
+
+        Currently, nothing is being implemented.
+        Yoy may **override** this method to update the shown entries.
+
+        :param dict payload: The sent entry data.
+        """
+        pass
+
     def handle_success(self, widget: toga.Widget) -> None:
         """Invoke if success.
 
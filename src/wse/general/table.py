@@ -1,15 +1,55 @@
 """Table classes."""
 
+import asyncio
+from http import HTTPStatus
+from urllib.parse import urlencode
+
+import httpx
 import toga
-from httpx import Response
 from toga.style import Pack
 from travertino.constants import ITALIC
 
-from wse.constants import NEXT, PREVIOUS, RESULTS
-from wse.contrib.http_requests import request_delete_async, request_get
-from wse.contrib.utils import to_entries
+from wse.constants import (
+    ID,
+    NEXT,
+    PREVIOUS,
+    RESULTS,
+    SEARCH_DEBOUNCE,
+    SEARCH_INDEX_BATCH,
+    SEARCH_PARAM,
+    SERVER_SEARCH,
+)
+from wse.contrib.http_requests import (
+    request_delete_async,
+    request_get_async,
+)
+from wse.contrib.mirror import dictionary_mirror
+from wse.contrib.page_cache import CachedPage, page_cache
+from wse.contrib.payload import decode
+from wse.contrib.search import SearchIndex
 from wse.general.box_page import BoxApp
 from wse.general.button import BtnApp, SmBtn
+from wse.general.text_input import TextInputApp
+from wse.source.virtual import VirtualSource
+
+
+class SourceRefresh:
+    """Listener of the table source to reload all table rows at once.
+
+    The source emits the ``refresh`` notification after bulk load of
+    entries.
+
+    :param Table table: The table to reload.
+    """
+
+    def __init__(self, table: toga.Table) -> None:
+        """Construct the listener."""
+        self.table = table
+
+    def refresh(self) -> None:
+        """Reload all table rows from the source."""
+        # Setting the data makes the backend reload the native rows.
+        self.table.data = self.table.data
 
 
 class BaseTable(toga.Table):
@@ -25,8 +65,20 @@ class BaseTable(toga.Table):
             font_style=ITALIC,
         )
         kwargs['style'] = kwargs.get('style', style)
+        self._source_refresh = SourceRefresh(self)
         super().__init__(*arge, **kwargs)
 
+    @toga.Table.data.setter
+    def data(self, data: object) -> None:
+        """Set the table source, stop to listen the previous source."""
+        previous = getattr(self, '_data', None)
+        if previous is not None and previous is not data:
+            for listener in (self._impl, self._source_refresh):
+                if listener in previous.listeners:
+                    previous.remove_listener(listener)
+        toga.Table.data.fset(self, data)
+        self._data.add_listener(self._source_refresh)
+
 
 class TableApp(BoxApp):
     """Base table, the container.
@@ -56,8 +108,14 @@ class TableApp(BoxApp):
     :cvar headings: The entries table column name.
 
     :ivar btns_manage: The box of buttons for managing of entries.
+    :ivar input_search: The search query input, the found entries are
+        shown instead of the page while the query is not empty.
     :ivar table: The table of entries list.
     :ivar btns_paginate: The box of buttons for managing of pagination.
+    :ivar all_entries: The source of all entries of the collection,
+        shown instead of pagination pages to scroll the whole list.
+    :ivar search_index: The index of the received entries to search.
+    :ivar found_entries: The source of the found entries.
     """
 
     source_class = None
@@ -76,11 +134,16 @@ class TableApp(BoxApp):
         self._next_pagination_url = None
         self.current_pagination_url = None
         self._previous_pagination_url = None
+        # The last requested pagination url.
+        self._requested_url = None
+        # The adjacent pages requested in background.
+        self._prefetching: dict[str, asyncio.Future] = {}
         # The pagination buttons.
         self._btn_previous = BtnApp('<', on_press=self.previous_handler)
         self._btn_table_reload = BtnApp(
             'Обновить', on_press=self.reload_handler
         )
+        self._btn_scroll_all = BtnApp('Все', on_press=self.scroll_all_handler)
         self._btn_next = BtnApp('>', on_press=self.next_handler)
         # By default, the pagination buttons is disabled.
         self._btn_previous.enabled = False
@@ -88,9 +151,33 @@ class TableApp(BoxApp):
         # Pagination buttons group.
         self.btns_paginate = toga.Box(
             children=[
-                self._btn_previous, self._btn_table_reload, self._btn_next
+                self._btn_previous,
+                self._btn_table_reload,
+                self._btn_scroll_all,
+                self._btn_next,
             ]
-        )  # fmt: skip
+        )
+
+        # All entries of the collection.
+        self.all_entries = VirtualSource(
+            schema=self.entry.schema,
+            url=self.source_url,
+            accessors=self.entry.accessors,
+        )
+
+        # The search of the received entries.
+        self.search_index = SearchIndex(self.entry.accessors)
+        self.found_entries = type(self.entry)()
+        # The table source shown before search.
+        self._source_before_search = None
+        self._is_mirror_indexed = False
+        self._mirror_indexing: asyncio.Future | None = None
+        # The search request on server, the number of the last query.
+        self._search_task: asyncio.Future | None = None
+        self._search_number = 0
+        self.input_search = TextInputApp(
+            placeholder='Поиск', on_change=self.search_handler
+        )
 
         # The table entries management buttons.
         self._btn_create = SmBtn('Добавить', on_press=self.create_handler)
@@ -132,40 +219,249 @@ class TableApp(BoxApp):
         )
 
     async def delete_handler(self, _: toga.Widget) -> None:
-        """Delete the entry, button handler."""
+        """Delete the entry, button handler.
+
+        The deleted entry is removed from the table without the page
+        request, the entry deleted while searching is removed from the
+        table source shown before search too.
+        """
         entry = self.table.selection
         url = self.source_url_detail % entry.id
-        await request_delete_async(url)
-        self.populate_table(self.current_pagination_url)
-
-    def reload_handler(self, _: toga.Widget) -> None:
+        response = await request_delete_async(url)
+        if response.is_success:
+            page_cache.invalidate(url)
+            dictionary_mirror.remove_entry(self.source_url, entry.id)
+            self.search_index.remove(entry.id)
+            if self.is_search:
+                source = self._source_before_search or self.entry
+                source.remove_by_id(entry.id)
+            self.table.data.remove_by_id(entry.id)
+
+    async def reload_handler(self, _: toga.Widget) -> None:
         """Update the table, button handler."""
-        self.populate_table()
+        if self.is_scroll_all:
+            await self.all_entries.load()
+        else:
+            await self.populate_table()
 
-    def previous_handler(self, _: toga.Widget) -> None:
+    async def scroll_all_handler(self, _: toga.Widget) -> None:
+        """Switch the table to all entries or to pages, button handler.
+
+        The pagination buttons are disabled while all entries are
+        shown.
+        """
+        self.clear_search()
+        if self.is_scroll_all:
+            self.table.data = self.entry
+            await self.populate_table(self.current_pagination_url)
+        else:
+            self.table.data = self.all_entries
+            self.next_pagination_url = None
+            self.previous_pagination_url = None
+            await self.all_entries.load()
+
+    def search_handler(self, _: toga.Widget) -> None:
+        """Show the entries found by the query, input handler.
+
+        The entries of the received pages and of the mirrored
+        dictionary indexed so far are found at once, then the server
+        search is requested. The empty query shows the table source
+        shown before search.
+        """
+        query = (self.input_search.value or '').strip()
+        if not query:
+            self.clear_search()
+            return
+
+        self.start_mirror_indexing()
+        self.found_entries.load_items(self.search_index.search(query))
+        if not self.is_search:
+            self._source_before_search = self.table.data
+            self.table.data = self.found_entries
+        if SERVER_SEARCH:
+            self.schedule_server_search(query)
+
+    async def previous_handler(self, _: toga.Widget) -> None:
         """Populate the table by previous pagination, button handler."""
-        self.populate_table(self.previous_pagination_url)
+        await self.populate_table(self.previous_pagination_url)
 
-    def next_handler(self, _: toga.Widget) -> None:
+    async def next_handler(self, _: toga.Widget) -> None:
         """Populate the table by next pagination, button handler."""
-        self.populate_table(self.next_pagination_url)
+        await self.populate_table(self.next_pagination_url)
 
     ####################################################################
     # Any methods.
 
-    def on_open(self) -> None:
-        """Invoke the populate the table when the table opens."""
-        if bool(self.current_pagination_url):
-            self.populate_table(self.current_pagination_url)
+    @property
+    def is_search(self) -> bool:
+        """Is the table showing found entries (`bool`, reade-only)."""
+        return self.table.data is self.found_entries
+
+    def clear_search(self) -> None:
+        """Clear the query, show the table source before search."""
+        self.cancel_server_search()
+        if self.input_search.value:
+            self.input_search.value = ''
+        if self.is_search:
+            self.table.data = self._source_before_search or self.entry
+        self._source_before_search = None
+
+    def search_url(self, query: str) -> str:
+        """Get url of the server search."""
+        return f'{self.source_url}?{urlencode({SEARCH_PARAM: query})}'
+
+    def schedule_server_search(self, query: str) -> None:
+        """Request the server search after the keystrokes pause.
+
+        The search request of the previous query is cancelled, if it
+        is waiting for the pause or for the response.
+        """
+        self.cancel_server_search()
+        self._search_number += 1
+        self._search_task = asyncio.ensure_future(
+            self.server_search(query, self._search_number)
+        )
+
+    def cancel_server_search(self) -> None:
+        """Cancel the search request on server."""
+        if self._search_task is not None:
+            self._search_task.cancel()
+            self._search_task = None
+
+    async def server_search(self, query: str, number: int) -> None:
+        """Show the entries found by server.
+
+        The response is shown only if it is the response of the last
+        query and the found entries are shown. The server entries are
+        checked by the query, so the entries of server that ignores
+        the search are not shown, and are shown with the local found
+        entries. The failed request keeps the local found entries.
+
+        :param str query: The search query.
+        :param int number: The number of query.
+        """
+        await asyncio.sleep(SEARCH_DEBOUNCE)
+        try:
+            response = await request_get_async(self.search_url(query))
+        except httpx.HTTPError:
+            # The local found entries are kept.
+            return
+        if number != self._search_number or not self.is_search:
+            return
+        if response.status_code == HTTPStatus.OK:
+            self.search_index.extend(
+                item
+                for item in decode(response)[RESULTS]
+                if self.search_index.matches(item, query)
+            )
+            self.found_entries.load_items(self.search_index.search(query))
+
+    def start_mirror_indexing(self) -> None:
+        """Start to index the mirrored entries in background."""
+        if self._is_mirror_indexed:
+            return
+        if self._mirror_indexing is None or self._mirror_indexing.done():
+            self._mirror_indexing = asyncio.ensure_future(
+                self.index_mirrored_entries()
+            )
+
+    async def index_mirrored_entries(self) -> None:
+        """Add the mirrored entries that are not received to index.
+
+        The entries are read and indexed by batches, the event loop is
+        released after each batch, so the keystrokes are not blocked.
+        The shown search is repeated when all entries are indexed.
+        """
+        batches = dictionary_mirror.entry_batches(
+            self.source_url, SEARCH_INDEX_BATCH
+        )
+        for batch in batches:
+            self.search_index.extend(
+                entry for entry in batch if entry[ID] not in self.search_index
+            )
+            await asyncio.sleep(0)
+        self._is_mirror_indexed = True
+
+        query = (self.input_search.value or '').strip()
+        if self.is_search and query:
+            self.found_entries.load_items(self.search_index.search(query))
+
+    def handle_saved_entry(self, payload: dict) -> None:
+        """Change the entry saved by form in the index and mirror.
+
+        :param dict payload: The saved fields with entry id.
+        """
+        self.search_index.add(payload)
+        dictionary_mirror.update_entry(self.source_url, payload)
+
+    def forget_entries(self) -> None:
+        """Drop the received entries, the entries of previous user.
+
+        The table is populated again on next page opening.
+        """
+        self.clear_search()
+        if self._mirror_indexing is not None:
+            self._mirror_indexing.cancel()
+            self._mirror_indexing = None
+        self.search_index.clear()
+        self._is_mirror_indexed = False
+        if self.is_scroll_all:
+            self.table.data = self.entry
+        self.all_entries.clear()
+        self.entry.clear()
+        self._requested_url = None
+        self.current_pagination_url = None
+        self.next_pagination_url = None
+        self.previous_pagination_url = None
+
+    @property
+    def is_scroll_all(self) -> bool:
+        """Is the table showing all entries (`bool`, reade-only)."""
+        return self.table.data is self.all_entries
+
+    async def on_open(self) -> None:
+        """Invoke the populate the table when the table opens.
+
+        The search index of mirrored entries is built in background.
+        """
+        self.start_mirror_indexing()
+        if self.is_scroll_all:
+            await self.all_entries.load()
+        elif bool(self.current_pagination_url):
+            await self.populate_table(self.current_pagination_url)
         else:
-            self.populate_table()
+            await self.populate_table()
+
+    async def populate_table(self, url: str | None = None) -> None:
+        """Populate the table by the pagination page of url.
 
-    def populate_table(self, url: str | None = None) -> None:
-        """Populate the table on url request."""
-        self.clear_table()
-        entries = self.request_entries(url)
-        for entry in entries:
-            self.entry.add_entry(entry)
+        The cached page is shown at once, then it is revalidated on
+        server and shown again if it has changed. The adjacent pages
+        are requested in background.
+        """
+        url = url or self.source_url
+        self._requested_url = url
+        self.clear_search()
+
+        cached = page_cache.get(url)
+        if cached is not None:
+            self.show_page(cached)
+
+        page = await self.request_page(url)
+        # Other page may be requested while waiting for response.
+        if self._requested_url != url:
+            return
+        if page is None and cached is None:
+            self.clear_table()
+        elif page is not None and page is not cached:
+            self.show_page(page)
+        self.prefetch_pages()
+
+    def show_page(self, page: CachedPage) -> None:
+        """Fill the table with entries of the pagination page."""
+        self.entry.load_items(page.payload[RESULTS])
+        self.search_index.extend(page.payload[RESULTS])
+        self.set_pagination_urls(page)
 
     def clear_table(self) -> None:
         """Clear the table."""
@@ -174,22 +470,39 @@ class TableApp(BoxApp):
     ####################################################################
     # Url methods.
 
-    def request_entries(
-        self,
-        pagination_url: str | None = None,
-    ) -> list[tuple[str, ...]]:
-        """Request the entries to populate the table."""
-        response = request_get(pagination_url or self.source_url)
-        self.set_pagination_urls(response)
-        payload = response.json()
-        return to_entries(payload[RESULTS])
-
-    def set_pagination_urls(self, response: Response) -> None:
+    async def request_page(self, url: str) -> CachedPage | None:
+        """Request the pagination page, revalidate the cached page.
+
+        :return: The page, or ``None`` if the request is failed.
+        """
+        cached = page_cache.get(url)
+        headers = cached.validators if cached is not None else None
+        response = await request_get_async(url, headers=headers)
+
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return cached
+        if response.status_code == HTTPStatus.OK:
+            page = page_cache.put(CachedPage.from_response(url, response))
+            self.search_index.extend(page.payload[RESULTS])
+            return page
+        return None
+
+    def prefetch_pages(self) -> None:
+        """Request the next and previous pages in background."""
+        for url in (self.next_pagination_url, self.previous_pagination_url):
+            if not url or url in page_cache or url in self._prefetching:
+                continue
+            task = asyncio.ensure_future(self.request_page(url))
+            self._prefetching[url] = task
+            task.add_done_callback(
+                lambda _, url=url: self._prefetching.pop(url, None)
+            )
+
+    def set_pagination_urls(self, page: CachedPage) -> None:
         """Set pagination urls."""
-        payload = response.json()
-        self.next_pagination_url = payload[NEXT]
-        self.current_pagination_url = response.url
-        self.previous_pagination_url = payload[PREVIOUS]
+        self.next_pagination_url = page.payload[NEXT]
+        self.current_pagination_url = page.url
+        self.previous_pagination_url = page.payload[PREVIOUS]
 
     @property
     def next_pagination_url(self) -> str:
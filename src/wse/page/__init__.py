@@ -1,27 +1,67 @@
-"""App boxes to assign to window content."""
-
-from wse.page.foreign import (
-    CreateWordPage,
-    ExerciseForeignPage,
-    ListForeignPage,
-    MainForeignPage,
-    ParamForeignPage,
-    UpdateWordPage,
-)
-from wse.page.glossary import (
-    CreateTermPage,
-    ExerciseGlossaryBox,
-    ListTermPage,
-    MainGlossaryPage,
-    ParamGlossaryBox,
-    UpdateTermPage,
-)
-from wse.page.main import (
-    MainBox,
-)
-from wse.page.user import (
-    LoginBox,
-)
+"""App boxes to assign to window content.
+
+The page modules are imported on first access to the page box class.
+"""
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from wse.page.foreign import (
+        CreateWordPage,
+        ExerciseForeignPage,
+        ListForeignPage,
+        MainForeignPage,
+        ParamForeignPage,
+        UpdateWordPage,
+    )
+    from wse.page.glossary import (
+        CreateTermPage,
+        ExerciseGlossaryBox,
+        ListTermPage,
+        MainGlossaryPage,
+        ParamGlossaryBox,
+        UpdateTermPage,
+    )
+    from wse.page.main import (
+        MainBox,
+    )
+    from wse.page.user import (
+        LoginBox,
+    )
+
+_MODULES = {
+    'CreateWordPage': 'wse.page.foreign',
+    'ExerciseForeignPage': 'wse.page.foreign',
+    'ListForeignPage': 'wse.page.foreign',
+    'MainForeignPage': 'wse.page.foreign',
+    'ParamForeignPage': 'wse.page.foreign',
+    'UpdateWordPage': 'wse.page.foreign',
+    'CreateTermPage': 'wse.page.glossary',
+    'ExerciseGlossaryBox': 'wse.page.glossary',
+    'ListTermPage': 'wse.page.glossary',
+    'MainGlossaryPage': 'wse.page.glossary',
+    'ParamGlossaryBox': 'wse.page.glossary',
+    'UpdateTermPage': 'wse.page.glossary',
+    'MainBox': 'wse.page.main',
+    'LoginBox': 'wse.page.user',
+}
+"""Page box class name to its module name (`dict[str, str]`).
+"""
+
+
+def __getattr__(name: str) -> type:
+    """Import the page box class on first access."""
+    try:
+        module_name = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+    page_class = getattr(importlib.import_module(module_name), name)
+    globals()[name] = page_class
+    return page_class
+
 
 __all__ = (
     'CreateWordPage',
@@ -26,6 +26,7 @@ from wse.constants import (
     FOREIGN_PATH,
     FOREIGN_WORD,
     HOST_API,
+    ID,
     MAIN_BOX,
     RUSSIAN_WORD,
     TITLE_FOREIGN_CREATE,
@@ -39,8 +40,9 @@ from wse.container.exercise import ExerciseBox, ExerciseParamSelectionsBox
 from wse.contrib.http_requests import (
     HttpPostMixin,
     HttpPutMixin,
-    request_get,
+    request_get_async,
 )
+from wse.contrib.offline import LocalTaskGenerator
 from wse.general.box_page import BoxApp
 from wse.general.button import BtnApp
 from wse.general.form import BaseForm
@@ -113,10 +115,10 @@ class ParamForeignPage(HttpPutMixin, ExerciseParamSelectionsBox):
         self.set_window_content(widget, exercise_box)
         await exercise_box.loop_task()
 
-    def on_open(self) -> None:
+    async def on_open(self) -> None:
         """Request and fill params data of box when box open."""
         url = urljoin(HOST_API, FOREIGN_PARAMS_PATH)
-        response = request_get(url=url)
+        response = await request_get_async(url)
         if response.status_code == HTTPStatus.OK:
             self.lookup_conditions = response.json()
 
@@ -141,6 +143,9 @@ class ExerciseForeignPage(ExerciseBox):
         super().__init__()
         self.url_exercise = urljoin(HOST_API, FOREIGN_EXERCISE_PATH)
         self.url_progress = urljoin(HOST_API, FOREIGN_ASSESSMENT_PATH)
+        self.local_tasks = LocalTaskGenerator(
+            urljoin(HOST_API, FOREIGN_PATH), FOREIGN_WORD, RUSSIAN_WORD
+        )
 
         # Buttons.
         self.btn_goto_params = BtnApp(
@@ -259,6 +264,14 @@ class UpdateWordPage(HttpPutMixin, FormForeign):
     url = urljoin(HOST_API, FOREIGN_DETAIL_PATH)
     btn_submit_name = 'Изменить'
 
+    def handle_saved(self, payload: dict) -> None:
+        """Update the word in the foreign list table in place."""
+        list_box = self.root.app.box_foreign_list
+        list_box.handle_saved_entry(payload)
+        list_box.table.data.update_entry(
+            (payload[ID], payload[FOREIGN_WORD], payload[RUSSIAN_WORD])
+        )
+
     def handle_success(self, widget: toga.Widget) -> None:
         """Go to foreign list page, if success."""
         self.goto_box_handler(widget, FOREIGN_LIST_BOX)
@@ -266,7 +279,7 @@ class UpdateWordPage(HttpPutMixin, FormForeign):
     def get_widget_data(self) -> dict:
         """Get the entered into the form data."""
         submit_entry = {
-            'id': str(self.entry.id),
+            ID: str(self.entry.id),
             FOREIGN_WORD: self.input_foreign.value,
             RUSSIAN_WORD: self.input_native.value,
         }
@@ -301,6 +314,7 @@ class ListForeignPage(TableApp):
             self.label_title,
             self.btn_goto_foreign_main,
             self.btns_manage,
+            self.input_search,
             self.table,
             self.btns_paginate,
         )
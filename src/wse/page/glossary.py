@@ -22,6 +22,7 @@ from wse.constants import (
     GLOSSARY_PATH,
     GLOSSARY_PROGRESS_PATH,
     HOST_API,
+    ID,
     MAIN_BOX,
     TITLE_GLOSSARY_CREATE,
     TITLE_GLOSSARY_EXERCISE,
@@ -37,9 +38,10 @@ from wse.container.exercise import (
 from wse.contrib.http_requests import (
     HttpPostMixin,
     HttpPutMixin,
-    request_get,
-    request_post,
+    request_get_async,
+    request_post_async,
 )
+from wse.contrib.offline import LocalTaskGenerator
 from wse.general.box_page import (
     BoxApp,
 )
@@ -112,20 +114,20 @@ class ParamGlossaryBox(ExerciseParamSelectionsBox):
         self.set_window_content(widget, exercise_box)
         await exercise_box.loop_task()
 
-    def on_open(self) -> None:
+    async def on_open(self) -> None:
         """Request and fill params data."""
         url = urljoin(HOST_API, GLOSSARY_PARAMS_PATH)
-        response = request_get(url=url)
+        response = await request_get_async(url)
         if response.status_code == HTTPStatus.OK:
             self.lookup_conditions = response.json()
 
-    def save_params_handler(self, _: toga.Widget) -> None:
+    async def save_params_handler(self, _: toga.Widget) -> None:
         """Save Glossary Exercise parameters, button handler.
 
         Request to save user exercise parameters.
         """
         url = urljoin(HOST_API, GLOSSARY_PARAMS_PATH)
-        request_post(url, self.lookup_conditions)
+        await request_post_async(url, self.lookup_conditions)
 
 
 class ExerciseGlossaryBox(ExerciseBox):
@@ -136,6 +138,9 @@ class ExerciseGlossaryBox(ExerciseBox):
         super().__init__()
         self.url_exercise = urljoin(HOST_API, GLOSSARY_EXERCISE_PATH)
         self.url_progress = urljoin(HOST_API, GLOSSARY_PROGRESS_PATH)
+        self.local_tasks = LocalTaskGenerator(
+            urljoin(HOST_API, GLOSSARY_PATH), 'term', 'definition'
+        )
 
         # Widgets.
         self.label_title = TitleLabel(TITLE_GLOSSARY_EXERCISE)
@@ -194,8 +199,8 @@ class FormGlossary(BaseForm):
 
     def populate_entry_input(self) -> None:
         """Populate the entry input widgets value."""
-        self.input_term.value = self.entry.input_term
-        self.input_definition.value = self.entry.input_definition
+        self.input_term.value = self.entry.term
+        self.input_definition.value = self.entry.definition
 
     def clear_entry_input(self) -> None:
         """Clear the entry input widgets value."""
@@ -230,6 +235,14 @@ class UpdateTermPage(HttpPutMixin, FormGlossary):
     url = urljoin(HOST_API, GLOSSARY_DETAIL_PATH)
     btn_submit_name = 'Изменить'
 
+    def handle_saved(self, payload: dict) -> None:
+        """Update the term in the glossary list table in place."""
+        list_box = self.root.app.box_glossary_list
+        list_box.handle_saved_entry(payload)
+        list_box.table.data.update_entry(
+            (payload[ID], payload['term'], payload['definition'])
+        )
+
     def handle_success(self, widget: toga.Widget) -> None:
         """Go to glossary list page, if success."""
         self.goto_box_handler(widget, GLOSSARY_LIST_BOX)
@@ -237,7 +250,7 @@ class UpdateTermPage(HttpPutMixin, FormGlossary):
     def get_widget_data(self) -> dict:
         """Get the entered into the form data."""
         submit_entry = {
-            'id': str(self.entry.id),
+            ID: str(self.entry.id),
             'term': self.input_term.value,
             'definition': self.input_definition.value,
         }
@@ -276,6 +289,7 @@ class ListTermPage(TableApp):
             self.label_title,
             self.btn_goto_glossary_main,
             self.btns_manage,
+            self.input_search,
             self.table,
             self.btns_paginate,
         )
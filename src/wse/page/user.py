@@ -1,10 +1,14 @@
-"""The page handlers of user data."""
+"""The page handlers of user data.
 
+The http client is imported on first request, so the main page is
+shown without importing it.
+"""
+
+import typing
 from http import HTTPStatus
 from urllib.parse import urljoin
 
 import toga
-from httpx import Response
 
 from wse.constants import (
     BTN_GOTO_LOGIN,
@@ -20,14 +24,12 @@ from wse.constants import (
     USER_ME_PATH,
 )
 from wse.container.credentials import Credentials
-from wse.contrib.http_requests import (
-    app_auth,
-    request_get,
-    request_post,
-)
 from wse.general.box_page import BoxApp
 from wse.general.button import BtnApp
 
+if typing.TYPE_CHECKING:
+    from httpx import Response
+
 
 class UserAuth(BoxApp):
     """Handlers to control the user authentication status.
@@ -56,10 +58,14 @@ class UserAuth(BoxApp):
             on_press=self.auth_attrs['btn_auth']['on_press'],
         )
 
-    def on_open(self) -> None:
-        """Update the widgets on opening page."""
-        super().on_open()
-        self.setup_user_status()
+    async def on_open(self) -> None:
+        """Update the widgets on opening page.
+
+        The widgets are shown by the current user status, then updated
+        when the user data arrives.
+        """
+        self.update_widget_values()
+        await self.setup_user_status()
         self.update_widget_values()
 
     ####################################################################
@@ -88,12 +94,15 @@ class UserAuth(BoxApp):
 
     async def logout_handler(self, _: toga.Widget) -> None:
         """Send the http request to user logout, button handler."""
+        from wse.contrib.http_requests import app_auth, request_post_async
+
         url = urljoin(HOST_API, LOGOUT_PATH)
-        response = request_post(url=url)
+        response = await request_post_async(url)
         if response.status_code == HTTPStatus.NO_CONTENT:
             self.is_auth = False
             self.update_widget_values()
             app_auth.delete_token()
+            self.app.forget_dictionary()
             await self.show_message('', LOGOUT_MSG)
 
     def update_widget_values(self) -> None:
@@ -104,9 +113,11 @@ class UserAuth(BoxApp):
         self.btn_goto_auth.text = self.auth_attrs['btn_auth']['text']
         self.btn_goto_auth.on_press = self.auth_attrs['btn_auth']['on_press']
 
-    def setup_user_status(self) -> None:
+    async def setup_user_status(self) -> None:
         """Request and set user data for information."""
-        user_data = request_get(self.user_detail_url)
+        from wse.contrib.http_requests import request_get_async
+
+        user_data = await request_get_async(self.user_detail_url)
         # Update user data.
         if user_data.status_code == HTTPStatus.OK:
             self.username = user_data.json()['username']
@@ -125,9 +136,13 @@ class LoginBox(Credentials):
     success_response_msg = LOGIN_MSG
     error_response_msg = LOGIN_BAD_MSG
 
-    async def send_request(self, url: str, payload: dict) -> Response:
+    async def send_request(self, url: str, payload: dict) -> 'Response':
         """Request login without token, save token."""
-        response = request_post(url, payload, token=False)
+        from wse.contrib.http_requests import app_auth, request_post_async
+
+        response = await request_post_async(url, payload, token=False)
         if response.status_code == HTTPStatus.OK:
             app_auth.set_token(response)
+            # The other user may be logged in before.
+            self.app.forget_dictionary()
         return response
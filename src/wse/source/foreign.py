@@ -1,10 +1,21 @@
 """Foreign data source implementation."""
 
+from collections.abc import Iterable
+
 from toga.sources import Source
 
+from wse.source.schema import Field, RowSchema, identifier
+
 
 class Word:
-    """A class to wrap individual word."""
+    """A class to wrap individual word.
+
+    The word has no instance ``__dict__`` to keep the large vocabulary
+    compact in memory. The weak reference lets the virtual source fill
+    the word held by the table.
+    """
+
+    __slots__ = ('id', 'foreign_word', 'native_word', '__weakref__')
 
     def __init__(self, id: int, foreign_word: str, native_word: str) -> None:
         """Construct the word wrap."""
@@ -14,12 +25,33 @@ class Word:
 
 
 class WordSource(Source):
-    """Word entries source."""
+    """Word entries source.
+
+    Keeps the index of word position by word id to look up, update and
+    remove the word without the list scan.
+
+    :ivar malformed_count: Count of the malformed items skipped on the
+        last load of items.
+    :vartype malformed_count: int
+    """
+
+    row_class = Word
+    """The class of source row (`type`).
+    """
+    schema = RowSchema(
+        Word,
+        [Field('id', identifier), Field('foreign_word'), Field('native_word')],
+    )
+    """The schema to map the response items to rows (`RowSchema`).
+    """
 
     def __init__(self, words: list[tuple[str, ...]] = None) -> None:
         """Construct the source."""
         super().__init__()
         self._words = words or []
+        self._positions = {}
+        self._reindex()
+        self.malformed_count = 0
         self.accessors = ['foreign_word', 'native_word']
 
     def __len__(self) -> int:
@@ -30,9 +62,14 @@ class WordSource(Source):
         """Get entry value."""
         return self._words[index]
 
-    def index(self, entry: str) -> int:
+    def index(self, entry: Word) -> int:
         """Get entry index."""
-        return self._words.index(entry)
+        return self._positions[entry.id]
+
+    def get_by_id(self, item_id: str) -> Word | None:
+        """Get the word by id, or ``None`` if there is no the word."""
+        position = self._positions.get(item_id)
+        return None if position is None else self._words[position]
 
     def add_entry(self, entry: tuple[str, ...]) -> None:
         """Add entry to terms.
@@ -42,22 +79,78 @@ class WordSource(Source):
         term = Word(*entry)
         self.add_term(term)
 
+    def load(self, entries: Iterable[tuple[str, ...]]) -> None:
+        """Replace all words with entries.
+
+        Listeners get one ``clear`` and one ``refresh`` notification
+        instead of ``insert`` notification per entry.
+        """
+        self._replace([Word(*entry) for entry in entries])
+
+    def load_items(self, items: Iterable[dict]) -> None:
+        """Replace all words with the items of response payload.
+
+        The words are built from the items by the source schema, the
+        malformed items are skipped and counted.
+        """
+        mapped = self.schema.map(items)
+        self.malformed_count = mapped.malformed
+        self._replace(mapped.rows)
+
     def add_term(self, term: Word) -> None:
         """Add term to terms.
 
         Add <wse.sources.glossary.Term X ...> to self._terms (`list`).
         """
         self._words.append(term)
-        self.notify('insert', index=self._words.index(term), item=term)
+        self._positions[term.id] = len(self._words) - 1
+        self.notify('insert', index=len(self._words) - 1, item=term)
+
+    def update_entry(self, entry: tuple[str, ...]) -> Word | None:
+        """Update the word with entry of the same id in place.
 
-    def remove(self, item: str) -> None:
+        :return: The updated word, or ``None`` if there is no the word.
+        """
+        word = self.get_by_id(entry[0])
+        if word is not None:
+            _, word.foreign_word, word.native_word = entry
+            self.notify('change', item=word)
+        return word
+
+    def remove(self, item: Word) -> None:
         """Remove entry from entries."""
         index = self.index(item)
         self.notify('pre_remove', index=index, item=item)
         del self._words[index]
+        del self._positions[item.id]
+        self._reindex(start=index)
         self.notify('remove', index=index, item=item)
 
+    def remove_by_id(self, item_id: str) -> Word | None:
+        """Remove the word by id.
+
+        :return: The removed word, or ``None`` if there is no the word.
+        """
+        word = self.get_by_id(item_id)
+        if word is not None:
+            self.remove(word)
+        return word
+
     def clear(self) -> None:
         """Delete all entries."""
         self._words = []
+        self._positions = {}
+        self.notify('clear')
+
+    def _reindex(self, start: int = 0) -> None:
+        # Index the positions of words from start position.
+        for position in range(start, len(self._words)):
+            self._positions[self._words[position].id] = position
+
+    def _replace(self, words: list[Word]) -> None:
+        # Replace all words, notify the listeners to reload rows.
+        self._words = words
+        self._positions = {}
+        self._reindex()
         self.notify('clear')
+        self.notify('refresh')
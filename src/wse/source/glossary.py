@@ -1,28 +1,60 @@
 """Glossary data source implementation."""
 
+from collections.abc import Iterable
+
 from toga.sources import Source
 
+from wse.source.schema import Field, RowSchema, identifier
+
 
 class Term:
-    """A class to wrap individual term."""
+    """A class to wrap individual term.
+
+    The term has no instance ``__dict__`` to keep the large glossary
+    compact in memory. The weak reference lets the virtual source fill
+    the term held by the table.
+    """
+
+    __slots__ = ('id', 'term', 'definition', '__weakref__')
 
     def __init__(
         self,
+        id: str,
         term: str,
         definition: str,
     ) -> None:
         """Construct the term wrap."""
+        self.id = id
         self.term = term
         self.definition = definition
 
 
 class TermSource(Source):
-    """Glossary term entries source."""
+    """Glossary term entries source.
+
+    Keeps the index of term position by term id to look up, update and
+    remove the term without the list scan.
+
+    :ivar malformed_count: Count of the malformed items skipped on the
+        last load of items.
+    :vartype malformed_count: int
+    """
+
+    row_class = Term
+    """The class of source row (`type`).
+    """
+    schema = RowSchema(
+        Term, [Field('id', identifier), Field('term'), Field('definition')]
+    )
+    """The schema to map the response items to rows (`RowSchema`).
+    """
 
     def __init__(self) -> None:
         """Construct the source."""
         super().__init__()
         self._terms = []
+        self._positions = {}
+        self.malformed_count = 0
         self.accessors = [
             'term',
             'definition',
@@ -35,7 +67,8 @@ class TermSource(Source):
     def __setitem__(self, index: int, term: Term) -> None:
         """Set term to terms by index."""
         self._terms.insert(index, term)
-        self.notify('insert', index=self._terms.index(term), item=term)
+        self._reindex(start=index)
+        self.notify('insert', index=index, item=term)
 
     def __getitem__(self, index: int) -> str:
         """Get entry value."""
@@ -43,13 +76,18 @@ class TermSource(Source):
 
     def update(self, old_entry: Term, new_entry: Term) -> None:
         """Update the data source list."""
-        index = self._terms.index(old_entry)
+        index = self.index(old_entry)
         self.remove(old_entry)
         self.__setitem__(index, new_entry)
 
     def index(self, entry: Term) -> int:
         """Get entry index."""
-        return self._terms.index(entry)
+        return self._positions[entry.id]
+
+    def get_by_id(self, item_id: str) -> Term | None:
+        """Get the term by id, or ``None`` if there is no the term."""
+        position = self._positions.get(item_id)
+        return None if position is None else self._terms[position]
 
     def add_entry(self, entry: tuple[str, ...]) -> None:
         """Add entry to terms.
@@ -59,22 +97,78 @@ class TermSource(Source):
         term = Term(*entry)
         self.add_term(term)
 
+    def load(self, entries: Iterable[tuple[str, ...]]) -> None:
+        """Replace all terms with entries.
+
+        Listeners get one ``clear`` and one ``refresh`` notification
+        instead of ``insert`` notification per entry.
+        """
+        self._replace([Term(*entry) for entry in entries])
+
+    def load_items(self, items: Iterable[dict]) -> None:
+        """Replace all terms with the items of response payload.
+
+        The terms are built from the items by the source schema, the
+        malformed items are skipped and counted.
+        """
+        mapped = self.schema.map(items)
+        self.malformed_count = mapped.malformed
+        self._replace(mapped.rows)
+
     def add_term(self, term: Term) -> None:
         """Add term to terms.
 
         Add <wse.sources.glossary.Term X ...> to self._terms (`list`).
         """
         self._terms.append(term)
-        self.notify('insert', index=self._terms.index(term), item=term)
+        self._positions[term.id] = len(self._terms) - 1
+        self.notify('insert', index=len(self._terms) - 1, item=term)
+
+    def update_entry(self, entry: tuple[str, ...]) -> Term | None:
+        """Update the term with entry of the same id in place.
+
+        :return: The updated term, or ``None`` if there is no the term.
+        """
+        term = self.get_by_id(entry[0])
+        if term is not None:
+            _, term.term, term.definition = entry
+            self.notify('change', item=term)
+        return term
 
     def remove(self, item: Term) -> None:
         """Remove entry from entries."""
         index = self.index(item)
         self.notify('pre_remove', index=index, item=item)
         del self._terms[index]
+        del self._positions[item.id]
+        self._reindex(start=index)
         self.notify('remove', index=index, item=item)
 
+    def remove_by_id(self, item_id: str) -> Term | None:
+        """Remove the term by id.
+
+        :return: The removed term, or ``None`` if there is no the term.
+        """
+        term = self.get_by_id(item_id)
+        if term is not None:
+            self.remove(term)
+        return term
+
     def clear(self) -> None:
         """Delete all entries."""
         self._terms = []
+        self._positions = {}
+        self.notify('clear')
+
+    def _reindex(self, start: int = 0) -> None:
+        # Index the positions of terms from start position.
+        for position in range(start, len(self._terms)):
+            self._positions[self._terms[position].id] = position
+
+    def _replace(self, terms: list[Term]) -> None:
+        # Replace all terms, notify the listeners to reload rows.
+        self._terms = terms
+        self._positions = {}
+        self._reindex()
         self.notify('clear')
+        self.notify('refresh')
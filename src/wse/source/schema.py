@@ -0,0 +1,109 @@
+"""Mapping of the response items to the source rows."""
+
+import typing
+from collections.abc import Callable, Iterable
+
+
+def identifier(value: object) -> str:
+    """Convert the item id to the row id.
+
+    The row id is the string, as in the detail urls of entries.
+
+    :raises TypeError: If the value is not the integer or string.
+    """
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        raise TypeError(f'invalid id: {value!r}')
+    return str(value)
+
+
+def text(value: object) -> str:
+    """Convert the item text to the row text, ``None`` to empty text.
+
+    :raises TypeError: If the value is not the string.
+    """
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        raise TypeError(f'invalid text: {value!r}')
+    return value
+
+
+class Field(typing.NamedTuple):
+    """Field of the source row.
+
+    :ivar name: The row attribute name.
+    :vartype name: str
+    :ivar convert: The function to convert the item value.
+    :vartype convert: Callable[[object], object]
+    :ivar key: The item key, the row attribute name if ``None``.
+    :vartype key: str or None
+    """
+
+    name: str
+    convert: Callable[[object], object] = text
+    key: str | None = None
+
+
+class MappedRows(typing.NamedTuple):
+    """Result of the item mapping.
+
+    :ivar rows: The rows of well-formed items.
+    :vartype rows: list
+    :ivar malformed: Count of the skipped malformed items.
+    :vartype malformed: int
+    """
+
+    rows: list
+    malformed: int
+
+
+class RowSchema:
+    """Schema of the source row, maps the response items to rows.
+
+    The item values are got by the declared keys, not by the order of
+    item keys. The schema is compiled once to the functions that build
+    the row or the row values with one expression, without the loop
+    over fields and the intermediate entries.
+
+    The item without the declared key, or with the value of invalid
+    type, is malformed.
+
+    :param type row_class: The class of row, takes the field values
+        in order of fields.
+    :param fields: The fields of row.
+    :type fields: Iterable[Field]
+    """
+
+    def __init__(self, row_class: type, fields: Iterable[Field]) -> None:
+        """Construct the schema."""
+        self.row_class = row_class
+        self.fields = tuple(fields)
+        self.row = self._compile('row_class({})')
+        self.values = self._compile('({},)')
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Row attribute names (`tuple[str, ...]`, reade-only)."""
+        return tuple(field.name for field in self.fields)
+
+    def map(self, items: Iterable[dict]) -> MappedRows:
+        """Map the items to rows, skip and count the malformed items."""
+        rows, malformed = [], 0
+        row = self.row
+        for item in items:
+            try:
+                rows.append(row(item))
+            except (KeyError, TypeError, ValueError):
+                malformed += 1
+        return MappedRows(rows, malformed)
+
+    def _compile(self, template: str) -> Callable[[dict], object]:
+        # Build the function of single expression by the template.
+        namespace = {'row_class': self.row_class}
+        arguments = []
+        for number, field in enumerate(self.fields):
+            namespace[f'convert_{number}'] = field.convert
+            key = field.key or field.name
+            arguments.append(f'convert_{number}(item[{key!r}])')
+        expression = template.format(', '.join(arguments))
+        return eval(f'lambda item: {expression}', namespace)
@@ -0,0 +1,297 @@
+"""Virtual data source of all entries of the collection."""
+
+import asyncio
+import functools
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from http import HTTPStatus
+from urllib.parse import urlencode
+
+import httpx
+from toga.sources import Source
+
+from wse.constants import (
+    COUNT,
+    HTTP_MAX_CONNECTIONS,
+    RESULTS,
+    TABLE_CHUNK_CACHE_SIZE,
+    TABLE_CHUNK_SIZE,
+)
+from wse.contrib.http_requests import request_get_async
+from wse.contrib.payload import decode
+from wse.source.schema import RowSchema
+
+
+class VirtualSource(Source):
+    """Source of all entries of the collection, requested by chunks.
+
+    The length of the source is the count of entries on server. The
+    rows are requested by chunks of ``limit``/``offset`` pagination on
+    first access, the rows are blank until the chunk is received. The
+    received chunks are kept in the LRU cache of limited size, the
+    dropped chunk is requested again on next access.
+
+    The row objects are kept apart from the chunk cache by weak
+    references, so the row dropped with its chunk but held by the table
+    backend is the same row on next access. The request of the dropped
+    chunk is cancelled only if none of its rows is held, otherwise the
+    held rows are filled when the chunk is received, and the chunk of
+    the filled held rows is not requested again.
+
+    The GTK and Android backends of toga read every row when the
+    source is set, so all chunks are requested. The count of chunk
+    requests at once is limited to the http connections of pool, the
+    failed request leaves the rows blank until next access.
+
+    The rows are filled in place when the chunk is received, listeners
+    get one ``refresh`` notification per chunk. The malformed item
+    keeps the blank row. The index and id of row are looked up in the
+    weak maps without the scan of rows.
+
+    :param schema: The schema to map the response items to rows.
+    :type schema: RowSchema
+    :param str url: Url of the entries collection.
+    :param list accessors: The row attribute names to show.
+    :param int chunk_size: Count of entries per chunk.
+    :param int max_chunks: Maximum count of the cached chunks.
+    :param int max_fetches: Maximum count of the chunk requests at once.
+    :ivar malformed_count: Count of the malformed received items.
+    :vartype malformed_count: int
+    """
+
+    def __init__(
+        self,
+        schema: RowSchema,
+        url: str,
+        accessors: list[str],
+        chunk_size: int = TABLE_CHUNK_SIZE,
+        max_chunks: int = TABLE_CHUNK_CACHE_SIZE,
+        max_fetches: int = HTTP_MAX_CONNECTIONS,
+    ) -> None:
+        """Construct the source."""
+        super().__init__()
+        self.schema = schema
+        self.row_class = schema.row_class
+        self.url = url
+        self.accessors = accessors
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.request_count = 0
+        self.malformed_count = 0
+        self._count = 0
+        self._chunks: OrderedDict[int, list] = OrderedDict()
+        self._rows: weakref.WeakValueDictionary[int, object] = (
+            weakref.WeakValueDictionary()
+        )
+        self._indexes: weakref.WeakKeyDictionary[object, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._ids: weakref.WeakValueDictionary[str, object] = (
+            weakref.WeakValueDictionary()
+        )
+        # The chunks received while their rows are held.
+        self._received: set[int] = set()
+        self._fetching: dict[int, asyncio.Future] = {}
+        self._fetch_slots = asyncio.Semaphore(max_fetches)
+
+    def __len__(self) -> int:
+        """Get count of entries on server."""
+        return self._count
+
+    def __getitem__(self, index: int) -> object:
+        """Get the row, request the chunk of row if not cached."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('source index out of range')
+        number, offset = divmod(index, self.chunk_size)
+        return self._get_chunk(number)[offset]
+
+    @property
+    def chunk_count(self) -> int:
+        """Count of the cached chunks (`int`, reade-only)."""
+        return len(self._chunks)
+
+    def chunk_url(self, number: int) -> str:
+        """Get url of the chunk of entries."""
+        query = {'limit': self.chunk_size, 'offset': number * self.chunk_size}
+        return f'{self.url}?{urlencode(query)}'
+
+    async def load(self) -> None:
+        """Request the count of entries and the first chunk.
+
+        The cached chunks are dropped, listeners get one ``clear`` and
+        one ``refresh`` notification.
+        """
+        payload = await self.request_chunk(0)
+        if payload is None:
+            return
+
+        self._drop_chunks()
+        self._count = payload[COUNT]
+        if self._count:
+            self._fill_chunk(self._put_chunk(0), payload, notify=False)
+            self._received.add(0)
+        self.notify('clear')
+        self.notify('refresh')
+
+    async def request_chunk(self, number: int) -> dict | None:
+        """Request the chunk of entries.
+
+        :return: The pagination page, or ``None`` if request is failed.
+        """
+        self.request_count += 1
+        try:
+            response = await request_get_async(self.chunk_url(number))
+        except httpx.HTTPError:
+            return None
+        if response.status_code != HTTPStatus.OK:
+            return None
+        return decode(response)
+
+    def index(self, item: object) -> int:
+        """Get index of the row.
+
+        :raises ValueError: If the row is not in source.
+        """
+        try:
+            return self._indexes[item]
+        except (KeyError, TypeError):
+            raise ValueError('row is not in source') from None
+
+    def get_by_id(self, item_id: str) -> object | None:
+        """Get the row by id, or ``None`` if there is no row."""
+        return self._ids.get(item_id)
+
+    def update_entry(self, entry: tuple[str, ...]) -> object | None:
+        """Update the cached row with entry of the same id in place.
+
+        :return: The updated row, or ``None`` if there is no the row.
+        """
+        row = self.get_by_id(entry[0])
+        if row is not None:
+            self._fill_row(row, entry)
+            self.notify('change', item=row)
+        return row
+
+    def remove_by_id(self, item_id: str) -> object | None:
+        """Remove the row by id, request the entries again.
+
+        The positions of all next rows are shifted on server, so the
+        source is loaded again.
+
+        :return: The removed row, or ``None`` if there is no the row.
+        """
+        row = self.get_by_id(item_id)
+        if row is not None:
+            asyncio.ensure_future(self.load())
+        return row
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        self._drop_chunks()
+        self._count = 0
+        self.notify('clear')
+
+    ####################################################################
+    # Chunk cache
+
+    def _get_chunk(self, number: int) -> list:
+        chunk = self._chunks.get(number)
+        if chunk is None:
+            is_held = all(self._held_rows(number))
+            chunk = self._put_chunk(number)
+            # The held rows of dropped chunk may be still requested or
+            # already filled.
+            is_filled = is_held and number in self._received
+            if number not in self._fetching and not is_filled:
+                self._fetch_chunk(number)
+        else:
+            self._chunks.move_to_end(number)
+        return chunk
+
+    def _put_chunk(self, number: int) -> list:
+        # Add the chunk of rows, the held rows are reused, the others
+        # are blank. Drop the least recently used chunk.
+        chunk = [self._row(index) for index in self._chunk_range(number)]
+        self._chunks[number] = chunk
+        while len(self._chunks) > self.max_chunks:
+            dropped = self._chunks.popitem(last=False)[0]
+            if all(row is None for row in self._held_rows(dropped)):
+                self._cancel_fetch(dropped)
+        return chunk
+
+    def _row(self, index: int) -> object:
+        row = self._rows.get(index)
+        if row is None:
+            row = self.row_class(*[None] * len(self.schema.fields))
+            self._rows[index] = row
+            self._indexes[row] = index
+        return row
+
+    def _chunk_range(self, number: int) -> range:
+        start = number * self.chunk_size
+        return range(start, min(start + self.chunk_size, self._count))
+
+    def _held_rows(self, number: int) -> list:
+        # The rows of chunk that are still referenced, or ``None``.
+        return [self._rows.get(index) for index in self._chunk_range(number)]
+
+    def _fetch_chunk(self, number: int) -> None:
+        task = asyncio.ensure_future(self._receive_chunk(number))
+        self._fetching[number] = task
+        task.add_done_callback(functools.partial(self._fetch_done, number))
+
+    def _fetch_done(self, number: int, task: asyncio.Future) -> None:
+        # The cancelled request may be done after the next request of
+        # the same chunk is started.
+        if self._fetching.get(number) is task:
+            del self._fetching[number]
+
+    def _cancel_fetch(self, number: int) -> None:
+        task = self._fetching.pop(number, None)
+        if task is not None:
+            task.cancel()
+
+    async def _receive_chunk(self, number: int) -> None:
+        async with self._fetch_slots:
+            payload = await self.request_chunk(number)
+        if payload is None:
+            # Request the chunk again on next access.
+            self._chunks.pop(number, None)
+            return
+        # The chunk may be dropped, its held rows are filled.
+        chunk = self._chunks.get(number) or self._held_rows(number)
+        self._received.add(number)
+        self._fill_chunk(chunk, payload)
+
+    def _fill_chunk(
+        self, chunk: list, payload: dict, notify: bool = True
+    ) -> None:
+        for row, item in zip(chunk, payload[RESULTS]):
+            if row is None:
+                continue
+            try:
+                values = self.schema.values(item)
+            except (KeyError, TypeError, ValueError):
+                self.malformed_count += 1
+                continue
+            self._fill_row(row, values)
+        if notify:
+            self.notify('refresh')
+
+    def _fill_row(self, row: object, entry: Iterable[str]) -> None:
+        for name, value in zip(self.schema.names, entry):
+            setattr(row, name, value)
+        if row.id is not None:
+            self._ids[row.id] = row
+
+    def _drop_chunks(self) -> None:
+        for number in list(self._fetching):
+            self._cancel_fetch(number)
+        self._chunks.clear()
+        self._rows.clear()
+        self._indexes.clear()
+        self._ids.clear()
+        self._received.clear()